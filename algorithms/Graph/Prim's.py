@@ -1,13 +1,24 @@
 from collections import deque
 from Edge import Edge
 from Vertex import Vertex
-import heapq
+from query_state import QueryState
+from indexed_heap import IndexedMinHeap
+from graph_adjacency_matrix import dense_prim
+import numpy as np
 
 class Graph:
+    # prim() switches to the dense O(V^2) version above this fraction of the V^2 possible edges
+    DENSE_DENSITY = 0.25
+
     def __init__(self, N: int) -> None: 
+        self.state = QueryState(N)
+        self.state.integer_distances = True
+        self.num_edges = 0
+
         self.vertices = [None] * N  
         for i in range(N):
-            self.vertices[i] = Vertex(i) 
+            self.vertices[i] = Vertex(i, self.state) 
+        self.state.vertices = self.vertices
 
     def add_edge(self, u_id: int, v_id: int, w: int) -> None:
         u = self.vertices[u_id]
@@ -15,24 +26,39 @@ class Graph:
         
         edge = Edge(u, v, w)
         u.add_edge(edge)
+        self.num_edges += 1
+        if not isinstance(w, int):
+            self.state.integer_distances = False
 
-    def prim(self, source: int):
+    def prim(self, source: int, mode: str = "auto"):
         """
         Description:
             To generate a Minimum Spanning Tree (MST) from a graph.
             With slight changes (use MaxHeap; Invert every edge to negative), can generate a Maximum Spanning Tree.
 
+            mode:
+                "heap"  -> eager Prim over the adjacency list with an indexed heap
+                "dense" -> graph_adjacency_matrix.dense_prim over a V x V weight matrix
+                "auto"  -> "dense" when E >= DENSE_DENSITY * V^2, where E log V outgrows V^2
+
         Time Complexity:
-            - O(E logV) using adjacency list
+            - O(E log_d V) using adjacency list and an indexed d-ary heap (at most one entry per vertex)
             - O(V^2) using adjacency matrix
         """
-        # first reset the distance of each vertex to inf and the previous of each vertex to None 
+        N = len(self.vertices)
+        if mode == "auto":
+            mode = "dense" if self.num_edges >= self.DENSE_DENSITY * N * N else "heap"
+        if mode == "dense":
+            return self.dense_prim(source)
+        if mode != "heap":
+            raise ValueError(f"Unknown prim mode: {mode}")
+
+        # start a new query, every vertex now reads as distance inf and previous None
         self.reset()
+        state = self.state
 
-        # get the starting vertex
-        start_vertex = self.vertices[source]
-        # set its distance to 0
-        start_vertex.distance = 0
+        # set the distance of the starting vertex to 0
+        state.set_distance(source, 0)
 
         # # to calculate how many edges we have processed
         num_edges = 0
@@ -44,22 +70,17 @@ class Graph:
         # and add all its neighbor vertices to the list 
         # repeat this until the list is empty
         # Priority queue to select the minimum edge weight vertex each time
-        # Format of each entry: (distance, vertex)
-        discovered = []
-        heapq.heappush(discovered, (0, start_vertex))
+        # keyed by vertex id, the key is the lightest known edge from the tree to that vertex
+        discovered = IndexedMinHeap(len(self.vertices))
+        discovered.push(source, 0)
 
         # starting repeat
-        while discovered:
-            # pop out one vertex
-            current_vertex_distance, current_vertex = heapq.heappop(discovered)
+        while not discovered.is_empty():
+            # pop out one vertex, each vertex is in the heap at most once
+            u, current_vertex_distance = discovered.pop()
 
-            # if it is visited, we pop out another vertex
-            # visited means we have already gone thru all its neighbor vertices
-            if current_vertex.visited:
-                continue
-
-            # if not visited, mark it as visited
-            current_vertex.visited = True
+            # mark it as visited, it is now part of the tree
+            state.set_visited(u)
             num_edges += 1  # 每次成功加入新的顶点时增加计数
             total_weight += current_vertex_distance
 
@@ -68,28 +89,53 @@ class Graph:
                 break
 
             # go thru all its edges (its neighbor vertex is just edge.v)
-            for edge in current_vertex.edges:
+            for edge in self.vertices[u].edges:
                 # get the neighbor vertex
                 # one edge with one neighbor
-                neighbor = edge.v
-
-                # if neighbor's distance is longer, we update its distance and previous
-                # it means from the current vertex we can go to its neighbor with a shorter distance
-                if neighbor.distance > current_vertex.distance + edge.w:
-                    neighbor.distance = edge.w
-                    neighbor.previous = current_vertex
-                    # push the updated neighbor with new distance to the priority queue
-                    heapq.heappush(discovered, (neighbor.distance, neighbor))
-                    
+                v = edge.v.id
+
+                # if this edge is a lighter way to connect the neighbor to the tree, we update its distance and previous
+                if not state.is_visited(v) and edge.w < state.get_distance(v):
+                    state.relax(v, edge.w, u)
+                    # push the neighbor, or lower its key in place if it is already in the priority queue
+                    discovered.push_or_decrease(v, edge.w)
+
         
-        return total_weight
+        return self._total(total_weight)
 
 
-    def reset(self):
+    def dense_prim(self, source: int):
+        """
+        Prim on a dense weight matrix built from the edges (the lightest edge u -> v wins),
+        fills the same state as the heap version.
+
+        Time Complexity:
+            - O(V^2) time and memory
+        """
+        N = len(self.vertices)
+        matrix = np.full((N, N), np.inf)
         for vertex in self.vertices:
-            vertex.distance = float('inf')
-            vertex.previous = None
-            vertex.visited = False
+            for edge in vertex.edges:
+                if edge.w < matrix[vertex.id, edge.v.id]:
+                    matrix[vertex.id, edge.v.id] = edge.w
+
+        total_weight, parent, key = dense_prim(matrix, source)
+
+        self.reset()
+        state = self.state
+        for v in range(N):
+            if key[v] != np.inf:
+                state.relax(v, key[v].item(), int(parent[v]))
+                state.set_visited(v)
+        return self._total(total_weight)
+
+    def _total(self, total_weight: float):
+        # the heap keys and the dense matrix are floats, integer weights give an int total like before
+        return int(total_weight) if self.state.integer_distances else total_weight
+
+    def reset(self):
+        # O(1), see QueryState
+        self.state.new_query()
 
 # 测试函数
 def test_prim():
@@ -116,6 +162,8 @@ def test_prim():
     # 检查最小生成树的总权重是否正确
     expected_weight = 37
     assert mst_weight == expected_weight, f"Expected weight: {expected_weight}, but got: {mst_weight}"
+    # the dense O(V^2) version gives the same tree weight
+    assert graph.prim(0, "dense") == expected_weight
     print("Test passed! Minimum Spanning Tree weight is correct.")
 
 # 运行测试
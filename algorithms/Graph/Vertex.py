@@ -1,19 +1,103 @@
 class Vertex:
-    def __init__(self, id):
+    """
+    A vertex either owns its traversal attributes (distance, predecessor, visited, in_degree),
+    or, when created with a QueryState, is a view onto that state's side arrays.
+    The attribute API is the same in both cases; the side arrays store floats, so while the graph's
+    weights are all ints (state.integer_distances) distance is converted back to an int.
+    In the state-backed case, previous and predecessor are the same slot.
+    """
+    def __init__(self, id, state=None):
         self.id = id
         self.edges = []
-        self.visited = False
         self.discovered = False
-        self.distance = float('inf')
-        self.predecessor = None
+        self.state = state
+
+        if state is None:
+            self._visited = False
+            self._distance = float('inf')
+            self._predecessor = None
+            self._previous = None
+
+            # for kahn's
+            self._in_degree = 0
 
-        # for kahn's
-        self.in_degree = 0
-    
     def add_edge(self, edge):
         self.edges.append(edge)
 
+    def _vertex_of(self, vertex_id):
+        if vertex_id == -1:
+            return None
+        return self.state.vertices[vertex_id]
+
+    @property
+    def visited(self):
+        if self.state is None:
+            return self._visited
+        return self.state.is_visited(self.id)
+
+    @visited.setter
+    def visited(self, value):
+        if self.state is None:
+            self._visited = value
+        else:
+            self.state.set_visited(self.id, value)
+
+    @property
+    def distance(self):
+        if self.state is None:
+            return self._distance
+        # the side array holds floats, integer weights read back as ints like a plain attribute would
+        distance = self.state.get_distance(self.id)
+        if self.state.integer_distances and distance != float('inf'):
+            return int(distance)
+        return distance
+
+    @distance.setter
+    def distance(self, value):
+        if self.state is None:
+            self._distance = value
+        else:
+            self.state.set_distance(self.id, value)
+
+    @property
+    def predecessor(self):
+        if self.state is None:
+            return self._predecessor
+        return self._vertex_of(self.state.get_predecessor(self.id))
+
+    @predecessor.setter
+    def predecessor(self, vertex):
+        if self.state is None:
+            self._predecessor = vertex
+        else:
+            self.state.set_predecessor(self.id, -1 if vertex is None else vertex.id)
+
+    @property
+    def previous(self):
+        if self.state is None:
+            return self._previous
+        return self.predecessor
+
+    @previous.setter
+    def previous(self, vertex):
+        if self.state is None:
+            self._previous = vertex
+        else:
+            self.predecessor = vertex
+
+    @property
+    def in_degree(self):
+        if self.state is None:
+            return self._in_degree
+        return self.state.get_in_degree(self.id)
+
+    @in_degree.setter
+    def in_degree(self, value):
+        if self.state is None:
+            self._in_degree = value
+        else:
+            self.state.set_in_degree(self.id, value)
+
     def __str__(self):
         return f"Vertex {self.id}"
-        
-        
\ No newline at end of file
+
@@ -1,8 +1,19 @@
+from collections import deque
 from Edge import Edge
 from Vertex import Vertex
 from typing import List
 
 
+class NegativeCycleError(ValueError):
+    """
+    Raised when the graph has a negative-weight cycle reachable from the source.
+    cycle is the list of vertices (or vertex indices) on it, in edge order (cycle[i] -> cycle[i+1] -> ... -> cycle[0]).
+    """
+    def __init__(self, cycle: list) -> None:
+        super().__init__("Graph contains a negative-weight cycle: " + " -> ".join(str(getattr(v, "id", v)) for v in cycle))
+        self.cycle = cycle
+
+
 def BellmanFord(vertices: List[Vertex], edges: List[Edge], source: Vertex):
     """
     Bellman-Ford algorithm for finding the shortest path from a source vertex to all other vertices in a graph with negative edge.
@@ -47,13 +58,108 @@ def BellmanFord(vertices: List[Vertex], edges: List[Edge], source: Vertex):
 
         # If no update happened in this round, we can terminate early
         if not updated:
-            print(f"Terminated early after {i + 1} iterations")
             break
 
     # Check for negative-weight cycles
     # Complexity: O(E)
     for edge in edges:
         if edge.u.distance + edge.w < edge.v.distance:
-            raise ValueError("Graph contains a negative-weight cycle")
+            # one more relaxation, then edge.v's predecessor chain leads into the cycle
+            edge.v.previous = edge.u
+            cycle = _cycle_through_predecessors(edge.v, len(vertices), lambda v: v.previous)
+            raise NegativeCycleError(cycle or [])
+
+
+def BellmanFordQueue(vertices: List[Vertex], edges: List[Edge], source: Vertex) -> int:
+    """
+    Queue-based Bellman-Ford (a.k.a. SPFA): only edges out of vertices whose distance just changed are relaxed.
+    Same results as BellmanFord (vertex.distance and vertex.previous), much less work when updates stay local.
+
+    :param vertices: List of vertices in the graph
+    :param edges: List of edges in the graph
+    :param source: Source vertex
+    :return: number of successful relaxations
+    :raise NegativeCycleError: with the vertices of a negative cycle reachable from source
+
+    Negative cycle check:
+        Each vertex remembers how many edges its current path has. A shortest path has at most V-1 edges,
+        so a path with V edges must repeat a vertex, and following the predecessors from there finds the cycle.
+
+    Time Complexity:
+        - O(V*E) worst case, like BellmanFord
+        - close to O(E) in practice when few distances change
+
+    Aux Space Complexity:
+        - O(V+E) for the outgoing edge lists, the queue, and the path lengths
+    """
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+    n = len(vertices)
+
+    # outgoing edges of each vertex, as (target index, weight)
+    out_edges = [[] for _ in range(n)]
+    for edge in edges:
+        out_edges[index[edge.u]].append((index[edge.v], edge.w))
+
+    distance = [float('inf')] * n
+    previous = [-1] * n
+    path_length = [0] * n      # number of edges on the current path to each vertex
+    in_queue = bytearray(n)
+
+    s = index[source]
+    distance[s] = 0
+    queue = deque([s])
+    in_queue[s] = 1
+    relaxations = 0
+
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = 0
+        distance_u = distance[u]
+
+        for v, w in out_edges[u]:
+            if distance_u + w < distance[v]:
+                distance[v] = distance_u + w
+                previous[v] = u
+                path_length[v] = path_length[u] + 1
+                relaxations += 1
+
+                if path_length[v] >= n:
+                    cycle = _cycle_through_predecessors(v, n, lambda x: previous[x] if previous[x] != -1 else None)
+                    if cycle is not None:
+                        raise NegativeCycleError([vertices[x] for x in cycle])
+
+                if not in_queue[v]:
+                    in_queue[v] = 1
+                    queue.append(v)
+
+    for i, vertex in enumerate(vertices):
+        vertex.distance = distance[i]
+        vertex.previous = vertices[previous[i]] if previous[i] != -1 else None
+
+    return relaxations
+
+
+def _cycle_through_predecessors(start, n: int, predecessor_of):
+    """
+    Walk back from start along predecessor_of until a vertex repeats, and return that cycle in edge order.
+    Returns None if the walk reaches the beginning of the path instead.
+    """
+    # after n steps back we must be on the cycle, if there is one
+    current = start
+    for _ in range(n):
+        current = predecessor_of(current)
+        if current is None:
+            return None
+
+    cycle = [current]
+    vertex = predecessor_of(current)
+    while vertex != current:
+        if vertex is None:
+            return None
+        cycle.append(vertex)
+        vertex = predecessor_of(vertex)
+
+    cycle.reverse()
+    return cycle
 
 
@@ -0,0 +1,106 @@
+import numpy as np
+from Edge import Edge
+from Vertex import Vertex
+from typing import List
+from bellman_ford import BellmanFordQueue, NegativeCycleError, _cycle_through_predecessors
+
+
+class EdgeArrays:
+    """
+    Columnar form of a List[Edge]: edge i goes from src[i] to dst[i] with weight[i],
+    where vertices are referred to by their position in the vertex list.
+    """
+    def __init__(self, num_vertices: int, src: np.ndarray, dst: np.ndarray, weight: np.ndarray) -> None:
+        self.num_vertices = num_vertices
+        self.src = src
+        self.dst = dst
+        self.weight = weight
+
+    @classmethod
+    def from_lists(cls, vertices: List[Vertex], edges: List[Edge]) -> "EdgeArrays":
+        # one-time O(V+E) conversion
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+        src = np.fromiter((index[edge.u] for edge in edges), dtype=np.int64, count=len(edges))
+        dst = np.fromiter((index[edge.v] for edge in edges), dtype=np.int64, count=len(edges))
+        weight = np.fromiter((edge.w for edge in edges), dtype=np.float64, count=len(edges))
+        return cls(len(vertices), src, dst, weight)
+
+
+def BellmanFordVectorized(vertices: List[Vertex], edges: List[Edge], source: Vertex, arrays: EdgeArrays = None) -> EdgeArrays:
+    """
+    Same as BellmanFord (fills vertex.distance and vertex.previous, raises NegativeCycleError),
+    but every round relaxes all edges at once on NumPy arrays instead of one Edge at a time.
+
+    :param arrays: EdgeArrays of vertices/edges from an earlier call, to skip the conversion
+    :return: the EdgeArrays used, so repeated calls on the same graph can pass them back in
+
+    Time Complexity:
+        - O(V*E) like BellmanFord, but each of the (at most V-1) rounds is a few vectorized passes over E
+    """
+    if arrays is None:
+        arrays = EdgeArrays.from_lists(vertices, edges)
+
+    source_index = vertices.index(source)
+    try:
+        distance, previous = bellman_ford_arrays(arrays, source_index)
+    except NegativeCycleError as error:
+        raise NegativeCycleError([vertices[i] for i in error.cycle]) from None
+    except _NoWitness:
+        # the cycle didn't show up in the predecessors, the queue based version finds it
+        # and raises NegativeCycleError with its own witness
+        BellmanFordQueue(vertices, edges, source)
+        return arrays
+
+    for i, vertex in enumerate(vertices):
+        vertex.distance = float(distance[i])
+        vertex.previous = vertices[previous[i]] if previous[i] != -1 else None
+    return arrays
+
+
+def bellman_ford_arrays(arrays: EdgeArrays, source: int) -> tuple:
+    """
+    Bellman-Ford over edge arrays. Each round is:
+        candidate = distance[src] + weight          (gather, add)
+        np.minimum.at(new_distance, dst, candidate)  (scatter the minimum per target)
+    and the edges that produced a new minimum become the predecessors.
+
+    :return: (distance, previous) arrays indexed by vertex position, previous is -1 when there is none
+    :raise NegativeCycleError: with the cycle as a list of vertex positions
+    """
+    src, dst, weight = arrays.src, arrays.dst, arrays.weight
+    n = arrays.num_vertices
+
+    distance = np.full(n, np.inf)
+    distance[source] = 0
+    previous = np.full(n, -1, dtype=np.int64)
+
+    for _ in range(n - 1):
+        candidate = distance[src] + weight
+        new_distance = distance.copy()
+        np.minimum.at(new_distance, dst, candidate)
+
+        changed = new_distance < distance
+        if not changed.any():
+            break
+
+        # edges that set the new distance of their target
+        winners = changed[dst] & (candidate == new_distance[dst])
+        previous[dst[winners]] = src[winners]
+        distance = new_distance
+
+    # one more round, anything that still improves is on or behind a negative cycle
+    candidate = distance[src] + weight
+    still_improving = np.flatnonzero(candidate < distance[dst])
+    if len(still_improving):
+        edge = still_improving[0]
+        previous[dst[edge]] = src[edge]
+        cycle = _cycle_through_predecessors(int(dst[edge]), n, lambda v: int(previous[v]) if previous[v] != -1 else None)
+        if cycle is None:
+            raise _NoWitness()
+        raise NegativeCycleError(cycle)
+
+    return distance, previous
+
+
+class _NoWitness(Exception):
+    pass
@@ -0,0 +1,100 @@
+import os
+from multiprocessing import Pool
+import numpy as np
+from shared_arrays import SharedArrays, attach_worker, worker_arrays
+
+
+def blocked_floyd_warshall(graph, tile_size: int = 256, workers: int = None) -> None:
+    """
+    Description:
+        Tiled (blocked) Floyd-Warshall on a floyd_warshall.Graph, fills graph.dist_matrix and graph.pred_matrix
+        in place, like graph.floyd_warshall().
+
+        The matrix is cut into tile_size x tile_size tiles. For each diagonal tile (kb, kb), in 3 phases:
+            1. the diagonal tile (kb, kb) runs plain Floyd-Warshall over its own k's
+            2. every tile in row kb and column kb is relaxed through the finished diagonal tile
+            3. every remaining tile (i, j) is relaxed through tiles (i, kb) and (kb, j)
+        Tiles within phase 2 (and within phase 3) only write themselves and only read finished tiles,
+        so they run in parallel on a process pool. Both matrices live in multiprocessing.shared_memory,
+        so workers read and write them in place instead of pickling tiles.
+
+        Distances are the same as graph.floyd_warshall() (for integer weights, bit for bit). When several
+        shortest paths have the same length, get_path may return a different one of them.
+
+    Args:
+        tile_size: side of a tile, should keep 3 tiles in cache (256 -> 1.5MB of float64)
+        workers: number of processes, None for os.cpu_count(), 1 to run in this process
+
+    Time complexity:
+        O(V^3) work, O(V^3 / workers) wall time for large V
+    """
+    N = graph.num_vertices
+    num_blocks = (N + tile_size - 1) // tile_size
+    if N == 0:
+        return
+
+    if workers == 1 or num_blocks == 1:
+        dist, pred = graph.dist_matrix, graph.pred_matrix
+        for kb in range(num_blocks):
+            for i, j in _phase_tiles(num_blocks, kb):
+                _relax_tile(dist, pred, tile_size, i, j, kb)
+        return
+
+    workers = workers or os.cpu_count()
+    with SharedArrays() as shared:
+        dist = shared.add("dist", graph.dist_matrix)
+        pred = shared.add("pred", graph.pred_matrix)
+        with Pool(workers, initializer=_attach_worker, initargs=(shared.specs, tile_size)) as pool:
+            for kb in range(num_blocks):
+                # phase 1, a single tile, not worth a round trip to the pool
+                _relax_tile(dist, pred, tile_size, kb, kb, kb)
+
+                # phase 2: row kb and column kb
+                row_and_column = [(kb, j, kb) for j in range(num_blocks) if j != kb]
+                row_and_column += [(i, kb, kb) for i in range(num_blocks) if i != kb]
+                pool.map(_relax_tile_task, row_and_column)
+
+                # phase 3: everything else
+                remainder = [(i, j, kb) for i in range(num_blocks) if i != kb
+                             for j in range(num_blocks) if j != kb]
+                pool.map(_relax_tile_task, remainder, chunksize=max(1, len(remainder) // (4 * workers)))
+
+        graph.dist_matrix[:] = dist
+        graph.pred_matrix[:] = pred
+        # drop the views first, so close() can unmap the blocks right away
+        del dist, pred
+
+
+def _phase_tiles(num_blocks: int, kb: int) -> list:
+    # tiles of one round in phase order, for the serial path
+    tiles = [(kb, kb)]
+    tiles += [(kb, j) for j in range(num_blocks) if j != kb]
+    tiles += [(i, kb) for i in range(num_blocks) if i != kb]
+    tiles += [(i, j) for i in range(num_blocks) if i != kb for j in range(num_blocks) if j != kb]
+    return tiles
+
+
+def _relax_tile(dist: np.ndarray, pred: np.ndarray, tile_size: int, i: int, j: int, kb: int) -> None:
+    # relax tile (i, j) through every k of block kb
+    rows = slice(i * tile_size, (i + 1) * tile_size)
+    cols = slice(j * tile_size, (j + 1) * tile_size)
+    tile = dist[rows, cols]
+    tile_pred = pred[rows, cols]
+    through_k = np.empty_like(tile)
+    improved = np.empty(tile.shape, dtype=bool)
+
+    for k in range(kb * tile_size, min((kb + 1) * tile_size, dist.shape[0])):
+        np.add(dist[rows, k, None], dist[k, None, cols], out=through_k)
+        np.less(through_k, tile, out=improved)
+        np.copyto(tile, through_k, where=improved)
+        np.copyto(tile_pred, pred[k, cols].copy(), where=improved)
+
+
+def _attach_worker(specs: dict, tile_size: int) -> None:
+    attach_worker(specs)
+    worker_arrays["tile_size"] = tile_size
+
+
+def _relax_tile_task(task: tuple) -> None:
+    i, j, kb = task
+    _relax_tile(worker_arrays["dist"], worker_arrays["pred"], worker_arrays["tile_size"], i, j, kb)
@@ -0,0 +1,121 @@
+import os
+from multiprocessing import Pool
+import numpy as np
+from shared_arrays import SharedArrays, attach_worker, worker_arrays
+from union_find import UnionFind
+
+
+def boruvka(graph, workers: int = None, chunk_edges: int = 1 << 18) -> tuple:
+    """
+    Borůvka's MST on a graph_adjacency_list.Graph, edges taken as undirected.
+    Returns (mst, total_weight) like kruskal, mst being a list of (u id, v id, w).
+    """
+    src, dst, weight = [], [], []
+    for vertex in graph.vertices:
+        for edge in vertex.edges:
+            src.append(vertex.id)
+            dst.append(edge.v.id)
+            weight.append(edge.w)
+    return boruvka_arrays(len(graph.vertices), np.array(src, dtype=np.int32), np.array(dst, dtype=np.int32),
+                          np.array(weight, dtype=np.float64), workers, chunk_edges)
+
+
+def boruvka_arrays(num_vertices: int, src: np.ndarray, dst: np.ndarray, weight: np.ndarray,
+                   workers: int = None, chunk_edges: int = 1 << 18) -> tuple:
+    """
+    Borůvka's MST over edge arrays (edge i joins src[i] and dst[i] with weight[i]).
+
+    Each round:
+        1. every component (root in a UnionFind) picks its cheapest edge leaving the component
+        2. all picked edges are added at once, merging components
+    so the number of components at least halves per round, O(log V) rounds.
+
+    Step 1 is the expensive part, a pass over every edge, and it is split into chunks of chunk_edges
+    edges over a process pool. The edge arrays and the component label of every vertex
+    (union-find roots, republished after each round) are in shared memory; each worker reduces its chunk
+    to one candidate per component and this process keeps the best candidate per component.
+
+    Ties are broken by edge index, so all components agree on one order of the edges and the picked edges
+    can never form a cycle. A disconnected graph gives a minimum spanning forest.
+
+    Args:
+        workers: number of processes, None for os.cpu_count(), 1 to run in this process
+
+    Time complexity:
+        - O(E log V) work, the per-round scan divided over the workers
+    """
+    num_edges = len(src)
+    if workers == 1 or num_edges <= chunk_edges:
+        labels = np.arange(num_vertices, dtype=np.int32)
+        return _boruvka_rounds(num_vertices, src, dst, weight, labels,
+                               lambda: _cheapest_edges(src, dst, weight, labels, 0, num_edges))
+
+    workers = workers or os.cpu_count()
+    chunks = [(lo, min(lo + chunk_edges, num_edges)) for lo in range(0, num_edges, chunk_edges)]
+    with SharedArrays() as shared:
+        for name, data in (("src", src), ("dst", dst), ("weight", weight)):
+            shared.add(name, data)
+        labels = shared.add("labels", np.arange(num_vertices, dtype=np.int32))
+        with Pool(workers, initializer=attach_worker, initargs=(shared.specs,)) as pool:
+            def cheapest():
+                parts = pool.map(_cheapest_edges_task, chunks)
+                return _best_per_component(*(np.concatenate([part[i] for part in parts]) for i in range(3)))
+
+            result = _boruvka_rounds(num_vertices, src, dst, weight, labels, cheapest)
+
+        # drop the view first, so close() can unmap the blocks right away
+        del labels
+
+    return result
+
+
+def _boruvka_rounds(num_vertices, src, dst, weight, labels, cheapest) -> tuple:
+    # labels is updated in place after every round, cheapest() reads it
+    disjoint_set = UnionFind(num_vertices)
+    mst = []
+    total_weight = 0
+
+    while disjoint_set.count > 1:
+        _, _, edges = cheapest()
+        if len(edges) == 0:
+            # no component has an outgoing edge left, the forest is complete
+            break
+
+        # two components can pick the same edge
+        for i in np.unique(edges).tolist():
+            u, v = int(src[i]), int(dst[i])
+            if disjoint_set.union(u, v):
+                w = weight[i].item()
+                mst.append((u, v, w))
+                total_weight += w
+
+        labels[:] = disjoint_set.labels()
+
+    return mst, total_weight
+
+
+def _cheapest_edges(src, dst, weight, labels, lo: int, hi: int) -> tuple:
+    # (component, weight, edge index) of the cheapest edge of each component among edges lo..hi-1
+    edges = np.arange(lo, hi)
+    cu, cv = labels[src[lo:hi]], labels[dst[lo:hi]]
+    crossing = cu != cv
+    edges, cu, cv = edges[crossing], cu[crossing], cv[crossing]
+    w = weight[lo:hi][crossing]
+
+    # an edge leaves both of its components
+    return _best_per_component(np.concatenate((cu, cv)), np.concatenate((w, w)), np.concatenate((edges, edges)))
+
+
+def _best_per_component(components, weights, edges) -> tuple:
+    # smallest (weight, edge index) per component
+    order = np.lexsort((edges, weights, components))
+    components, weights, edges = components[order], weights[order], edges[order]
+    first = np.ones(len(components), dtype=bool)
+    first[1:] = components[1:] != components[:-1]
+    return components[first], weights[first], edges[first]
+
+
+def _cheapest_edges_task(chunk: tuple) -> tuple:
+    lo, hi = chunk
+    return _cheapest_edges(worker_arrays["src"], worker_arrays["dst"], worker_arrays["weight"],
+                           worker_arrays["labels"], lo, hi)
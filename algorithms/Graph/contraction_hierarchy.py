@@ -0,0 +1,323 @@
+from array import array
+import heapq
+import struct
+from csr_graph import CSRGraph
+from graph_file import read_array, write_array
+from query_state import QueryState
+
+
+class ContractionHierarchy:
+    """
+    Contraction hierarchies (CH) for fast shortest path queries on a graph that rarely changes.
+
+    Preprocessing (build):
+        Vertices are contracted one by one in order of importance (least important first).
+        Contracting v removes it from the remaining graph, and for every pair of remaining
+        in-neighbor u and out-neighbor x, a shortcut u -> x (weight w(u,v) + w(v,x), middle v)
+        is added unless a local "witness" search finds another path that is at least as short.
+        The contraction order is the rank of each vertex.
+
+    Query:
+        A bidirectional Dijkstra where the forward search from source only follows edges going
+        up in rank, and the backward search from target only follows edges coming down in rank.
+        Both searches are tiny because they only climb the hierarchy, and they meet at the
+        highest ranked vertex of the shortest path.
+
+    Storage (all flat arrays, CSR layout like CSRGraph):
+        up_*   : edge u -> v with rank[v] > rank[u], stored under u
+        down_* : edge u -> v with rank[u] > rank[v], stored under v (pointing back to u)
+        *_middle is the contracted vertex of a shortcut, -1 for an original edge.
+
+    Only works for non-negative weights.
+    """
+    MAGIC = b"GRAPHCH\0"
+    VERSION = 1
+
+    def __init__(self, rank: array, up: tuple, down: tuple) -> None:
+        self.rank = rank
+        self.num_vertices = len(rank)
+        self.up_offsets, self.up_targets, self.up_weights, self.up_middle = up
+        self.down_offsets, self.down_targets, self.down_weights, self.down_middle = down
+
+        self.forward_state = QueryState(self.num_vertices)
+        self.backward_state = QueryState(self.num_vertices)
+        self.settled_count = 0
+        self.last_query = None
+
+    @classmethod
+    def build(cls, graph, witness_settle_limit: int = 500) -> "ContractionHierarchy":
+        """
+        Contract every vertex of graph (a graph_adjacency_list.Graph or a CSRGraph).
+
+        witness_settle_limit caps the number of vertices each witness search settles. A capped search
+        may add a shortcut that isn't needed, which only costs space, never correctness.
+
+        Time complexity:
+            - depends heavily on the graph, close to O(V log V) witness searches of bounded size on road-like graphs
+        """
+        if not isinstance(graph, CSRGraph):
+            graph = graph.freeze()
+        N = graph.num_vertices
+
+        # dynamic graph for contraction, out_edges[u][v] = [weight, middle]
+        out_edges = [dict() for _ in range(N)]
+        in_edges = [dict() for _ in range(N)]
+        for u in range(N):
+            for i in range(graph.offsets[u], graph.offsets[u + 1]):
+                v = graph.targets[i]
+                w = graph.weights[i]
+                if u == v:
+                    continue
+                # keep the lightest of parallel edges
+                if v not in out_edges[u] or w < out_edges[u][v][0]:
+                    out_edges[u][v] = [w, -1]
+                    in_edges[v][u] = out_edges[u][v]
+
+        contracted = bytearray(N)
+        deleted_neighbors = array('i', [0]) * N
+        rank = array('i', [0]) * N
+
+        def find_shortcuts(v: int) -> list:
+            # shortcuts (u, x, weight) needed if v was contracted now
+            shortcuts = []
+            outgoing = [(x, w) for x, (w, _) in out_edges[v].items() if not contracted[x]]
+            if not outgoing:
+                return shortcuts
+            max_out = max(w for _, w in outgoing)
+
+            for u, (w_in, _) in in_edges[v].items():
+                if contracted[u]:
+                    continue
+                limit = w_in + max_out
+                witness = _witness_search(out_edges, contracted, u, v, limit, witness_settle_limit)
+                for x, w_out in outgoing:
+                    if x == u:
+                        continue
+                    via_v = w_in + w_out
+                    if witness.get(x, float('inf')) > via_v:
+                        shortcuts.append((u, x, via_v))
+            return shortcuts
+
+        def importance(v: int) -> int:
+            # edge difference: shortcuts added minus edges removed, plus contracted neighbors to spread contraction out
+            removed = sum(1 for x in out_edges[v] if not contracted[x]) + sum(1 for u in in_edges[v] if not contracted[u])
+            return len(find_shortcuts(v)) - removed + deleted_neighbors[v]
+
+        priority_queue = [(importance(v), v) for v in range(N)]
+        heapq.heapify(priority_queue)
+
+        next_rank = 0
+        while priority_queue:
+            _, v = heapq.heappop(priority_queue)
+            if contracted[v]:
+                continue
+
+            # lazy update: the priority may be stale, push v back if it is no longer the minimum
+            priority = importance(v)
+            if priority_queue and priority > priority_queue[0][0]:
+                heapq.heappush(priority_queue, (priority, v))
+                continue
+
+            for u, x, weight in find_shortcuts(v):
+                existing = out_edges[u].get(x)
+                if existing is None or weight < existing[0]:
+                    out_edges[u][x] = [weight, v]
+                    in_edges[x][u] = out_edges[u][x]
+
+            contracted[v] = 1
+            rank[v] = next_rank
+            next_rank += 1
+            for x in out_edges[v]:
+                deleted_neighbors[x] += 1
+            for u in in_edges[v]:
+                deleted_neighbors[u] += 1
+
+        up = _pack([[(v, w, m) for v, (w, m) in out_edges[u].items() if rank[v] > rank[u]] for u in range(N)])
+        down = _pack([[(u, w, m) for u, (w, m) in in_edges[v].items() if rank[u] > rank[v]] for v in range(N)])
+        return cls(rank, up, down)
+
+    def query(self, source: int, target: int) -> float:
+        """
+        Shortest distance from source to target (inf if unreachable), same as Graph.dijkstra(source) then
+        vertices[target].distance. Use backtracking(target) afterwards for the full path.
+        """
+        forward, backward = self.forward_state, self.backward_state
+        forward.new_query()
+        backward.new_query()
+        # edge index used to reach each vertex, needed to unpack shortcuts
+        forward_edge = {}
+        backward_edge = {}
+
+        forward.set_distance(source, 0)
+        backward.set_distance(target, 0)
+        queues = ([(0, source)], [(0, target)])
+        sides = (
+            (forward, backward, forward_edge, self.up_offsets, self.up_targets, self.up_weights),
+            (backward, forward, backward_edge, self.down_offsets, self.down_targets, self.down_weights),
+        )
+
+        best = float('inf')
+        meet = -1
+        settled = 0
+
+        while queues[0] or queues[1]:
+            # each side stops on its own once its frontier can't beat the best meeting point
+            side = 0 if queues[0] and (not queues[1] or queues[0][0][0] <= queues[1][0][0]) else 1
+            queue = queues[side]
+            if queue[0][0] >= best:
+                queue.clear()
+                continue
+
+            this, other, edge_of, offsets, targets, weights = sides[side]
+            current_distance, u = heapq.heappop(queue)
+            if this.is_visited(u):
+                continue
+            this.set_visited(u)
+            settled += 1
+
+            candidate = current_distance + other.get_distance(u)
+            if candidate < best:
+                best, meet = candidate, u
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                new_distance = current_distance + weights[i]
+                if new_distance < this.get_distance(v):
+                    this.relax(v, new_distance, u)
+                    edge_of[v] = i
+                    heapq.heappush(queue, (new_distance, v))
+
+        self.settled_count = settled
+        self.last_query = (source, target, meet, forward_edge, backward_edge)
+        return best
+
+    def backtracking(self, target_id: int) -> list:
+        """
+        Full path (shortcuts unpacked into original vertices) of the last query, same format as Graph.backtracking.
+        """
+        if self.last_query is None or self.last_query[1] != target_id:
+            raise ValueError("no path found, run query(source, target) first")
+        source, target, meet, forward_edge, backward_edge = self.last_query
+        if meet == -1:
+            return [target_id]
+
+        # climb from meet down to source over the forward search, then from meet to target over the backward search
+        current = meet
+        forward_hops = []
+        while current != source:
+            i = forward_edge[current]
+            previous = self.forward_state.get_predecessor(current)
+            forward_hops.append((previous, current, self.up_middle[i]))
+            current = previous
+        forward_hops.reverse()
+
+        path = [source]
+        for u, v, middle in forward_hops:
+            self._unpack(u, v, middle, path)
+
+        current = meet
+        while current != target:
+            i = backward_edge[current]
+            following = self.backward_state.get_predecessor(current)
+            self._unpack(current, following, self.down_middle[i], path)
+            current = following
+
+        return path
+
+    def _unpack(self, u: int, v: int, middle: int, path: list) -> None:
+        # append the original vertices of edge u -> v (without u) to path
+        stack = [(u, v, middle)]
+        while stack:
+            u, v, middle = stack.pop()
+            if middle == -1:
+                path.append(v)
+                continue
+            # middle was contracted before u and v, so u -> middle is a down edge and middle -> v an up edge
+            stack.append((middle, v, self._edge_middle(self.up_offsets, self.up_targets, self.up_middle, middle, v)))
+            stack.append((u, middle, self._edge_middle(self.down_offsets, self.down_targets, self.down_middle, middle, u)))
+
+    @staticmethod
+    def _edge_middle(offsets: array, targets: array, middles: array, u: int, v: int) -> int:
+        for i in range(offsets[u], offsets[u + 1]):
+            if targets[i] == v:
+                return middles[i]
+        raise ValueError(f"Edge {u} - {v} missing from the hierarchy")
+
+    def save(self, path: str) -> None:
+        """
+        Binary file: magic, version, vertex count, then every array as (length, little-endian data).
+        """
+        with open(path, "wb") as file:
+            file.write(struct.pack("<8sIQ", self.MAGIC, self.VERSION, self.num_vertices))
+            for data in self._arrays():
+                _write_array(file, data)
+
+    @classmethod
+    def load(cls, path: str) -> "ContractionHierarchy":
+        with open(path, "rb") as file:
+            header = file.read(struct.calcsize("<8sIQ"))
+            magic, version, _ = struct.unpack("<8sIQ", header)
+            if magic != cls.MAGIC:
+                raise ValueError(f"{path} is not a contraction hierarchy file")
+            if version != cls.VERSION:
+                raise ValueError(f"Unsupported contraction hierarchy version: {version}")
+
+            rank = _read_array(file, 'i')
+            up = (_read_array(file, 'i'), _read_array(file, 'i'), _read_array(file, 'd'), _read_array(file, 'i'))
+            down = (_read_array(file, 'i'), _read_array(file, 'i'), _read_array(file, 'd'), _read_array(file, 'i'))
+        return cls(rank, up, down)
+
+    def _arrays(self) -> tuple:
+        return (self.rank,
+                self.up_offsets, self.up_targets, self.up_weights, self.up_middle,
+                self.down_offsets, self.down_targets, self.down_weights, self.down_middle)
+
+
+def _witness_search(out_edges: list, contracted: bytearray, source: int, skip: int, limit: float, settle_limit: int) -> dict:
+    # local Dijkstra from source over uncontracted vertices other than skip, up to distance limit
+    distance = {source: 0}
+    priority_queue = [(0, source)]
+    settled = 0
+
+    while priority_queue and settled < settle_limit:
+        current_distance, u = heapq.heappop(priority_queue)
+        if current_distance > distance[u]:
+            continue
+        if current_distance > limit:
+            break
+        settled += 1
+
+        for v, (w, _) in out_edges[u].items():
+            if v == skip or contracted[v]:
+                continue
+            new_distance = current_distance + w
+            if new_distance < distance.get(v, float('inf')):
+                distance[v] = new_distance
+                heapq.heappush(priority_queue, (new_distance, v))
+
+    return distance
+
+
+def _pack(adjacency: list) -> tuple:
+    # list of [(target, weight, middle), ...] per vertex -> CSR arrays
+    offsets = array('i', [0])
+    targets = array('i')
+    weights = array('d')
+    middles = array('i')
+    for edges in adjacency:
+        for v, w, middle in edges:
+            targets.append(v)
+            weights.append(w)
+            middles.append(middle)
+        offsets.append(len(targets))
+    return offsets, targets, weights, middles
+
+
+def _write_array(file, data: array) -> None:
+    file.write(struct.pack("<Q", len(data)))
+    write_array(file, data)
+
+
+def _read_array(file, typecode: str) -> array:
+    (length,) = struct.unpack("<Q", file.read(8))
+    return read_array(file.read(length * struct.calcsize(typecode)), typecode)
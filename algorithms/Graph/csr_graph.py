@@ -0,0 +1,345 @@
+from array import array
+from collections import deque
+import numpy as np
+from dfs_events import topological_order
+from query_state import QueryState
+from indexed_heap import IndexedMinHeap
+
+
+class CSRGraph:
+    """
+    Frozen compressed sparse row (CSR) form of graph_adjacency_list.Graph.
+
+    The out-edges of vertex u are stored contiguously:
+        targets[offsets[u]:offsets[u+1]]  -> neighbor ids
+        weights[offsets[u]:offsets[u+1]]  -> matching edge weights
+
+    Example (edges 0->1 (1), 0->2 (2), 1->2 (3)):
+        offsets = [0, 2, 3, 3]
+        targets = [1, 2, 2]
+        weights = [1, 2, 3]
+
+    Compared to one Vertex object per node and one Edge object per arc, this only costs
+    3 flat arrays (4 bytes per offset/target, 8 bytes per weight), and neighbors are scanned
+    sequentially in memory.
+
+    The graph is read-only once built. Per-query state lives in an epoch-stamped QueryState,
+    so a query only writes the vertices it reaches. Results of the last query can be read
+    through self.distance and self.predecessor (indexed by vertex id, -1 means no predecessor).
+    """
+    def __init__(self, offsets: array, targets: array, weights: array) -> None:
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.num_vertices = len(offsets) - 1
+        self.num_edges = len(targets)
+
+        self.state = QueryState(self.num_vertices)
+        self.has_query = False
+        self.heap = None
+        self.heap_arity = 4
+
+    @property
+    def distance(self):
+        return self.state.distance_view() if self.has_query else None
+
+    @property
+    def predecessor(self):
+        return self.state.predecessor_view() if self.has_query else None
+
+    @classmethod
+    def from_graph(cls, graph) -> "CSRGraph":
+        """
+        Build a CSR snapshot of an adjacency list Graph, keeping the add_edge order of each vertex.
+
+        Time complexity:
+            - O(V+E)
+        """
+        offsets = array('i', [0]) * (len(graph.vertices) + 1)
+        targets = array('i')
+        weights = array('d')
+
+        for vertex in graph.vertices:
+            for edge in vertex.edges:
+                targets.append(edge.v.id)
+                weights.append(edge.w)
+            offsets[vertex.id + 1] = len(targets)
+
+        return cls(offsets, targets, weights)
+
+    @classmethod
+    def from_edges(cls, N: int, edges) -> "CSRGraph":
+        """
+        Build a CSR graph with N vertices from an edge list of (u, v) or (u, v, w) tuples.
+        Missing weights default to 1 like Graph.add_edge.
+
+        Edges are bucketed by source with a counting sort, so the out-edges of each vertex
+        keep the order they appear in the edge list.
+
+        Time complexity:
+            - O(V+E)
+        """
+        edges = list(edges)
+
+        # count the out-degree of each vertex, then prefix sum into offsets
+        offsets = array('i', [0]) * (N + 1)
+        for edge in edges:
+            offsets[edge[0] + 1] += 1
+        for u in range(N):
+            offsets[u + 1] += offsets[u]
+
+        targets = array('i', [0]) * len(edges)
+        weights = array('d', [0.0]) * len(edges)
+
+        # next free slot of each vertex
+        cursor = array('i', offsets[:N])
+        for edge in edges:
+            u = edge[0]
+            slot = cursor[u]
+            targets[slot] = edge[1]
+            weights[slot] = edge[2] if len(edge) > 2 else 1
+            cursor[u] = slot + 1
+
+        return cls(offsets, targets, weights)
+
+    def transpose(self) -> "CSRGraph":
+        """
+        CSR graph with every edge reversed, i.e. the in-edges of each vertex stored contiguously.
+        Same counting sort as from_edges, without building edge tuples.
+
+        Time complexity:
+            - O(V+E)
+        """
+        N = self.num_vertices
+        offsets = array('i', [0]) * (N + 1)
+        for v in self.targets:
+            offsets[v + 1] += 1
+        for u in range(N):
+            offsets[u + 1] += offsets[u]
+
+        sources = array('i', [0]) * self.num_edges
+        weights = array('d', [0.0]) * self.num_edges
+        cursor = array('i', offsets[:N])
+        for u in range(N):
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[i]
+                slot = cursor[v]
+                sources[slot] = u
+                weights[slot] = self.weights[i]
+                cursor[v] = slot + 1
+
+        return CSRGraph(offsets, sources, weights)
+
+    def out_degree(self, u: int) -> int:
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def neighbors(self, u: int):
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def dfs(self, start_vertex_id: int) -> list: # O(V+E)
+        """
+        Same visiting order as Graph.dfs, but with an explicit stack of (vertex, next edge index)
+        so it does not recurse once per vertex.
+        """
+        offsets = self.offsets
+        targets = self.targets
+        self.state.new_query()
+        seen = self.state.seen
+        epoch = self.state.epoch
+
+        seen[start_vertex_id] = epoch
+        traversal_result = [start_vertex_id]
+        stack = [(start_vertex_id, offsets[start_vertex_id])]
+
+        while stack:
+            u, i = stack[-1]
+            end = offsets[u + 1]
+
+            # skip neighbors that are already visited
+            while i < end and seen[targets[i]] == epoch:
+                i += 1
+
+            if i == end:
+                stack.pop()
+                continue
+
+            # resume u from the next edge once the neighbor is done
+            stack[-1] = (u, i + 1)
+            v = targets[i]
+            seen[v] = epoch
+            traversal_result.append(v)
+            stack.append((v, offsets[v]))
+
+        return traversal_result
+
+    def bfs(self, start_vertex_id: int) -> list: # O(V+E)
+        """
+        Vertices are marked when they are enqueued, so each vertex enters the queue at most once.
+        """
+        offsets = self.offsets
+        targets = self.targets
+        self.state.new_query()
+        seen = self.state.seen
+        epoch = self.state.epoch
+
+        seen[start_vertex_id] = epoch
+        discovered = deque([start_vertex_id])
+        traversal_result = []
+
+        while discovered:
+            u = discovered.popleft()
+            traversal_result.append(u)
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if seen[v] != epoch:
+                    seen[v] = epoch
+                    discovered.append(v)
+
+        return traversal_result
+
+    def bfs_shortest_path(self, start_vertex_id: int) -> list: # O(V+E)
+        """
+        Returns [[vertex id, hops from start], ...] in BFS order and fills self.distance / self.predecessor.
+        """
+        offsets = self.offsets
+        targets = self.targets
+        state = self.state
+        state.new_query()
+        self.has_query = True
+
+        state.set_distance(start_vertex_id, 0)
+        discovered = deque([start_vertex_id])
+        traversal_result = []
+
+        while discovered:
+            u = discovered.popleft()
+            current_distance = state.get_distance(u)
+            traversal_result.append([u, current_distance])
+
+            new_distance = current_distance + 1
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if new_distance < state.get_distance(v):
+                    state.relax(v, new_distance, u)
+                    discovered.append(v)
+
+        return traversal_result
+
+    def dijkstra(self, start_id: int, stop_at=None) -> None:
+        """
+        find the shortest path from start_id to all other vertices, only works for non-negative weights
+
+        Results are readable through self.distance and self.predecessor, use backtracking(target_id) for the path.
+        stop_at: optional collection of vertex ids, the search stops once all of them are settled
+
+        Time Complexity:
+            - O((V+E) log_d V) with an indexed d-ary heap, only the reached vertices are touched
+        """
+        offsets = self.offsets
+        targets = self.targets
+        weights = self.weights
+        state = self.state
+        state.new_query()
+        self.has_query = True
+        get_distance = state.get_distance
+
+        state.set_distance(start_id, 0)
+        if self.heap is None or self.heap.arity != self.heap_arity:
+            self.heap = IndexedMinHeap(self.num_vertices, self.heap_arity)
+        priority_queue = self.heap
+        priority_queue.clear()
+        priority_queue.push(start_id, 0)
+
+        if stop_at is not None:
+            stop_at = set(stop_at)
+            remaining = len(stop_at)
+
+        while not priority_queue.is_empty():
+            u, current_distance = priority_queue.pop()
+            state.set_visited(u)
+            if stop_at is not None and u in stop_at:
+                remaining -= 1
+                if remaining == 0:
+                    break
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                new_distance = current_distance + weights[i]
+                if new_distance < get_distance(v):
+                    state.relax(v, new_distance, u)
+                    priority_queue.push_or_decrease(v, new_distance)
+
+    def backtracking(self, target_id: int) -> list:
+        if not self.has_query:
+            raise ValueError("no path found, run a shortest path query first")
+
+        path = []
+        current = target_id
+        while current != -1: # O(L)
+            path.append(current)
+            current = self.state.get_predecessor(current)
+
+        path.reverse()
+        return path
+
+    def in_degrees(self) -> array:
+        in_degree = array('i', [0]) * self.num_vertices
+        for v in self.targets:
+            in_degree[v] += 1
+        return in_degree
+
+    def kahn_topological_sort_bfs(self) -> list:
+        """
+        Kahn's topological sort, returns vertex ids.
+
+        Time complexity:
+            - O(V+E)
+        """
+        offsets = self.offsets
+        targets = self.targets
+        in_degree = self.in_degrees()
+
+        start_vertices_stack = [u for u in range(self.num_vertices) if in_degree[u] == 0]
+        topo_order = []
+
+        while start_vertices_stack:
+            u = start_vertices_stack.pop()
+            topo_order.append(u)
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    start_vertices_stack.append(v)
+
+        if len(topo_order) == self.num_vertices:
+            return topo_order
+        else:
+            raise ValueError("There'a cycle in the graph. Cannot do topological sort.")
+
+    def dfs_topological_sort(self) -> list:
+        """
+        Topological sort using DFS finishing order, returns vertex ids.
+        Runs on the explicit-stack DFS of dfs_events, raises ValueError if the graph has a cycle.
+
+        Time complexity:
+            - O(V+E)
+        """
+        return topological_order(self.num_vertices, self.neighbors)
+
+
+def edge_ranges(offsets: np.ndarray, vertices: np.ndarray) -> tuple:
+    """
+    (owner, edge index) of every out-edge of vertices, vectorized over NumPy CSR offsets:
+    the ranges offsets[u]:offsets[u+1] one after another, so targets[edge] / weights[edge] are the edge's ends.
+
+    Time complexity:
+        - O(len(vertices) + number of edges returned)
+    """
+    starts = offsets[vertices]
+    counts = offsets[vertices + 1] - starts
+    total = int(counts.sum())
+    owners = np.repeat(vertices, counts)
+    range_starts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return owners, range_starts + np.arange(total)
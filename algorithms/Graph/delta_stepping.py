@@ -0,0 +1,146 @@
+import os
+from multiprocessing import Pool
+import numpy as np
+from csr_graph import edge_ranges
+from shared_arrays import SharedArrays, attach_worker, worker_arrays
+
+
+def delta_stepping(csr, source: int, delta: float = None, workers: int = None, parallel_threshold: int = 4096) -> tuple:
+    """
+    Delta-stepping single source shortest paths on a CSRGraph, only works for non-negative weights.
+
+    Vertices are kept in buckets of width delta by tentative distance (bucket i = [i*delta, (i+1)*delta)).
+    The smallest non-empty bucket is processed as a whole:
+        - light edges (w <= delta) out of the bucket are relaxed repeatedly until the bucket stays empty,
+          since they can put vertices back into the same bucket
+        - heavy edges (w > delta) out of every vertex removed from the bucket are relaxed once at the end
+    Relaxing the edges of a whole bucket is independent work: workers read the graph and the distances
+    from shared memory, each turns its slice of the bucket into relaxation requests (v, new distance, u),
+    and this process applies the best request per vertex.
+
+    delta = smallest edge weight gives Dijkstra (one distance per bucket), delta = inf gives Bellman-Ford.
+    Something around the average weight is a good start.
+
+    Args:
+        delta: bucket width, defaults to the average edge weight
+        workers: number of processes, None for os.cpu_count(), 1 to run in this process
+        parallel_threshold: buckets with fewer vertices are relaxed in this process, the round trip isn't worth it;
+                            graphs with fewer vertices never start the pool
+
+    Returns:
+        (distance, predecessor) NumPy arrays, inf / -1 for unreachable vertices
+
+    Time complexity:
+        - O(V+E) work per "phase", with (max distance / delta) buckets; same as Dijkstra's output
+    """
+    N = csr.num_vertices
+    offsets = np.asarray(csr.offsets, dtype=np.int64)
+    targets = np.asarray(csr.targets, dtype=np.int64)
+    weights = np.asarray(csr.weights, dtype=np.float64)
+
+    if delta is None:
+        delta = float(weights.mean()) if len(weights) and weights.mean() > 0 else 1.0
+
+    light = _split(offsets, targets, weights, weights <= delta)
+    heavy = _split(offsets, targets, weights, weights > delta)
+
+    # a bucket never holds more than N vertices, below the threshold the pool would sit idle
+    if workers == 1 or N < parallel_threshold:
+        return _run(N, source, delta, light, heavy, None, np.full(N, np.inf), parallel_threshold)
+
+    workers = workers or os.cpu_count()
+    names = ("light_offsets", "light_targets", "light_weights", "heavy_offsets", "heavy_targets", "heavy_weights")
+    with SharedArrays() as shared:
+        views = [shared.add(name, data) for name, data in zip(names, light + heavy)]
+        distance = shared.add("distance", np.full(N, np.inf))
+        with Pool(workers, initializer=attach_worker, initargs=(shared.specs,)) as pool:
+            result_distance, predecessor = _run(N, source, delta, tuple(views[:3]), tuple(views[3:]), pool,
+                                                distance, parallel_threshold, workers)
+            result_distance = result_distance.copy()
+        # drop the views first, so close() can unmap the blocks right away
+        del views, distance
+
+    return result_distance, predecessor
+
+
+def _run(N, source, delta, light, heavy, pool, distance, parallel_threshold, workers=1) -> tuple:
+    predecessor = np.full(N, -1, dtype=np.int64)
+    buckets = {}
+
+    def apply(requests):
+        # keep the best request per vertex, then the ones that beat the current distance
+        targets, candidates, sources = requests
+        if len(targets) == 0:
+            return
+        order = np.lexsort((candidates, targets))
+        targets, candidates, sources = targets[order], candidates[order], sources[order]
+        first = np.ones(len(targets), dtype=bool)
+        first[1:] = targets[1:] != targets[:-1]
+        targets, candidates, sources = targets[first], candidates[first], sources[first]
+
+        better = candidates < distance[targets]
+        targets, candidates, sources = targets[better], candidates[better], sources[better]
+
+        for v, old in zip(targets.tolist(), distance[targets].tolist()):
+            if old != np.inf and int(old // delta) in buckets:
+                buckets[int(old // delta)].discard(v)
+        distance[targets] = candidates
+        predecessor[targets] = sources
+        for v, new in zip(targets.tolist(), candidates.tolist()):
+            buckets.setdefault(int(new // delta), set()).add(v)
+
+    def relax(frontier, kind):
+        if pool is None or len(frontier) < parallel_threshold:
+            return _requests(frontier, *(light if kind == "light" else heavy), distance)
+        chunks = np.array_split(frontier, workers)
+        parts = pool.map(_requests_task, [(chunk, kind) for chunk in chunks if len(chunk)])
+        return tuple(np.concatenate([part[i] for part in parts]) for i in range(3))
+
+    distance[source] = 0
+    buckets[0] = {source}
+
+    while buckets:
+        i = min(buckets)
+        if not buckets[i]:
+            del buckets[i]
+            continue
+
+        settled = []
+        # light edges may refill bucket i, repeat until it stays empty
+        while buckets.get(i):
+            frontier = np.fromiter(buckets.pop(i), dtype=np.int64)
+            settled.append(frontier)
+            apply(relax(frontier, "light"))
+
+        apply(relax(np.concatenate(settled), "heavy"))
+        buckets.pop(i, None)
+
+    return distance, predecessor
+
+
+def _split(offsets, targets, weights, keep) -> tuple:
+    # CSR arrays restricted to the edges where keep is True
+    kept_before = np.concatenate(([0], np.cumsum(keep, dtype=np.int64)))
+    return kept_before[offsets], targets[keep], weights[keep]
+
+
+def _requests(frontier, offsets, targets, weights, distance) -> tuple:
+    """
+    All edges out of frontier as relaxation requests (target, candidate distance, source),
+    keeping only the ones that beat the target's current distance.
+    """
+    sources, edges = edge_ranges(offsets, frontier)
+    if len(edges) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, np.empty(0), empty
+
+    candidate_targets = targets[edges]
+    candidates = distance[sources] + weights[edges]
+    better = candidates < distance[candidate_targets]
+    return candidate_targets[better], candidates[better], sources[better]
+
+
+def _requests_task(task: tuple) -> tuple:
+    frontier, kind = task
+    return _requests(frontier, worker_arrays[kind + "_offsets"], worker_arrays[kind + "_targets"],
+                     worker_arrays[kind + "_weights"], worker_arrays["distance"])
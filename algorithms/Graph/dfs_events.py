@@ -0,0 +1,175 @@
+"""
+Recursion-free depth first search as a stream of events.
+
+dfs_events walks the graph with an explicit stack of (vertex, neighbor iterator) and yields
+    (DISCOVER, parent, v)   v is entered, parent is -1 for a root
+    (FINISH, parent, v)     every neighbor of v is done
+    (BACK_EDGE, u, v)       edge u -> v to a vertex still on the DFS path (a cycle in a directed graph)
+    (CROSS_EDGE, u, v)      edge u -> v to a finished vertex (forward or cross edge)
+Tree edges are the DISCOVER events. Events come in the same order as the classic recursive DFS,
+and since it is a generator, callers can stop as soon as they have what they need.
+
+The algorithms below are all built on it. They take the number of vertices N and a function
+neighbors(u) returning the ids u has an edge to, so any graph representation can use them.
+
+Memory is O(V): the colour of each vertex plus at most one stack entry per vertex.
+"""
+
+DISCOVER = 0
+FINISH = 1
+BACK_EDGE = 2
+CROSS_EDGE = 3
+
+_WHITE, _GRAY, _BLACK = 0, 1, 2
+
+
+def dfs_events(N: int, neighbors, roots=None):
+    """
+    Yields the events of a DFS from each root in turn (every vertex by default), skipping roots already reached.
+
+    Time complexity:
+        - O(V+E) for a full walk
+    """
+    colour = bytearray(N)
+    if roots is None:
+        roots = range(N)
+
+    for root in roots:
+        if colour[root] != _WHITE:
+            continue
+
+        colour[root] = _GRAY
+        yield DISCOVER, -1, root
+        stack = [(root, -1, iter(neighbors(root)))]
+
+        while stack:
+            u, parent, edges = stack[-1]
+            for v in edges:
+                if colour[v] == _WHITE:
+                    colour[v] = _GRAY
+                    yield DISCOVER, u, v
+                    # u resumes from the same iterator once v is finished
+                    stack.append((v, u, iter(neighbors(v))))
+                    break
+                yield (BACK_EDGE if colour[v] == _GRAY else CROSS_EDGE), u, v
+            else:
+                stack.pop()
+                colour[u] = _BLACK
+                yield FINISH, parent, u
+
+
+def preorder(N: int, neighbors, start: int) -> list:
+    # vertices reachable from start, in the order DFS enters them
+    return [v for event, _, v in dfs_events(N, neighbors, [start]) if event == DISCOVER]
+
+
+def topological_order(N: int, neighbors) -> list:
+    """
+    Vertices by decreasing DFS finishing time. Raises ValueError at the first back edge.
+    """
+    finished = []
+    for event, _, v in dfs_events(N, neighbors):
+        if event == FINISH:
+            finished.append(v)
+        elif event == BACK_EDGE:
+            raise ValueError("There'a cycle in the graph. Cannot do topological sort.")
+    finished.reverse()
+    return finished
+
+
+def find_cycle(N: int, neighbors):
+    """
+    A directed cycle as a list of vertex ids [v0, v1, ..., vk] with an edge vk -> v0, or None if the graph is acyclic.
+    The walk stops at the first back edge.
+    """
+    parent = {}
+    for event, u, v in dfs_events(N, neighbors):
+        if event == DISCOVER:
+            parent[v] = u
+        elif event == BACK_EDGE:
+            # v is an ancestor of u on the DFS path, walk the tree edges back up to it
+            cycle = [u]
+            while cycle[-1] != v:
+                cycle.append(parent[cycle[-1]])
+            cycle.reverse()
+            return cycle
+    return None
+
+
+def strongly_connected_components(N: int, neighbors) -> list:
+    """
+    Tarjan's algorithm on the event stream, returns the components as lists of vertex ids,
+    in reverse topological order of the condensation (a component only has edges to earlier ones).
+
+    low[v] is the smallest discovery index reachable from v's subtree through at most one back / cross edge
+    into a vertex still on the component stack; v is the root of a component when low[v] == index[v].
+    """
+    index = [-1] * N
+    low = [0] * N
+    on_stack = bytearray(N)
+    stack = []
+    components = []
+    counter = 0
+
+    for event, u, v in dfs_events(N, neighbors):
+        if event == DISCOVER:
+            index[v] = low[v] = counter
+            counter += 1
+            stack.append(v)
+            on_stack[v] = 1
+        elif event == FINISH:
+            if low[v] == index[v]:
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    component.append(w)
+                    if w == v:
+                        break
+                components.append(component)
+            if u != -1 and low[v] < low[u]:
+                low[u] = low[v]
+        elif on_stack[v] and index[v] < low[u]:
+            low[u] = index[v]
+
+    return components
+
+
+def articulation_points(N: int, neighbors) -> list:
+    """
+    Articulation points (cut vertices) of an undirected graph, where neighbors(u) lists every edge in both directions.
+
+    A non-root u is a cut vertex when some tree child v has low[v] >= index[u]: nothing in v's subtree
+    reaches above u. A root is one when it has two or more tree children.
+    A single edge back to the tree parent is not a back edge (parallel edges to it are).
+    """
+    index = [-1] * N
+    low = [0] * N
+    parent = [-1] * N
+    skipped_parent_edge = bytearray(N)
+    children = [0] * N
+    is_cut = bytearray(N)
+    counter = 0
+
+    for event, u, v in dfs_events(N, neighbors):
+        if event == DISCOVER:
+            index[v] = low[v] = counter
+            counter += 1
+            parent[v] = u
+            if u != -1:
+                children[u] += 1
+        elif event == FINISH:
+            if u == -1:
+                if children[v] >= 2:
+                    is_cut[v] = 1
+            else:
+                low[u] = min(low[u], low[v])
+                if parent[u] != -1 and low[v] >= index[u]:
+                    is_cut[u] = 1
+        else:
+            if v == parent[u] and not skipped_parent_edge[u]:
+                skipped_parent_edge[u] = 1
+                continue
+            low[u] = min(low[u], index[v])
+
+    return [v for v in range(N) if is_cut[v]]
@@ -0,0 +1,92 @@
+import numpy as np
+from csr_graph import CSRGraph, edge_ranges
+
+
+def direction_optimizing_bfs(csr: CSRGraph, source: int, reverse: CSRGraph = None, alpha: float = 14, beta: float = 24) -> tuple:
+    """
+    Level-synchronous BFS that switches between two kinds of steps (Beamer et al.):
+
+        top-down:  every frontier vertex looks at its out-edges and claims the unvisited targets.
+                   Cheap while the frontier is small.
+        bottom-up: every unvisited vertex looks at its in-edges for a parent in the frontier.
+                   Cheap once the frontier covers a large part of the graph (low diameter graphs),
+                   because most unvisited vertices find a parent and stop needing checks.
+
+    Switches to bottom-up when the edges out of the frontier m_f exceed (edges out of unvisited vertices) / alpha,
+    and back to top-down when the frontier shrinks below V / beta vertices.
+
+    frontier and visited are NumPy bool arrays, a whole level is processed with vectorized gathers,
+    so there is no queue at all and no vertex is ever handled twice.
+
+    Args:
+        reverse: csr.transpose(), built when None; pass it in to reuse it across searches
+
+    Returns:
+        (levels, parents) int32 arrays indexed by vertex id, -1 for unreachable vertices (and the source's parent)
+
+    Time complexity:
+        - O(V+E) for top-down steps, bottom-up steps rescan the in-edges of the vertices still unvisited
+    """
+    N = csr.num_vertices
+    offsets = np.asarray(csr.offsets, dtype=np.int64)
+    targets = np.asarray(csr.targets, dtype=np.int64)
+    if reverse is None:
+        reverse = csr.transpose()
+    in_offsets = np.asarray(reverse.offsets, dtype=np.int64)
+    in_sources = np.asarray(reverse.targets, dtype=np.int64)
+    out_degree = np.diff(offsets)
+
+    levels = np.full(N, -1, dtype=np.int32)
+    parents = np.full(N, -1, dtype=np.int32)
+    visited = np.zeros(N, dtype=bool)
+    frontier = np.zeros(N, dtype=bool)
+
+    visited[source] = frontier[source] = True
+    levels[source] = 0
+    frontier_ids = np.array([source], dtype=np.int64)
+    unvisited_edges = int(out_degree.sum()) - int(out_degree[source])
+    bottom_up = False
+    level = 0
+
+    while len(frontier_ids):
+        level += 1
+        frontier_edges = int(out_degree[frontier_ids].sum())
+        if not bottom_up and frontier_edges * alpha > unvisited_edges:
+            bottom_up = True
+        elif bottom_up and len(frontier_ids) * beta < N:
+            bottom_up = False
+
+        if bottom_up:
+            children, found_parents = _bottom_up_step(in_offsets, in_sources, frontier, visited)
+        else:
+            children, found_parents = _top_down_step(offsets, targets, frontier_ids, visited)
+
+        visited[children] = True
+        levels[children] = level
+        parents[children] = found_parents
+        frontier[frontier_ids] = False
+        frontier[children] = True
+        frontier_ids = children
+        unvisited_edges -= int(out_degree[children].sum())
+
+    return levels, parents
+
+
+def _top_down_step(offsets, targets, frontier_ids, visited) -> tuple:
+    # out-edges of the frontier, the first edge reaching an unvisited vertex makes it a child
+    sources, edges = edge_ranges(offsets, frontier_ids)
+    edge_targets = targets[edges]
+    new = ~visited[edge_targets]
+    children, first = np.unique(edge_targets[new], return_index=True)
+    return children, sources[new][first]
+
+
+def _bottom_up_step(in_offsets, in_sources, frontier, visited) -> tuple:
+    # in-edges of the unvisited vertices, the first one coming from the frontier gives the parent
+    unvisited = np.flatnonzero(~visited)
+    owners, edges = edge_ranges(in_offsets, unvisited)
+    edge_sources = in_sources[edges]
+    hit = frontier[edge_sources]
+    children, first = np.unique(owners[hit], return_index=True)
+    return children, edge_sources[hit][first]
+
@@ -0,0 +1,190 @@
+import csv
+import os
+from array import array
+import numpy as np
+from csr_graph import CSRGraph
+from external_kruskal import EDGE_DTYPE
+
+
+DEDUPE_RULES = ("min", "sum", "last", None)
+
+
+def read_edge_chunks(path: str, format: str = None, chunk_size: int = 1 << 16, label_type=str,
+                     has_header: bool = False, default_weight: float = 1.0):
+    """
+    Reads an edge list in chunks, yields (sources, targets, weights) columns of at most chunk_size edges,
+    sources / targets as NumPy arrays of labels, weights as float64.
+
+    Formats (guessed from the extension when format is None):
+        "csv" / "tsv": one "u,v[,w]" line per edge, labels are parsed with label_type (str or int)
+        "binary":      EDGE_DTYPE records (int32 u, int32 v, float64 w), see external_kruskal.write_edge_file
+    """
+    if format is None:
+        format = {".csv": "csv", ".tsv": "tsv", ".bin": "binary"}.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise ValueError(f"Cannot tell the format of {path}, pass format=")
+
+    if format == "binary":
+        with open(path, "rb") as file:
+            while True:
+                chunk = np.fromfile(file, dtype=EDGE_DTYPE, count=chunk_size)
+                if len(chunk) == 0:
+                    return
+                yield chunk["u"], chunk["v"], chunk["w"].astype(np.float64)
+        return
+
+    if format not in ("csv", "tsv"):
+        raise ValueError(f"Unknown edge list format: {format}")
+
+    dtype = np.int64 if label_type is int else object
+    with open(path, newline="") as file:
+        reader = csv.reader(file, delimiter="," if format == "csv" else "\t")
+        if has_header:
+            next(reader, None)
+        sources, targets, weights = [], [], []
+        for row in reader:
+            if not row:
+                continue
+            sources.append(row[0])
+            targets.append(row[1])
+            weights.append(float(row[2]) if len(row) > 2 and row[2] != "" else default_weight)
+            if len(sources) == chunk_size:
+                yield np.array(sources, dtype=dtype), np.array(targets, dtype=dtype), np.array(weights)
+                sources, targets, weights = [], [], []
+        if sources:
+            yield np.array(sources, dtype=dtype), np.array(targets, dtype=dtype), np.array(weights)
+
+
+class LabelMap:
+    """
+    Arbitrary vertex labels (strings, ints, ...) -> dense ids 0..n-1, in order of first appearance.
+    labels[id] is the original label.
+
+    A chunk is remapped through its distinct labels only: np.unique, one dict lookup per distinct label,
+    then a vectorized gather back to every position.
+    """
+    def __init__(self) -> None:
+        self.ids = {}
+        self.labels = []
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def remap(self, labels: np.ndarray, add: bool = True) -> np.ndarray:
+        if len(labels) == 0:
+            return np.empty(0, dtype=np.int64)
+        distinct, first, inverse = np.unique(labels, return_index=True, return_inverse=True)
+
+        ids = self.ids
+        distinct_ids = np.empty(len(distinct), dtype=np.int64)
+        # new labels get ids in order of first appearance within the chunk
+        for k in np.argsort(first, kind="stable").tolist():
+            label = distinct[k].item() if isinstance(distinct[k], np.generic) else distinct[k]
+            id = ids.get(label)
+            if id is None:
+                if not add:
+                    raise KeyError(label)
+                id = ids[label] = len(self.labels)
+                self.labels.append(label)
+            distinct_ids[k] = id
+        return distinct_ids[inverse.reshape(-1)]
+
+
+def ingest_edges(path: str, format: str = None, dedupe: str = "min", chunk_size: int = 1 << 16,
+                 label_type=str, has_header: bool = False, default_weight: float = 1.0) -> tuple:
+    """
+    Builds a CSRGraph straight from an edge list file, without an Edge object per edge
+    and without knowing the number of vertices in advance.
+
+    Two passes over the file, each one chunk at a time (read_edge_chunks):
+        1. count: remap labels to dense ids (LabelMap), count the out-degree of every vertex,
+           prefix sums give the CSR offsets
+        2. fill:  read again, put every edge into the next free slot of its source, keeping file order
+    Then parallel edges u -> v are merged by the dedupe rule:
+        "min"  -> smallest weight, "sum" -> total weight, "last" -> weight of the last one in the file,
+        None   -> keep them all
+    After merging, the out-edges of each vertex are sorted by target; with None they stay in file order.
+
+    Memory is the CSR arrays (16 bytes per edge) plus the label map and one chunk.
+
+    Returns:
+        (csr, labels): labels[id] is the original label of vertex id
+
+    Time complexity:
+        - O(E log E) for the dedupe sort
+        - the two passes are O(E) NumPy work, plus one dict lookup per distinct label per chunk
+    """
+    if dedupe not in DEDUPE_RULES:
+        raise ValueError(f"Unknown dedupe rule: {dedupe}, expected one of {DEDUPE_RULES}")
+
+    def chunks():
+        return read_edge_chunks(path, format, chunk_size, label_type, has_header, default_weight)
+
+    # pass 1: labels and out-degrees
+    label_map = LabelMap()
+    degree = np.zeros(0, dtype=np.int64)
+    for sources, targets, _ in chunks():
+        # sources first, then targets, edge by edge: ids follow the order labels appear in the file
+        both = label_map.remap(np.column_stack((sources, targets)).reshape(-1))
+        u = both[0::2]
+        if len(label_map) > len(degree):
+            degree = np.concatenate((degree, np.zeros(len(label_map) - len(degree), dtype=np.int64)))
+        degree += np.bincount(u, minlength=len(degree))
+
+    N = len(label_map)
+    offsets = np.zeros(N + 1, dtype=np.int64)
+    np.cumsum(degree, out=offsets[1:])
+    num_edges = int(offsets[-1])
+    all_targets = np.empty(num_edges, dtype=np.int64)
+    all_weights = np.empty(num_edges, dtype=np.float64)
+
+    # pass 2: fill, stable within each source so file order is kept
+    cursor = offsets[:-1].copy()
+    for sources, targets, weights in chunks():
+        u = label_map.remap(sources, add=False)
+        v = label_map.remap(targets, add=False)
+        order = np.argsort(u, kind="stable")
+        u, v, weights = u[order], v[order], weights[order]
+        group_start = np.flatnonzero(np.concatenate(([True], u[1:] != u[:-1])))
+        rank = np.arange(len(u)) - np.repeat(group_start, np.diff(np.append(group_start, len(u))))
+        slots = cursor[u] + rank
+        all_targets[slots] = v
+        all_weights[slots] = weights
+        cursor += np.bincount(u, minlength=N)
+
+    if dedupe is not None:
+        offsets, all_targets, all_weights = _dedupe(offsets, all_targets, all_weights, dedupe)
+
+    csr = CSRGraph(_to_array('i', offsets), _to_array('i', all_targets), _to_array('d', all_weights))
+    return csr, label_map.labels
+
+
+def _dedupe(offsets: np.ndarray, targets: np.ndarray, weights: np.ndarray, rule: str) -> tuple:
+    N = len(offsets) - 1
+    rows = np.repeat(np.arange(N), np.diff(offsets))
+    # lexsort is stable, so within a (row, target) group the edges stay in file order
+    order = np.lexsort((targets, rows))
+    rows, targets, weights = rows[order], targets[order], weights[order]
+
+    if len(rows) == 0:
+        return offsets, targets, weights
+    starts = np.flatnonzero(np.concatenate(([True], (rows[1:] != rows[:-1]) | (targets[1:] != targets[:-1]))))
+    if rule == "min":
+        merged = np.minimum.reduceat(weights, starts)
+    elif rule == "sum":
+        merged = np.add.reduceat(weights, starts)
+    else:
+        ends = np.append(starts[1:], len(weights)) - 1
+        merged = weights[ends]
+
+    rows, targets = rows[starts], targets[starts]
+    offsets = np.zeros(N + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=N), out=offsets[1:])
+    return offsets, targets, merged
+
+
+def _to_array(typecode: str, data: np.ndarray) -> array:
+    # NumPy -> array.array in one copy, CSRGraph works on array('i') / array('d')
+    result = array(typecode)
+    result.frombytes(data.astype(np.int32 if typecode == 'i' else np.float64).tobytes())
+    return result
@@ -0,0 +1,104 @@
+import heapq
+import os
+import tempfile
+import numpy as np
+from union_find import UnionFind
+
+
+# binary edge record: u, v as little-endian int32, w as float64 (16 bytes)
+EDGE_DTYPE = np.dtype([("u", "<i4"), ("v", "<i4"), ("w", "<f8")])
+
+
+def external_kruskal(edges, num_vertices: int, chunk_size: int = 1 << 20, read_block: int = 1 << 16, temp_dir: str = None) -> tuple:
+    """
+    Kruskal's MST for edge lists that don't fit in memory, with an external merge sort.
+
+    1. Run formation: read chunk_size edges at a time, sort them by weight in memory (NumPy),
+       write each sorted run to a temporary binary file.
+    2. k-way merge: heapq.merge streams the runs in weight order, each run read back read_block edges at a time.
+    3. The merged stream goes straight into a UnionFind, and stops once num_vertices - 1 tree edges are found,
+       so the rest of the runs is never read.
+
+    At most chunk_size edges (sorting) or k * read_block edges (merging) are in memory at once,
+    plus the union-find (8 bytes per vertex) and the MST itself.
+
+    Args:
+        edges: an iterable of (u, v, w) tuples, or the path of a binary file of EDGE_DTYPE records (see write_edge_file)
+        temp_dir: where the sorted runs go, the system temp directory by default
+
+    Returns:
+        (mst, total_weight) like kruskal, mst being a list of (u, v, w)
+
+    Time complexity:
+        - O(E log E) comparisons, reading and writing every edge twice
+    """
+    with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+        runs = []
+        for chunk in _chunks(edges, chunk_size):
+            chunk.sort(order=["w", "u", "v"])
+            path = os.path.join(run_dir, f"run{len(runs)}.bin")
+            chunk.tofile(path)
+            runs.append(path)
+
+        files = [open(path, "rb") for path in runs]
+        try:
+            merged = heapq.merge(*(_read_run(file, read_block) for file in files))
+            return _kruskal_stream(merged, num_vertices)
+        finally:
+            for file in files:
+                file.close()
+
+
+def write_edge_file(path: str, edges, chunk_size: int = 1 << 20) -> None:
+    # write (u, v, w) tuples as EDGE_DTYPE records, chunk by chunk
+    with open(path, "wb") as file:
+        for chunk in _chunks(edges, chunk_size):
+            chunk.tofile(file)
+
+
+def _chunks(edges, chunk_size: int):
+    # EDGE_DTYPE arrays of at most chunk_size edges, from a file path or an iterable of tuples
+    if isinstance(edges, (str, os.PathLike)):
+        with open(edges, "rb") as file:
+            while True:
+                chunk = np.fromfile(file, dtype=EDGE_DTYPE, count=chunk_size)
+                if len(chunk) == 0:
+                    return
+                yield chunk
+        return
+
+    iterator = iter(edges)
+    while True:
+        chunk = np.fromiter(_take(iterator, chunk_size), dtype=EDGE_DTYPE)
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def _take(iterator, count: int):
+    for _, (u, v, w) in zip(range(count), iterator):
+        yield u, v, w
+
+
+def _read_run(file, read_block: int):
+    # (w, u, v) tuples of a sorted run, so heapq.merge compares by weight first
+    while True:
+        block = np.fromfile(file, dtype=EDGE_DTYPE, count=read_block)
+        if len(block) == 0:
+            return
+        yield from zip(block["w"].tolist(), block["u"].tolist(), block["v"].tolist())
+
+
+def _kruskal_stream(sorted_edges, num_vertices: int) -> tuple:
+    disjoint_set = UnionFind(num_vertices)
+    mst = []
+    total_weight = 0
+
+    for w, u, v in sorted_edges:
+        if disjoint_set.union(u, v):
+            mst.append((u, v, w))
+            total_weight += w
+            if len(mst) == num_vertices - 1:
+                break
+
+    return mst, total_weight
@@ -1,76 +1,98 @@
+import numpy as np
+from blocked_floyd_warshall import blocked_floyd_warshall
+
+
 class Graph:
     """
-    matrix: 2D list, tuple (distance, middleman)
+    dist_matrix: V x V float64 NumPy array, dist_matrix[i][j] is the shortest known distance from i to j
+    pred_matrix: V x V int32 NumPy array, pred_matrix[i][j] is the vertex right before j on that path (-1 if none)
     Example:
-        0    1    2    3
-    0   0    4    2    inf
-    1   4    0    3    inf
-    2   2    inf  0    2
-    3   inf  inf  2    0
+        dist_matrix                  pred_matrix
+            0    1    2    3             0    1    2    3
+        0   0    4    2    inf       0  -1    0    0   -1
+        1   4    0    3    inf       1   1   -1    1   -1
+        2   2    inf  0    2         2   2   -1   -1    2
+        3   inf  inf  2    0         3  -1   -1    3   -1
 
-    From self to self, the distance is 0, and the middleman is None
+    From self to self, the distance is 0, and the predecessor is -1
     Infinity means unreachable
     if there's a negative cycle, self.dist_matrix[i][i] will be negative
     """
-    def __init__(self, N: int) -> None: 
+    def __init__(self, N: int) -> None:
         self.num_vertices = N
-        # initialize dist_matrix, tuple (distance, middleman)
-        self.dist_matrix = [[(float('inf'), None)] * N for _ in range(N)]
-        
-        # initialize the distance from self to self as 0, and the middleman as None
-        for i in range(N):
-            self.dist_matrix[i][i] = (0, None)
+        # initialize dist_matrix with inf, and the distance from self to self as 0
+        self.dist_matrix = np.full((N, N), np.inf, dtype=np.float64)
+        np.fill_diagonal(self.dist_matrix, 0)
+
+        # no predecessor for any pair yet
+        self.pred_matrix = np.full((N, N), -1, dtype=np.int32)
 
     def add_edge(self, u_id: int, v_id: int, weight: int) -> None:
-        self.dist_matrix[u_id][v_id] = (weight, None)
+        self.dist_matrix[u_id][v_id] = weight
+        self.pred_matrix[u_id][v_id] = u_id
 
     def floyd_warshall(self):
         """
         Description:
             Find the shorest distance for each pair (no need source).
             Also able to check if there's a negative cycle in the graph (if there's a negative cycle, self.dist_matrix[i][i] will be negative).
-    
+
+            For each middle vertex k, all V^2 pairs are relaxed at once:
+                dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
+            as one broadcasted NumPy operation, and pred[i][j] becomes pred[k][j] wherever i -> k -> j wins.
+
         Time complexity:
-            O(V^3) where V is the no. of vertices in the graph
-        
+            O(V^3) where V is the no. of vertices in the graph, but only V steps run in Python
+
+        Aux space complexity:
+            O(V^2) for one reusable candidate matrix and mask
         """
+        dist = self.dist_matrix
+        pred = self.pred_matrix
+        through_k = np.empty_like(dist)
+        improved = np.empty(dist.shape, dtype=bool)
+
         for k in range(self.num_vertices):
-            for i in range(self.num_vertices):
-                for j in range(self.num_vertices):
-                    # if i to k to j is shorter than i to j directly
-                    if self.dist_matrix[i][j][0] > self.dist_matrix[i][k][0] + self.dist_matrix[k][j][0]:
-                        # update the distance and middleman
-                        self.dist_matrix[i][j] = (self.dist_matrix[i][k][0] + self.dist_matrix[k][j][0], k)
-
-    def get_path(self, i, j, path=None):
-        # initialize the path list
-        if path is None:
-            path = []
-        
-        # if the distance is infinity, it means i to j is unreachable, return empty list
-        if self.dist_matrix[i][j][0] == float('inf'):
+            # through_k[i][j] = dist[i][k] + dist[k][j]
+            np.add(dist[:, k, None], dist[k, None, :], out=through_k)
+            # if i to k to j is shorter than i to j directly
+            np.less(through_k, dist, out=improved)
+            # update the distance and predecessor (copy row k first, it may be updated itself)
+            np.copyto(dist, through_k, where=improved)
+            np.copyto(pred, pred[k].copy(), where=improved)
+
+    def floyd_warshall_blocked(self, tile_size: int = 256, workers: int = None):
+        """
+        Same result as floyd_warshall(), computed tile by tile on a process pool (see blocked_floyd_warshall).
+        Worth it from a few thousand vertices up.
+        """
+        blocked_floyd_warshall(self, tile_size, workers)
+
+    def has_negative_cycle(self) -> bool:
+        # only meaningful after floyd_warshall()
+        return bool((np.diagonal(self.dist_matrix) < 0).any())
+
+    def get_path(self, i, j):
+        # if the distance is infinity, it means i to j is unreachable
+        if self.dist_matrix[i][j] == np.inf:
             raise ValueError(f"{i} and {j} are unreachable")
-        
+
         # if i and j are the same, return the node i
         if i == j:
-            path.append(i)
-            return path
-
-        # get the middleman of the path from i to j
-        middleman = self.dist_matrix[i][j][1]
-        if middleman is None:
-            # if the path is empty or the last node is not i, add i to the path
-            if not path or path[-1] != i:
-                path.append(i)
-            path.append(j)
-            return path
-
-        # recursively get the path from i to middleman and from middleman to j
-        self.get_path(i, middleman, path)
-        self.get_path(middleman, j, path)
+            return [i]
+
+        # walk back from j over the predecessors of row i
+        path = [j]
+        current = j
+        while current != i:
+            current = int(self.pred_matrix[i][current])
+            if current == -1 or len(path) > self.num_vertices:
+                raise ValueError(f"No simple path from {i} to {j}, the graph has a negative cycle")
+            path.append(current)
 
+        path.reverse()
         return path
-    
+
     def display_matrix(self) -> None:
         for row in self.dist_matrix:
             print(row)
@@ -82,7 +104,7 @@ class Graph:
 def complex_test_case():
     print("Starting complex test case:")
     g = Graph(6)
-    
+
     # Add edges
     g.add_edge(0, 1, 4)
     g.add_edge(0, 2, 2)
@@ -93,34 +115,34 @@ def complex_test_case():
     g.add_edge(3, 4, 2)
     g.add_edge(3, 5, 6)
     g.add_edge(4, 5, 3)
-    
+
     print("Initial distance matrix:")
     g.display_matrix()
-    
+
     # Run Floyd-Warshall algorithm
     g.floyd_warshall()
-    
+
     print("\nDistance matrix after running Floyd-Warshall algorithm:")
     g.display_matrix()
-    
+
     # Test various paths
     test_paths = [(0, 5), (1, 4), (2, 5), (0, 3)]
     for start, end in test_paths:
         try:
             path = g.get_path(start, end)
-            distance = g.dist_matrix[start][end][0]
+            distance = g.dist_matrix[start][end]
             print(f"\nShortest path from {start} to {end}: {path}")
             print(f"Distance: {distance}")
         except ValueError as e:
             print(f"\nError: {e}")
-    
+
     # Test unreachable case
     g.add_edge(5, 0, float('inf'))
     try:
         path = g.get_path(5, 0)
     except ValueError as e:
         print(f"\nExpected error: {e}")
-    
+
     # Test negative cycle
     g_negative = Graph(3)
     g_negative.add_edge(0, 1, 1)
@@ -129,6 +151,8 @@ def complex_test_case():
     g_negative.floyd_warshall()
     print("\nDistance matrix of graph with negative cycle:")
     g_negative.display_matrix()
+    print("Negative cycle:", g_negative.has_negative_cycle())
 
 # Run complex test case
-complex_test_case()
\ No newline at end of file
+if __name__ == "__main__":
+    complex_test_case()
@@ -1,12 +1,50 @@
 from collections import deque
+import heapq
+import math
+import numpy as np
 from Edge import Edge
 from Vertex import Vertex
+from csr_graph import CSRGraph
+from delta_stepping import delta_stepping
+from dfs_events import dfs_events, preorder, topological_order, find_cycle, strongly_connected_components, articulation_points
+from direction_optimizing_bfs import direction_optimizing_bfs
+from multi_source import shortest_rows
+from incremental_topological_order import IncrementalTopologicalOrder
+from indexed_heap import IndexedMinHeap
+from monotone_queue import DialQueue, RadixHeap
+from query_state import QueryState
+from scc import Condensation
 
 class Graph:
     def __init__(self, N: int) -> None: 
+        # per-query distance / predecessor / visited / in_degree live in side arrays,
+        # each Vertex reads and writes them through its attributes
+        self.state = QueryState(N)
+        self.state.integer_distances = True
+
         self.vertices = [None] * N  
         for i in range(N):
-            self.vertices[i] = Vertex(i) 
+            self.vertices[i] = Vertex(i, self.state) 
+        self.state.vertices = self.vertices
+
+        # second state for the backward half of bidirectional search, created on first use
+        self.backward_state = None
+        # in-edges of each vertex, built on first use and dropped by add_edge
+        self.reverse_index = None
+        # optional (x, y) of each vertex, used by the A* straight-line heuristic
+        self.coordinates = None
+
+        # number of vertices settled by the last shortest_path call
+        self.settled_count = 0
+
+        # priority queue reused across queries, see priority_queue()
+        self.heap = None
+        self.heap_kind = None
+        self.heap_arity = 4
+
+        # weight profile, recorded by add_edge to pick the priority queue
+        self.integer_weights = True    # every weight so far is a non-negative int
+        self.max_weight = 0
 
     def add_edge(self, u_id: int, v_id: int, w=1) -> None:
         u = self.vertices[u_id]
@@ -14,73 +52,194 @@ class Graph:
         
         edge = Edge(u, v, w)
         u.add_edge(edge)
+        self.reverse_index = None
+
+        if not (isinstance(w, int) and w >= 0):
+            self.integer_weights = False
+        if not isinstance(w, int):
+            self.state.integer_distances = False
+        if w > self.max_weight:
+            self.max_weight = w
+
+    def set_coordinates(self, vertex_id: int, x: float, y: float) -> None:
+        if self.coordinates is None:
+            self.coordinates = [None] * len(self.vertices)
+        self.coordinates[vertex_id] = (x, y)
+
+    def reverse_edges(self) -> list:
+        """
+        Reverse adjacency index: reverse_edges()[v] is the list of edges (u, v) coming into v.
+        Built once in O(V+E) and cached until the next add_edge.
+        """
+        if self.reverse_index is None:
+            reverse_index = [[] for _ in range(len(self.vertices))]
+            for vertex in self.vertices:
+                for edge in vertex.edges:
+                    reverse_index[edge.v.id].append(edge)
+            self.reverse_index = reverse_index
+        return self.reverse_index
+
+    # largest edge weight for which Dial's buckets are used instead of a radix heap
+    DIAL_MAX_WEIGHT = 1024
+
+    def priority_queue(self):
+        """
+        The priority queue for Dijkstra, emptied. Picked from the weight profile recorded by add_edge:
+            - non-negative int weights up to DIAL_MAX_WEIGHT -> DialQueue (bucket per distance)
+            - larger non-negative int weights               -> RadixHeap
+            - anything else                                 -> IndexedMinHeap with arity self.heap_arity
+        The first two are monotone queues with amortized O(1) push / decrease_key.
+
+        Allocated once, then only cleared (O(entries left)), so short queries don't pay for the whole graph.
+        """
+        if self.integer_weights and self.max_weight <= self.DIAL_MAX_WEIGHT:
+            kind = ("dial", self.max_weight)
+        elif self.integer_weights:
+            kind = ("radix",)
+        else:
+            kind = ("heap", self.heap_arity)
+
+        if self.heap is None or self.heap_kind != kind:
+            if kind[0] == "dial":
+                self.heap = DialQueue(self.max_weight)
+            elif kind[0] == "radix":
+                self.heap = RadixHeap()
+            else:
+                self.heap = IndexedMinHeap(len(self.vertices), self.heap_arity)
+            self.heap_kind = kind
+        else:
+            self.heap.clear()
+        return self.heap
+
+    def freeze(self) -> CSRGraph:
+        """
+        Snapshot the graph into a read-only CSRGraph (flat offsets/targets/weights arrays).
+        Later add_edge calls are not reflected in the snapshot.
+
+        Time complexity:
+            - O(V+E)
+        """
+        return CSRGraph.from_graph(self)
     
     def dfs(self, start_vertex_id): # O(V+E)
+        """
+        Vertex ids in DFS visiting order from start_vertex_id, every one of them is marked visited.
+        Explicit stack (see dfs_events), so long paths don't hit the recursion limit.
+        """
         self.reset()  # 在DFS开始前重置访问状态
-        start_vertex = self.vertices[start_vertex_id]
-
-        return self.dfs_recursive(start_vertex)
+        return self.dfs_recursive(self.vertices[start_vertex_id])
 
     def dfs_recursive(self, start_vertex, traversal_result=None): # O(V+E)
+        """
+        Appends the ids DFS reaches from start_vertex to traversal_result and marks them visited,
+        skipping vertices already visited in the current query. Kept under its old name,
+        it runs on the explicit stack of dfs_events and doesn't recurse anymore.
+        """
         if traversal_result is None:
             traversal_result = []
-        
-        if not start_vertex.visited:
-            start_vertex.visited = True
-            traversal_result.append(start_vertex.id)
 
-            for edge in start_vertex.edges:  # 遍历当前顶点的所有边
-                neighbor = edge.v if edge.u == start_vertex else edge.u
-                if not neighbor.visited:
-                    self.dfs_recursive(neighbor, traversal_result)
+        state = self.state
+        if not state.is_visited(start_vertex.id):
+            def unvisited_neighbors(u):
+                return (v for v in self.neighbor_ids(u) if not state.is_visited(v))
+
+            for v in preorder(len(self.vertices), unvisited_neighbors, start_vertex.id):
+                state.set_visited(v)
+                traversal_result.append(v)
 
         return traversal_result
 
+    def neighbor_ids(self, u: int):
+        # ids of the out-neighbors of u, in add_edge order
+        return (edge.v.id for edge in self.vertices[u].edges)
+
+    def dfs_events(self, roots=None):
+        """
+        DFS as a generator of (event, u, v) tuples, see dfs_events.dfs_events.
+        """
+        return dfs_events(len(self.vertices), self.neighbor_ids, roots)
+
+    def find_cycle(self):
+        # a directed cycle as a list of vertex ids, None if the graph is a DAG
+        return find_cycle(len(self.vertices), self.neighbor_ids)
+
+    def strongly_connected_components(self) -> list:
+        # lists of vertex ids, in reverse topological order of the condensation
+        return strongly_connected_components(len(self.vertices), self.neighbor_ids)
+
+    def condensation(self) -> Condensation:
+        """
+        Component id of every vertex as a flat array, and the condensation DAG in topological order,
+        so graphs with cycles still get an order of their components. See scc.Condensation.
+
+        Time complexity:
+            - O(V+E), no recursion
+        """
+        return Condensation.from_graph(self)
+
+    def articulation_points(self) -> list:
+        # cut vertices, treating the graph as undirected (each edge added in both directions)
+        return articulation_points(len(self.vertices), self.neighbor_ids)
+
     def bfs_shortest_path(self, start_vertex_id): # O(V+E)
+        """
+        Vertices are marked when they are enqueued (distance set), so each vertex enters the queue once
+        and the queue never holds more than V vertices.
+        For hop distances from one source on a large graph, bfs_levels is faster.
+        """
         self.reset()
-        start_vertex = self.vertices[start_vertex_id]
-        start_vertex.distance = 0
-        discovered = deque([start_vertex])
+        state = self.state
+
+        state.set_distance(start_vertex_id, 0)
+        discovered = deque([start_vertex_id])
         traversal_result = []
 
         while discovered:
-            current_vertex = discovered.popleft()
-            if not current_vertex.visited:
-                current_vertex.visited = True
-                traversal_result.append([current_vertex.id, current_vertex.distance])
-
-                for edge in current_vertex.edges:
-                    neighbor = edge.v if edge.u == current_vertex else edge.u
-                    if not neighbor.visited:
-                        discovered.append(neighbor)
-
-                    new_distance = current_vertex.distance + 1
-                    if new_distance < neighbor.distance:
-                        neighbor.distance = new_distance
-                        neighbor.predecessor = current_vertex  # 更新前驱顶点
+            u = discovered.popleft()
+            state.set_visited(u)
+            current_distance = state.get_distance(u)
+            traversal_result.append([u, current_distance])
+
+            new_distance = current_distance + 1
+            for edge in self.vertices[u].edges:
+                v = edge.v.id
+                if new_distance < state.get_distance(v):
+                    state.relax(v, new_distance, u)  # 更新前驱顶点
+                    discovered.append(v)
 
         return traversal_result
 
     def bfs(self, start_vertex_id): # O(V+E)
         self.reset()
+        state = self.state
 
-        start_vertex = self.vertices[start_vertex_id]
-        discovered = deque([start_vertex]) # to store the vertices we will go thru it's edges later
+        state.set_visited(start_vertex_id)
+        discovered = deque([start_vertex_id]) # to store the vertices we will go thru it's edges later
         traversal_result = [] # to store the final path from start to end
 
         while discovered:
-            current_vertex = discovered.popleft() # each time we pop the leftmost vertex to explore it's edges if it's not visited
-            if not current_vertex.visited:
-                current_vertex.visited = True
-                traversal_result.append(current_vertex.id)
+            u = discovered.popleft() # each time we pop the leftmost vertex to explore it's edges
+            traversal_result.append(u)
 
-                for edge in current_vertex.edges:
-                    neighbor = edge.to_vertex if edge.from_vertex == current_vertex else edge.from_vertex
-                    if not neighbor.visited:
-                        discovered.append(neighbor)
+            for edge in self.vertices[u].edges:
+                v = edge.v.id
+                if not state.is_visited(v):
+                    # mark on enqueue, so no vertex is queued twice
+                    state.set_visited(v)
+                    discovered.append(v)
 
         return traversal_result
 
+    def bfs_levels(self, start_vertex_id: int) -> tuple:
+        """
+        Hop distance (level) and BFS parent of every vertex, as NumPy arrays (-1 when unreachable),
+        with the direction-optimizing BFS of direction_optimizing_bfs on a CSR snapshot.
+
+        Time Complexity:
+            - O(V+E)
+        """
+        return direction_optimizing_bfs(self.freeze(), start_vertex_id)
+
     def kahn_topological_sort_bfs(self):
         """
         Kahn's
@@ -93,7 +252,8 @@ class Graph:
             - O(V)
         """
 
-        self.reset()    # TC: O(V)
+        self.reset()    # TC: O(1)
+        state = self.state
 
         # to store the vertices we're going to process, those vertices have no imcoming edges
         start_vertices_stack = []   # SC: O(V)
@@ -104,11 +264,12 @@ class Graph:
         # go thru all edges (u,v), find out the number of incoming edges of Vertex v
         for vertex in self.vertices:   # TC: O(V+E)
             for edge in vertex.edges:
-                edge.v.in_degree += 1
+                v = edge.v.id
+                state.set_in_degree(v, state.get_in_degree(v) + 1)
         
         # 将所有入度为0的顶点加入栈
         for vertex in self.vertices:    # TC: O(V)
-            if vertex.in_degree == 0:
+            if state.get_in_degree(vertex.id) == 0:
                 start_vertices_stack.append(vertex)
 
         # if we still go unprocessed vertex
@@ -122,14 +283,15 @@ class Graph:
             # go thru all edges of this vertex
             for edge in current_vertex.edges:    # TC: O(E)
                 # find out the neighbor node of each edge
-                neighbor = edge.v
+                neighbor = edge.v.id
 
                 # delete its incomimg edge
-                neighbor.in_degree -= 1
+                in_degree = state.get_in_degree(neighbor) - 1
+                state.set_in_degree(neighbor, in_degree)
 
                 # if the neighbor node has no incoming edges after deleting, add it the process list
-                if neighbor.in_degree == 0:
-                    start_vertices_stack.append(neighbor)
+                if in_degree == 0:
+                    start_vertices_stack.append(edge.v)
 
         if len(topo_order) == len(self.vertices):
             return topo_order
@@ -138,35 +300,20 @@ class Graph:
         
     def dfs_topological_sort(self):
         """
-        Topological sort using DFS (经典的 DFS 拓扑排序)
-        """
-        # 用于存储拓扑排序的结果
-        stack = []
-
-        self.reset()
-
-        # 对每个未访问的节点执行 DFS
-        for vertex in self.vertices:
-            if not vertex.visited:
-                self.aux_dfs_topological_sort(vertex, stack)
+        Topological sort using DFS (经典的 DFS 拓扑排序): vertices by decreasing finishing time.
+        Raises ValueError if there is a cycle.
 
-        # 返回反转后的拓扑排序
-        return stack[::-1]
+        Time complexity:
+            - O(V+E), no recursion
+        """
+        return [self.vertices[v] for v in topological_order(len(self.vertices), self.neighbor_ids)]
 
-    def aux_dfs_topological_sort(self, vertex: Vertex, stack: list):
+    def incremental_topological_order(self) -> IncrementalTopologicalOrder:
         """
-        辅助 DFS 函数，用于递归访问节点
+        Topological order that is repaired locally as edges are added through its add_edge,
+        instead of re-running a full sort after every insert. See incremental_topological_order.py.
         """
-        # 标记当前节点为已访问
-        vertex.visited = True
-
-        # 递归访问所有邻居节点
-        for edge in vertex.edges:
-            if not edge.v.visited:
-                self.aux_dfs_topological_sort(edge.v, stack)
-
-        # 当前节点的所有邻居节点已访问，加入栈
-        stack.append(vertex)
+        return IncrementalTopologicalOrder(self)
 
     def dijkstra(self, start_id):
         """
@@ -176,324 +323,288 @@ class Graph:
         if the graph has negative weights, use bellman-ford algorithm
 
         Time Complexity:
-            - O((V+E) logV) with MinHeap.
+            - O((V+E) log_d V) with the indexed d-ary heap (d = self.heap_arity).
+            - O(V+E+V*C) with Dial's buckets / O(E + V logC) with a radix heap, for int weights up to C (see priority_queue())
         Analysis:
-            - Every vertex is possible to be pop out once -> O(V logV)
-            - Every edge is possible to be updated -> O(E logV)
-            - E is usually greater than V -> O((V+E) logV) -> O(E logV)
+            - Every vertex is pushed and popped once -> O(V d log_d V)
+            - Every edge is possible to decrease a key in place -> O(E log_d V)
+            - E is usually greater than V -> O(E log_d V)
+            - reset() is O(1), so only the reached vertices are ever written
         """
         self.reset()
+        state = self.state
 
-        start_vertex = self.vertices[start_id]
-        start_vertex.distance = 0       
+        state.set_distance(start_id, 0)
 
-        priority_queue = MinHeap(len(self.vertices))
-        priority_queue.insert((0, start_vertex.id, start_vertex))  # O(logV)
+        priority_queue = self.priority_queue()
+        priority_queue.push(start_id, 0)  # O(log_d V)
 
         while not priority_queue.is_empty():
-            current_distance, _, current_vertex = priority_queue.extract_min()  # O(logV)
-
-            if current_vertex.visited:
-                continue
-            current_vertex.visited = True
+            u, current_distance = priority_queue.pop()  # O(d log_d V)
+            state.set_visited(u)
             
-            for edge in current_vertex.edges:
-                neighbor = edge.v
-                if not neighbor.visited:
+            for edge in self.vertices[u].edges:
+                v = edge.v.id
+                if not state.is_visited(v):
                     new_distance = current_distance + edge.w
 
-                    if new_distance < neighbor.distance:
-                        neighbor.distance = new_distance
-                        neighbor.predecessor = current_vertex  
-                        priority_queue.insert((new_distance, neighbor.id, neighbor))  # O(logV)
-                else:
-                    if neighbor.distance > current_distance + edge.w:
-                        priority_queue.update((new_distance, neighbor.id, neighbor)) # O(logV)
-
-    def backtracking(self, target_id: int) -> list: 
-        path = []
-        if self.vertices[target_id] is None:
-            raise ValueError("no path found")
-
-        current_vertex = self.vertices[target_id]
-
-        # Backtrack based on whether it's from the start or the destination
-        while current_vertex is not None: # O(L)
-            path.append(current_vertex.id)
-            current_vertex = current_vertex.predecessor
-        
-        path.reverse() # O(V)
-        return path
-    
-    def reset(self):
-        for vertex in self.vertices:
-            vertex.distance = float('inf')
-            vertex.previous = None
-            vertex.visited = False
-            vertex.in_degree = 0
-
-    def display_distances(self):
-        for vertex in self.vertices:
-            print(f"Distance from start to {vertex.id}: {vertex.distance}")
-
+                    if new_distance < state.get_distance(v):
+                        state.relax(v, new_distance, u)
+                        priority_queue.push_or_decrease(v, new_distance)  # O(log_d V), at most one entry per vertex
 
-class MinHeap:
-    """
-    Class description:
-    This class implements a MinHeap (also known as a priority queue) which supports insertions, extraction of the minimum element, and updating of elements. 
-    The heap is built using a list, and each element in the heap consists of a tuple containing the priority value, vertex ID, and a reference to the vertex object. 
-    The position of each vertex in the heap is tracked using a position map, which allows for efficient updates.
-    
-    Methods:
-    - __init__(max_size): Initializes the MinHeap with a maximum size and initializes an empty heap and position map.
-    - insert(key): Inserts a new element into the heap.
-    - extract_min(): Removes and returns the minimum element from the heap.
-    - update(key): Updates the position of an existing element in the heap.
-    - rise(index): Maintains heap property by performing a "rise" operation (also called heapify-up).
-    - sink(index): Maintains heap property by performing a "sink" operation (also called heapify-down).
-    - _swap(i, j): Swaps two elements in the heap and updates their positions in the position map.
-    - is_empty(): Checks if the heap is empty.
-    """
-    def __init__(self, max_size: int) -> None:
-        """
-        Function description:
-        Initializes the MinHeap with the given maximum size. An empty heap and a position map are created.
-        
-        :Input:
-            max_size: The maximum number of elements that can be stored in the heap.
-        
-        :Output, return or postcondition:
-            Initializes the heap and a position map, ready for storing elements.
-
-        :Time complexity:
-            O(1)
-
-        :Time complexity analysis:
-            The initialization involves setting up an empty list and a position map, both of which are direct allocations that take constant time.
-
-        :Aux space complexity:
-            O(n), where n is the maximum size of the heap.
-
-        :Aux space complexity analysis:
-            Space is allocated for the heap and the position map, both of which are proportional to the maximum number of elements.
+    def dijkstra_many(self, sources, targets=None, workers: int = None, as_matrix: bool = True):
         """
-        self.heap = []
-        self.position_map = [-1] * max_size  # Initializes position map with -1, this is for update operation
-        self.max_size = max_size
+        Distances from every source, without touching this graph's query state.
 
-    def insert(self, key: tuple) -> None:
-        """
-        Function description:
-        Inserts a new element into the heap and maintains the heap property.
-        
-        :Input:
-            key: A tuple containing (priority, vertex ID, vertex object).
-        
-        :Output, return or postcondition:
-            Inserts the key into the heap while maintaining the heap property.
-        
-        :Time complexity:
-            O(log n), where n is the number of elements in the heap.
+        One CSR snapshot is shared by a process pool (sent to each worker once), and every worker
+        runs Dijkstra from its share of the sources, see multi_source.shortest_rows.
 
-        :Time complexity analysis:
-            After appending the element to the end of the heap, the `rise` function is called to ensure the heap property is maintained, which operates in logarithmic time.
+        Args:
+            targets: vertex ids to keep (all vertices by default), each search stops once they are all settled
+            workers: number of processes, None for os.cpu_count(), 1 to run in this process
+            as_matrix: True for a float64 matrix M[i, j] = distance from sources[i] to targets[j],
+                       False for a generator of (source, array('d') row), so only one row is in memory at a time
 
-        :Aux space complexity:
-            O(1)
-
-        :Aux space complexity analysis:
-            only two temporary variables are used to store the index and vertex ID during the insertion process.
+        Time Complexity:
+            - O(S (V+E) log_d V) work for S sources, divided over the workers
         """
-        self.heap.append(key) # O(1)
-        index = len(self.heap) - 1
-        vertex_id = key[2].id
-        self.position_map[vertex_id] = index
-        self.rise(index) # O(log n)
-
-    def extract_min(self) -> tuple:
+        sources = list(sources)
+        if targets is not None:
+            targets = list(targets)
+        rows = shortest_rows(self.freeze(), sources, targets, workers)
+        if not as_matrix:
+            return rows
+
+        width = len(self.vertices) if targets is None else len(targets)
+        matrix = np.empty((len(sources), width))
+        for i, (_, row) in enumerate(rows):
+            matrix[i] = row
+        return matrix
+
+    def delta_stepping(self, start_id: int, delta: float = None, workers: int = None) -> None:
         """
-        Function description:
-        Removes and returns the minimum element (i.e., the element with the smallest priority) from the heap.
-        
-        :Input:
-            None
-        
-        :Output, return or postcondition:
-            Returns the minimum element from the heap.
-        
-        :Time complexity:
-            O(log n), where n is the number of elements in the heap.
-
-        :Time complexity analysis:
-            After removing the root, the last element is moved to the root and the `sink` function is called to restore the heap property, which takes logarithmic time.
+        Same result as dijkstra(start_id) (distances and predecessors in the query state, so backtracking works),
+        computed with delta-stepping on a CSR snapshot: whole buckets of vertices are relaxed at once,
+        spread over worker processes. Worth it on large graphs, see delta_stepping.delta_stepping;
+        graphs below its parallel_threshold are solved in this process without starting a pool.
 
-        :Aux space complexity:
-            O(1)
-
-        :Aux space complexity analysis:
-            No additional space is used apart from temporary variables to store elements during the extraction process.
+        Time Complexity:
+            - O(V+E) per bucket phase, plus O(V+E) for the snapshot and O(V) to copy the result back
         """
-        if len(self.heap) == 0:
-            return None
-        if len(self.heap) == 1:
-            min_element = self.heap.pop()
-            self.position_map[min_element[2].id] = -1
-            return min_element
+        distance, predecessor = delta_stepping(self.freeze(), start_id, delta, workers)
 
-        root = self.heap[0]
-        last_element = self.heap.pop()
-        self.heap[0] = last_element
-        self.position_map[last_element[2].id] = 0
-        self.position_map[root[2].id] = -1
-        self.sink(0)
-        return root
+        self.reset()
+        state = self.state
+        for v in range(len(self.vertices)):
+            if distance[v] != math.inf:
+                state.relax(v, float(distance[v]), int(predecessor[v]))
+                state.set_visited(v)
 
-    def update(self, key: tuple) -> None:
+    def shortest_path(self, source: int, target: int, method: str = "dijkstra", heuristic=None) -> float:
         """
-        Function description:
-        Updates the position of an element in the heap by reordering it.
-        
-        :Input:
-            key: A tuple containing (priority, vertex ID, vertex object).
-        
-        :Output, return or postcondition:
-            Updates the position of the element in the heap while maintaining the heap property.
-        
-        :Time complexity:
-            O(log n), where n is the number of elements in the heap.
+        Point-to-point shortest path from source to target, only works for non-negative weights.
+        Returns the distance (inf if unreachable), the path is available with backtracking(target).
 
-        :Time complexity analysis:
-            Both the `rise` and `sink` operations are called to ensure the heap property, each taking logarithmic time.
+        Methods:
+            - "dijkstra": stops as soon as target is settled instead of settling the whole graph
+            - "bidirectional": searches forward from source and backward from target (over
+              reverse_edges()) at the same time, stops when the two frontiers can't improve the best meeting point
+            - "astar": expands vertices by distance + heuristic(vertex_id, target), heuristic must never
+              overestimate the remaining distance. If heuristic is None, the straight-line distance between
+              coordinates (see set_coordinates) is used
 
-        :Aux space complexity:
-            O(1)
+        The number of settled vertices is kept in self.settled_count.
 
-        :Aux space complexity analysis:
-            No additional space is used beyond temporary variables to store an index and vertex ID which are integral values.
+        Time Complexity:
+            - O((V+E) logV) in the worst case, but only the region around source (and target) is explored
         """
-        vertex_id = key[2].id
-        index = self.position_map[vertex_id]
-        self.heap[index] = key
-        self.rise(index)
-        self.sink(index)
+        if method == "dijkstra":
+            return self._dijkstra_to(source, target)
+        elif method == "bidirectional":
+            return self._bidirectional_dijkstra(source, target)
+        elif method == "astar":
+            if heuristic is None:
+                heuristic = self.euclidean_heuristic()
+            return self._astar(source, target, heuristic)
+        else:
+            raise ValueError(f"Unknown shortest path method: {method}")
 
-    def rise(self, index: int) -> None:
+    def euclidean_heuristic(self):
         """
-        Function description:
-        Moves an element up in the heap until the heap property is restored.
-        
-        :Input:
-            index: The index of the element to move up.
-        
-        :Output, return or postcondition:
-            The element is moved up in the heap to restore the heap property.
-        
-        :Time complexity:
-            O(log n), where n is the number of elements in the heap.
+        Straight-line distance between vertex coordinates. Only admissible if every edge weight is
+        at least the straight-line length of the edge. Every vertex needs coordinates, checked up front
+        so a missing one is a ValueError instead of a failure in the middle of a search.
+        """
+        if self.coordinates is None:
+            raise ValueError("No coordinates set, use set_coordinates() or pass a heuristic")
+        coordinates = self.coordinates
+        missing = [v for v, point in enumerate(coordinates) if point is None]
+        if missing:
+            raise ValueError(f"No coordinates for vertices {missing[:10]}, set them all or pass a heuristic")
 
-        :Time complexity analysis:
-            The `rise` function compares the element with its parent and swaps them if necessary, potentially traversing up to the root of the heap (logarithmic time).
+        def heuristic(u: int, target: int) -> float:
+            (x1, y1), (x2, y2) = coordinates[u], coordinates[target]
+            return math.hypot(x1 - x2, y1 - y2)
 
-        :Aux space complexity:
-            O(1)
+        return heuristic
 
-        :Aux space complexity analysis:
-            No additional space is used beyond temporary variables to store indices.
-        """
-        parent_index = (index - 1) // 2
-        while index > 0 and self.heap[index][0] < self.heap[parent_index][0]:
-            self._swap(index, parent_index)
-            index = parent_index
-            parent_index = (index - 1) // 2
+    def _dijkstra_to(self, source: int, target: int) -> float:
+        self.reset()
+        state = self.state
+        settled = 0
 
-    def sink(self, index: int) -> None:
-        """
-        Function description:
-        Moves an element down in the heap until the heap property is restored.
-        
-        :Input:
-            index: The index of the element to move down.
-        
-        :Output, return or postcondition:
-            The element is moved down in the heap to restore the heap property.
-        
-        :Time complexity:
-            O(log n), where n is the number of elements in the heap.
+        state.set_distance(source, 0)
+        priority_queue = self.priority_queue()
+        priority_queue.push(source, 0)
 
-        :Time complexity analysis:
-            The `sink` function compares the element with its children and swaps them if necessary, potentially traversing down to the leaves of the heap (logarithmic time).
+        while not priority_queue.is_empty():
+            u, current_distance = priority_queue.pop()
+            state.set_visited(u)
+            settled += 1
 
-        :Aux space complexity:
-            O(1)
+            # target is settled, its distance can't improve any more
+            if u == target:
+                break
 
-        :Aux space complexity analysis:
-            No additional space is used beyond temporary variables to store indices.
-        """
-        smallest = index
-        left_child_index = 2 * index + 1
-        right_child_index = 2 * index + 2
+            for edge in self.vertices[u].edges:
+                v = edge.v.id
+                new_distance = current_distance + edge.w
+                if new_distance < state.get_distance(v):
+                    state.relax(v, new_distance, u)
+                    priority_queue.push_or_decrease(v, new_distance)
 
-        if left_child_index < len(self.heap) and self.heap[left_child_index][0] < self.heap[smallest][0]:
-            smallest = left_child_index
+        self.settled_count = settled
+        return state.get_distance(target)
 
-        if right_child_index < len(self.heap) and self.heap[right_child_index][0] < self.heap[smallest][0]:
-            smallest = right_child_index
+    def _astar(self, source: int, target: int, heuristic) -> float:
+        self.reset()
+        state = self.state
+        settled = 0
+
+        state.set_distance(source, 0)
+        # Format of each entry: (distance + heuristic, distance, vertex id)
+        priority_queue = [(heuristic(source, target), 0, source)]
+
+        while priority_queue:
+            _, current_distance, u = heapq.heappop(priority_queue)
+            # outdated entry, u has been reached with a shorter distance since
+            # (an admissible but inconsistent heuristic may reopen a vertex, so no visited check here)
+            if current_distance > state.get_distance(u):
+                continue
+            settled += 1
 
-        if smallest != index:
-            self._swap(index, smallest)
-            self.sink(smallest)
+            if u == target:
+                break
 
-    def _swap(self, i: int, j: int) -> None:
-        """
-        Function description:
-        Swaps two elements in the heap and updates their positions in the position map.
-        
-        :Input:
-            i: Index of the first element.
-            j: Index of the second element.
-        
-        :Output, return or postcondition:
-            Swaps the two elements and updates their positions in the position map.
-        
-        :Time complexity:
-            O(1)
+            for edge in self.vertices[u].edges:
+                v = edge.v.id
+                new_distance = current_distance + edge.w
+                if new_distance < state.get_distance(v):
+                    state.relax(v, new_distance, u)
+                    heapq.heappush(priority_queue, (new_distance + heuristic(v, target), new_distance, v))
 
-        :Time complexity analysis:
-            The swapping operation takes constant time, as it involves a direct exchange of elements in the array.
+        self.settled_count = settled
+        return state.get_distance(target)
 
-        :Aux space complexity:
-            None
+    def _bidirectional_dijkstra(self, source: int, target: int) -> float:
+        self.reset()
+        if self.backward_state is None:
+            self.backward_state = QueryState(len(self.vertices))
+        self.backward_state.new_query()
+
+        # in the backward state, "predecessor" is the next vertex on the way to target
+        forward, backward = self.state, self.backward_state
+        reverse_index = self.reverse_edges()
+        settled = 0
+
+        forward.set_distance(source, 0)
+        backward.set_distance(target, 0)
+        forward_queue = [(0, source)]
+        backward_queue = [(0, target)]
+
+        # best known source -> meet -> target distance
+        best = 0 if source == target else float('inf')
+        meet = source if source == target else -1
+
+        while forward_queue and backward_queue:
+            # no path through an unsettled vertex can be shorter than both queue tops together
+            if forward_queue[0][0] + backward_queue[0][0] >= best:
+                break
+
+            # expand the side with the smaller frontier distance
+            if forward_queue[0][0] <= backward_queue[0][0]:
+                current_distance, u = heapq.heappop(forward_queue)
+                if forward.is_visited(u):
+                    continue
+                forward.set_visited(u)
+                settled += 1
+
+                for edge in self.vertices[u].edges:
+                    v = edge.v.id
+                    new_distance = current_distance + edge.w
+                    if new_distance < forward.get_distance(v):
+                        forward.relax(v, new_distance, u)
+                        heapq.heappush(forward_queue, (new_distance, v))
+
+                    candidate = new_distance + backward.get_distance(v)
+                    if candidate < best:
+                        best, meet = candidate, v
+            else:
+                current_distance, u = heapq.heappop(backward_queue)
+                if backward.is_visited(u):
+                    continue
+                backward.set_visited(u)
+                settled += 1
+
+                for edge in reverse_index[u]:
+                    v = edge.u.id
+                    new_distance = current_distance + edge.w
+                    if new_distance < backward.get_distance(v):
+                        backward.relax(v, new_distance, u)
+                        heapq.heappush(backward_queue, (new_distance, v))
 
-        :Aux space complexity analysis:
-            No additional space is used.
-        """
-        self.position_map[self.heap[i][2].id], self.position_map[self.heap[j][2].id] = j, i
-        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+                    candidate = forward.get_distance(v) + new_distance
+                    if candidate < best:
+                        best, meet = candidate, v
 
-    def is_empty(self) -> bool:
-        """
-        Function description:
-        Checks if the heap is empty.
+        self.settled_count = settled
+        if meet == -1:
+            return float('inf')
 
-        :Input:
-            None.
+        # stitch the backward half into the forward predecessors, so backtracking(target) sees the whole path
+        current = meet
+        following = backward.get_predecessor(current)
+        while following != -1:
+            forward.relax(following, best - backward.get_distance(following), current)
+            current = following
+            following = backward.get_predecessor(current)
 
-        :Output, return or postcondition:
-            Returns True if the heap is empty, False otherwise.
+        return best
 
-        :Time complexity:
-            O(1)
+    def backtracking(self, target_id: int) -> list: 
+        path = []
+        if self.vertices[target_id] is None:
+            raise ValueError("no path found")
 
-        :Time complexity analysis:
-            Checking the length of the list is a constant time operation.
+        # Backtrack based on whether it's from the start or the destination
+        current = target_id
+        while current != -1: # O(L)
+            path.append(current)
+            current = self.state.get_predecessor(current)
+        
+        path.reverse() # O(V)
+        return path
+    
+    def reset(self):
+        """
+        Start a new query. O(1): the per-vertex state is only cleared lazily when a vertex is first touched.
+        """
+        self.state.new_query()
 
-        :Aux space complexity:
-            None
+    def display_distances(self):
+        for vertex in self.vertices:
+            print(f"Distance from start to {vertex.id}: {vertex.distance}")
 
-        :Aux space complexity analysis:
-            No additional space is used.
-        """
-        return len(self.heap) == 0
 
 # 测试代码放在 __name__ == "__main__" 下
 if __name__ == "__main__":
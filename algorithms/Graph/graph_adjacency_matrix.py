@@ -1,140 +1,193 @@
-import heapq
 from collections import deque
-from Edge import Edge
+import numpy as np
 from Vertex import Vertex
 
 class Graph:
-    def __init__(self, N: int) -> None: 
+    """
+    Adjacency matrix graph backed by NumPy.
+
+    weighted=True  -> adj_matrix is an N x N float64 array, adj_matrix[i][j] = weight of edge i -> j,
+                      inf means no edge (so weight 0 is a real edge)
+    weighted=False -> adj_bits is an N x ceil(N/8) uint8 array, bit j of row i is set if there is an edge i -> j
+                      (1 bit per cell instead of 8 bytes), every edge has weight 1
+
+    Vertex ids can be any hashable labels (0..N-1 by default), index maps an id to its row / column.
+    Every algorithm scans a whole row at once with NumPy instead of looping over V cells in Python.
+    """
+    def __init__(self, N: int, ids=None, weighted: bool = True) -> None:
         # 初始化 N 个顶点
+        if ids is None:
+            ids = range(N)
+        ids = list(ids)
+        if len(ids) != N:
+            raise ValueError("Expected one id per vertex")
+
         self.num_vertices = N
-        self.vertices = [None] * N  
-        for i in range(N):
-            self.vertices[i] = Vertex(i)
-            
-        # 初始化一个 N*N 的邻接矩阵，所有的权重默认为 0（无边）
-        self.adj_matrix = [[[float('inf')] for _ in range(N)] for _ in range(N)]
-
-    def add_edge(self, u_id: int, v_id: int, weight: int = 1) -> None:
-        # 检查 u_id 和 v_id 是否有效
-        if u_id >= self.num_vertices or v_id >= self.num_vertices:
-            raise IndexError("Vertex ID out of range.")
-        
-        # 在邻接矩阵中为边 (u_id, v_id) 设置权重
-        self.adj_matrix[u_id][v_id] = weight
-    
-    def get_edge_weight(self, u_id: int, v_id: int) -> int:
-        # 返回指定边的权重
-        if u_id >= self.num_vertices or v_id >= self.num_vertices:
-            raise IndexError("Vertex ID out of range.")
-        
-        return self.adj_matrix[u_id][v_id]
+        self.vertices = [Vertex(id) for id in ids]
+        self.index = {id: i for i, id in enumerate(ids)}   # id -> row / column, O(1) lookup
+        if len(self.index) != N:
+            raise ValueError("Vertex ids must be unique")
+
+        self.weighted = weighted
+        if weighted:
+            # 初始化一个 N*N 的邻接矩阵，所有的权重默认为 inf（无边）
+            self.adj_matrix = np.full((N, N), np.inf)
+        else:
+            self.adj_bits = np.zeros((N, (N + 7) // 8), dtype=np.uint8)
+
+    def add_edge(self, u_id, v_id, weight=1) -> None:
+        i, j = self._index_of(u_id), self._index_of(v_id)
+        if self.weighted:
+            # 在邻接矩阵中为边 (u_id, v_id) 设置权重
+            self.adj_matrix[i, j] = weight
+        else:
+            self.adj_bits[i, j >> 3] |= np.uint8(0x80 >> (j & 7))
+
+    def get_edge_weight(self, u_id, v_id) -> float:
+        # 返回指定边的权重, inf if there is no edge
+        i, j = self._index_of(u_id), self._index_of(v_id)
+        if self.weighted:
+            return float(self.adj_matrix[i, j])
+        return 1.0 if self.adj_bits[i, j >> 3] & (0x80 >> (j & 7)) else float('inf')
+
+    def row_mask(self, i: int) -> np.ndarray:
+        # bool array, True at the indices that row i has an edge to
+        if self.weighted:
+            return self.adj_matrix[i] != np.inf
+        return np.unpackbits(self.adj_bits[i], count=self.num_vertices).astype(bool)
+
+    def weight_row(self, i: int) -> np.ndarray:
+        # weights of the edges out of row i, inf where there is none
+        if self.weighted:
+            return self.adj_matrix[i]
+        return np.where(self.row_mask(i), 1.0, np.inf)
+
+    def weight_matrix(self) -> np.ndarray:
+        # the full float matrix, unpacked for an unweighted graph
+        if self.weighted:
+            return self.adj_matrix
+        bits = np.unpackbits(self.adj_bits, axis=1, count=self.num_vertices).astype(bool)
+        return np.where(bits, 1.0, np.inf)
 
     def display_matrix(self) -> None:
         # 显示邻接矩阵
-        for row in self.adj_matrix:
-            print(row)
+        print(self.weight_matrix())
 
     def dfs(self, start_vertex_id):
+        """
+        Time Complexity:
+            - O(V^2), one row scan per vertex, with an explicit stack instead of recursion
+        """
         self.reset_visits()  # 在DFS开始前重置访问状态
-        start_vertex = self.get_vertex(start_vertex_id) # get_vertex() returns a tuple (index, vertex)
-        return self.dfs_recursive(start_vertex)
-
-    def dfs_recursive(self, start_vertex, traversal_result=None):
-        if traversal_result is None:
-            traversal_result = []
-
-        # start_vertex is a tuple (index, vertex), so start_vertex[0] is the index, start_vertex[1] is the vertex object
-        start_vertex_idex = start_vertex[0]
-        start_vertex_object = start_vertex[1]
-
-        if not start_vertex_object.visited:
-            start_vertex_object.visited = True
-            traversal_result.append(start_vertex_object.id)
+        visited = np.zeros(self.num_vertices, dtype=bool)
+        start = self._index_of(start_vertex_id)
+
+        visited[start] = True
+        traversal_result = [self.vertices[start].id]
+        # (index, its neighbor indices, position of the next neighbor to try)
+        stack = [(start, np.flatnonzero(self.row_mask(start)), 0)]
+
+        while stack:
+            i, neighbors, position = stack[-1]
+            while position < len(neighbors) and visited[neighbors[position]]:
+                position += 1
+            if position == len(neighbors):
+                stack.pop()
+                continue
 
-            for i in range(len(self.vertices)):
-                if self.adj_matrix[start_vertex_idex][i] != 0:
-                    self.dfs_recursive((i, self.vertices[i]), traversal_result)
+            stack[-1] = (i, neighbors, position + 1)
+            j = int(neighbors[position])
+            visited[j] = True
+            traversal_result.append(self.vertices[j].id)
+            stack.append((j, np.flatnonzero(self.row_mask(j)), 0))
 
+        self._write_visits(visited)
         return traversal_result
 
     def bfs_shortest_path(self, start_vertex_id):
+        """
+        Time Complexity:
+            - O(V^2), one vectorized row scan per vertex
+        """
         self.reset_visits()
-
-        start_vertex = self.get_vertex(start_vertex_id)[1]  
-
-        start_vertex.distance = 0
-        discovered = deque([start_vertex])
+        self.reset_distances()
+        N = self.num_vertices
+        visited = np.zeros(N, dtype=bool)
+        distance = np.full(N, np.inf)
+        previous = np.full(N, -1, dtype=np.int64)
+
+        start = self._index_of(start_vertex_id)
+        visited[start] = True
+        distance[start] = 0
+        discovered = deque([start])
         traversal_result = []
 
         while discovered:
-            current_vertex = discovered.popleft()
-            current_vertex_index = self.get_vertex(current_vertex.id)[0]
-
-            if not current_vertex.visited:
-                current_vertex.visited = True
-                traversal_result.append([current_vertex.id, current_vertex.distance])
-
-                for i in range(len(self.vertices)):
-                    if self.adj_matrix[current_vertex_index][i] != 0:
-                        neighbor = self.vertices[i] 
-                        
-                        if not neighbor.visited:
-                            discovered.append(neighbor)
-                            
-
-                        new_distance = current_vertex.distance + 1
-                        if new_distance < neighbor.distance:
-                            neighbor.distance = new_distance
-                            neighbor.previous = current_vertex  # 更新前驱顶点
-
+            i = discovered.popleft()
+            traversal_result.append([self.vertices[i].id, int(distance[i])])
+
+            # unvisited neighbors, all marked at once so none is queued twice
+            new = np.flatnonzero(self.row_mask(i) & ~visited)
+            visited[new] = True
+            distance[new] = distance[i] + 1
+            previous[new] = i  # 更新前驱顶点
+            discovered.extend(new.tolist())
+
+        self._write_visits(visited)
+        self._write_distances(distance, previous)
         return traversal_result
 
     def bfs(self, start_vertex_id):
         """
         Time Complexity:
-            - O(V^2) cuz we need to go thru the entire matrix
+            - O(V^2) cuz we need to go thru the entire matrix, but each row is one vectorized scan
         """
         self.reset_visits()
+        visited = np.zeros(self.num_vertices, dtype=bool)
 
-        start_vertex = self.get_vertex(start_vertex_id)[1]  
-
-        discovered = deque([start_vertex])
+        start = self._index_of(start_vertex_id)
+        visited[start] = True
+        discovered = deque([start])
         traversal_result = []
 
         while discovered: # O(V) cuz we need to check every vertex
-            current_vertex = discovered.popleft()
-            current_vertex_index = self.get_vertex(current_vertex.id)[0]
-
-            if not current_vertex.visited:
-                current_vertex.visited = True
-                traversal_result.append(current_vertex.id)
+            i = discovered.popleft()
+            traversal_result.append(self.vertices[i].id)
 
-                for i in range(len(self.vertices)): # O(V) cuz we need to thru the row of this vertex to check how many 1s
-                    if self.adj_matrix[current_vertex_index][i] != 0:
-                        neighbor = self.vertices[i] 
-                        if not neighbor.visited:
-                            discovered.append(neighbor)
+            # the whole row at once, instead of checking V cells one by one
+            new = np.flatnonzero(self.row_mask(i) & ~visited)
+            visited[new] = True
+            discovered.extend(new.tolist())
 
+        self._write_visits(visited)
         return traversal_result
 
     def kahn_topological_sort(self):
+        """
+        Returns vertex ids in topological order, None if there is a cycle.
+
+        Time Complexity:
+            - O(V^2), in-degrees are column counts and each removed vertex updates its row in one step
+        """
         self.reset_visits()
-        
-        start_vertices = deque([v for v in self.vertices if v.in_degree == 0])
+        if self.weighted:
+            in_degree = np.count_nonzero(self.adj_matrix != np.inf, axis=0)
+        else:
+            in_degree = np.unpackbits(self.adj_bits, axis=1, count=self.num_vertices).sum(axis=0, dtype=np.int64)
+
+        start_vertices = deque(np.flatnonzero(in_degree == 0).tolist())
         topo_order = []
 
         while start_vertices:
-            current_vertex = start_vertices.popleft()
-            current_vertex_index = self.get_vertex(current_vertex.id)[0]
-            topo_order.append(current_vertex.id)
-            
-            for i in range(len(self.vertices)):
-                if self.adj_matrix[current_vertex_index][i] != 0:
-                    neighbor = self.vertices[i]            
-                    neighbor.in_degree -= 1
-
-                    if neighbor.in_degree == 0:
-                        start_vertices.append(neighbor)
+            i = start_vertices.popleft()
+            topo_order.append(self.vertices[i].id)
+
+            neighbors = np.flatnonzero(self.row_mask(i))
+            in_degree[neighbors] -= 1
+            start_vertices.extend(neighbors[in_degree[neighbors] == 0].tolist())
+
+        for vertex, degree in zip(self.vertices, in_degree.tolist()):
+            vertex.in_degree = degree
 
         if len(topo_order) == len(self.vertices):
             return topo_order
@@ -144,39 +197,44 @@ class Graph:
     def dijkstra(self, start_id):
         """
         Time Complexity:
-            - O(V^2) cuz we need to go thru the entire matrix
-        
+            - O(V^2): V steps, each an argmin over the unsettled vertices and a vectorized relaxation of one row.
+              No heap needed, which is the best possible on a dense graph.
         """
         self.reset_visits() # O(V)
         self.reset_distances() # O(V)
+        N = self.num_vertices
+        distance = np.full(N, np.inf)
+        previous = np.full(N, -1, dtype=np.int64)
+        settled = np.zeros(N, dtype=bool)
+        distance[self._index_of(start_id)] = 0
+
+        for _ in range(N):
+            candidates = np.where(settled, np.inf, distance)
+            i = int(np.argmin(candidates))
+            if candidates[i] == np.inf:
+                break
+            settled[i] = True
+
+            new_distance = distance[i] + self.weight_row(i)
+            better = (new_distance < distance) & ~settled
+            distance[better] = new_distance[better]
+            previous[better] = i
+
+        self._write_visits(settled)
+        self._write_distances(distance, previous)
+
+    def prim(self, source_id):
+        """
+        Description:
+            Minimum spanning tree weight with the O(V^2) dense Prim, see dense_prim.
+            Fills vertex.distance (weight of the tree edge into the vertex) and vertex.previous.
 
-        start_vertex = self.get_vertex(start_id)[1]
-
-        start_vertex.distance = 0       
-
-        priority_queue = []
-        # 使用顶点的距离和它的值（字符串）作为排序的依据
-        heapq.heappush(priority_queue, (0, start_vertex.id, start_vertex))
-
-        while priority_queue: # O(V) cuz we need to check every vertex
-            current_distance, _, current_vertex = heapq.heappop(priority_queue)
-
-            current_vertex_index = self.get_vertex(current_vertex.id)[0]
-
-            if current_vertex.visited:
-                continue
-
-            current_vertex.visited = True
-
-            for i in range(len(self.vertices)):# O(V^2) 
-                if self.adj_matrix[current_vertex_index][i] != 0:
-                    neighbor = self.vertices[i] 
-                    new_distance = current_distance + self.adj_matrix[current_vertex_index][i]
-
-                    if new_distance < neighbor.distance:
-                        neighbor.distance = new_distance
-                        neighbor.previous = current_vertex
-                        heapq.heappush(priority_queue, (new_distance, neighbor.id, neighbor))
+        Time Complexity:
+            - O(V^2), which is optimal when E is close to V^2
+        """
+        total_weight, parent, key = dense_prim(self.weight_matrix(), self._index_of(source_id))
+        self._write_distances(key, parent)
+        return total_weight
 
     def backtracking(self, target_id):
         path = []
@@ -192,35 +250,81 @@ class Graph:
     def reset_visits(self):
         for vertex in self.vertices:
             vertex.visited = False
-    
+
     def reset_distances(self):
         for vertex in self.vertices:
             vertex.distance = float('inf')
             vertex.previous = None
-    
+
     def get_vertex(self, vertex_id):
-        for index, vertex in enumerate(self.vertices):
-            if vertex.id == vertex_id:
-                return (index, vertex)
-        raise ValueError(f"Vertex with id {vertex_id} not found")
+        # (index, vertex), O(1)
+        index = self._index_of(vertex_id)
+        return (index, self.vertices[index])
 
     def display_distances(self):
         for vertex in self.vertices:
             print(f"Distance from start to {vertex.id}: {vertex.distance}")
 
+    def _index_of(self, vertex_id) -> int:
+        index = self.index.get(vertex_id)
+        if index is None:
+            raise ValueError(f"Vertex with id {vertex_id} not found")
+        return index
+
+    def _write_visits(self, visited: np.ndarray) -> None:
+        # copy the result of a vectorized run back onto the Vertex objects, O(V)
+        for vertex, flag in zip(self.vertices, visited.tolist()):
+            vertex.visited = flag
+
+    def _write_distances(self, distance: np.ndarray, previous: np.ndarray) -> None:
+        for vertex, d, p in zip(self.vertices, distance.tolist(), previous.tolist()):
+            vertex.distance = d
+            vertex.previous = self.vertices[p] if p != -1 else None
+
+
+def dense_prim(matrix: np.ndarray, source: int) -> tuple:
+    """
+    Description:
+        Prim's algorithm on an N x N weight matrix (inf = no edge), matrix[u][v] being the edge u -> v.
+        No heap: key[v] is the lightest edge from the tree to v, and each step is two NumPy passes over a row:
+            u = argmin of key over the vertices not in the tree
+            key = minimum(key, matrix[u]) for the vertices not in the tree
+
+    Returns:
+        (total_weight, parent, key): parent[v] is the tree neighbor of v (-1 for the source and unreached vertices),
+        key[v] the weight of that tree edge (0 for the source, inf if unreached)
+
+    Time Complexity:
+        - O(V^2), V vectorized steps of O(V)
+    """
+    N = len(matrix)
+    key = np.full(N, np.inf)
+    key[source] = 0
+    parent = np.full(N, -1, dtype=np.int64)
+    in_tree = np.zeros(N, dtype=bool)
+    total_weight = 0
+
+    for _ in range(N):
+        candidates = np.where(in_tree, np.inf, key)
+        u = int(np.argmin(candidates))
+        if candidates[u] == np.inf:
+            # the rest is unreachable from the source
+            break
+        in_tree[u] = True
+        total_weight += key[u].item()
+
+        row = matrix[u]
+        better = (row < key) & ~in_tree
+        key[better] = row[better]
+        parent[better] = u
+
+    return total_weight, parent, key
 
 
 # 测试代码放在 __name__ == "__main__" 下
 if __name__ == "__main__":
-    # 创建图
-    g = Graph()
-
-    # 添加顶点
-    g.add_vertex('A')
-    g.add_vertex('B')
-    g.add_vertex('C')
-    g.add_vertex('D')
-    g.add_vertex('E')
+    # 创建图, vertices labelled A..E
+    g = Graph(5, ids=['A', 'B', 'C', 'D', 'E'])
 
     # 添加边 (有向图)
     g.add_edge('A', 'B', 2)
@@ -258,4 +362,4 @@ if __name__ == "__main__":
     # 测试 Backtracking
     print("\nBacktracking path from E to A:")
     backtrack_result = g.backtracking('E')
-    print("Backtracked path:", backtrack_result)
\ No newline at end of file
+    print("Backtracked path:", backtrack_result)
@@ -0,0 +1,175 @@
+import mmap
+import struct
+import sys
+from array import array
+import numpy as np
+from csr_graph import CSRGraph
+
+
+class GraphFile:
+    """
+    Versioned binary CSR graph file, loaded with mmap so the arrays are never copied.
+
+    Layout (little-endian, every section starts at a multiple of 8 bytes):
+        header       magic (8 bytes), version (uint32), flags (uint32), vertex count (uint64), edge count (uint64)
+        offsets      int32 * (V+1)
+        targets      int32 * E
+        weights      float64 * E
+        coordinates  float64 * 2V, x and y of each vertex (NaN if unset), only if flags & HAS_COORDINATES
+
+    open() maps the file read-only and exposes every section as a memoryview cast to 'i' / 'd'
+    (csr is a CSRGraph over them) or as NumPy arrays (numpy()). The pages come from the OS page cache,
+    so any number of processes opening the same file share one copy, and opening costs a header read.
+    """
+    MAGIC = b"GRAPHCSR"
+    VERSION = 1
+    HAS_COORDINATES = 1
+    _HEADER = struct.Struct("<8sIIQQ")
+
+    def __init__(self, file, buffer, num_vertices: int, num_edges: int, flags: int) -> None:
+        self.file = file
+        self.buffer = buffer
+        self.num_vertices = num_vertices
+        self.num_edges = num_edges
+
+        sections = _sections(num_vertices, num_edges, flags)
+        end = max(start + count * struct.calcsize(typecode) for start, count, typecode in sections.values())
+        if len(buffer) < end:
+            raise ValueError("Graph file is truncated")
+        view = memoryview(buffer)
+        self._views = [view]
+        self.offsets = self._section(view, *sections["offsets"])
+        self.targets = self._section(view, *sections["targets"])
+        self.weights = self._section(view, *sections["weights"])
+        self.coordinates = self._section(view, *sections["coordinates"]) if "coordinates" in sections else None
+
+        self.csr = CSRGraph(self.offsets, self.targets, self.weights)
+
+    @classmethod
+    def save(cls, path: str, graph) -> None:
+        """
+        Write a graph_adjacency_list.Graph (with its coordinates, if any) or a CSRGraph.
+        """
+        csr = graph.freeze() if hasattr(graph, "freeze") else graph
+        coordinates = getattr(graph, "coordinates", None)
+        flags = cls.HAS_COORDINATES if coordinates is not None else 0
+
+        with open(path, "wb") as file:
+            file.write(cls._HEADER.pack(cls.MAGIC, cls.VERSION, flags, csr.num_vertices, csr.num_edges))
+            _write_section(file, array('i', csr.offsets))
+            _write_section(file, array('i', csr.targets))
+            _write_section(file, array('d', csr.weights))
+            if coordinates is not None:
+                flat = array('d')
+                for point in coordinates:
+                    flat.extend(point if point is not None else (float('nan'), float('nan')))
+                _write_section(file, flat)
+
+    @classmethod
+    def open(cls, path: str) -> "GraphFile":
+        file = open(path, "rb")
+        try:
+            header = file.read(cls._HEADER.size)
+            if len(header) < cls._HEADER.size:
+                raise ValueError(f"{path} is not a graph file")
+            magic, version, flags, num_vertices, num_edges = cls._HEADER.unpack(header)
+            if magic != cls.MAGIC:
+                raise ValueError(f"{path} is not a graph file")
+            if version != cls.VERSION:
+                raise ValueError(f"Unsupported graph file version: {version}")
+
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return cls(file, buffer, num_vertices, num_edges, flags)
+            except BaseException:
+                buffer.close()
+                raise
+        except BaseException:
+            file.close()
+            raise
+
+    def numpy(self) -> dict:
+        # the same sections as NumPy arrays, still backed by the mapping (read-only)
+        arrays = {"offsets": np.asarray(self.offsets), "targets": np.asarray(self.targets),
+                  "weights": np.asarray(self.weights)}
+        if self.coordinates is not None:
+            arrays["coordinates"] = np.asarray(self.coordinates).reshape(self.num_vertices, 2)
+        return arrays
+
+    def close(self) -> None:
+        """
+        Unmap the file. Views handed out (csr, numpy()) must not be used afterwards;
+        NumPy arrays still alive keep the mapping open until they are gone.
+        """
+        self.csr = self.offsets = self.targets = self.weights = self.coordinates = None
+        for view in reversed(self._views):
+            try:
+                view.release()
+            except BufferError:
+                # a NumPy array still uses it
+                pass
+        self._views = []
+        try:
+            self.buffer.close()
+        except BufferError:
+            # a NumPy view still points into the mapping, it is unmapped when that view goes away
+            pass
+        self.file.close()
+
+    def __enter__(self) -> "GraphFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _section(self, view: memoryview, start: int, length: int, typecode: str):
+        itemsize = struct.calcsize(typecode)
+        raw = view[start:start + length * itemsize]
+        if sys.byteorder == "big":
+            # the file is little-endian, big-endian machines pay for a copy
+            return read_array(raw, typecode)
+        section = raw.cast(typecode)
+        self._views.extend((raw, section))
+        return section
+
+
+def _sections(num_vertices: int, num_edges: int, flags: int) -> dict:
+    # name -> (byte offset, item count, typecode), following the layout in GraphFile
+    sections = {}
+    position = GraphFile._HEADER.size
+    layout = [("offsets", num_vertices + 1, 'i'), ("targets", num_edges, 'i'), ("weights", num_edges, 'd')]
+    if flags & GraphFile.HAS_COORDINATES:
+        layout.append(("coordinates", 2 * num_vertices, 'd'))
+    for name, count, typecode in layout:
+        sections[name] = (position, count, typecode)
+        position = _align(position + count * struct.calcsize(typecode))
+    return sections
+
+
+def _align(position: int) -> int:
+    return (position + 7) & ~7
+
+
+def _write_section(file, data: array) -> None:
+    write_array(file, data)
+    file.write(b"\0" * (_align(file.tell()) - file.tell()))
+
+
+def write_array(file, data: array) -> None:
+    """
+    Writes the items of data little-endian, the byte order of every binary format in this folder
+    (GraphFile, ContractionHierarchy.save). Only big-endian machines pay for a swapped copy.
+    """
+    if sys.byteorder == "big":
+        data = array(data.typecode, data)
+        data.byteswap()
+    data.tofile(file)
+
+
+def read_array(raw, typecode: str) -> array:
+    # a copy of little-endian bytes written by write_array, as an array of typecode in native order
+    data = array(typecode)
+    data.frombytes(raw)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data
@@ -0,0 +1,94 @@
+from array import array
+from query_state import QueryState
+from dfs_events import topological_order
+
+
+class IncrementalTopologicalOrder:
+    """
+    Topological order of a DAG kept up to date while edges are added (Pearce-Kelly).
+
+    position[v] -> index of v in the order, vertex_at[i] -> vertex at index i.
+
+    Adding u -> v when position[u] < position[v] changes nothing. Otherwise only the affected region
+    position[v] .. position[u] is looked at:
+        forward  = vertices reachable from v, with position <= position[u]  (reaching u means a cycle)
+        backward = vertices reaching u,       with position >= position[v]
+    Both sets are reordered into the positions they already occupy, backward first, each keeping its
+    relative order. Vertices outside the two searches keep their position.
+
+    Edges must be added through add_edge (not graph.add_edge), so the in-edge lists used by the
+    backward search stay in sync. Visited marks are epoch stamped (QueryState), so an insert never
+    pays O(V) to clear them.
+
+    Time complexity:
+        - O(V+E) to build
+        - add_edge: O(1) when the order already holds, otherwise O(K log K + edges of K) for the K affected vertices
+    """
+    def __init__(self, graph) -> None:
+        """
+        Raises ValueError if graph already has a cycle.
+        """
+        N = len(graph.vertices)
+        self.graph = graph
+        self.vertex_at = array('i', topological_order(N, graph.neighbor_ids))
+        self.position = array('i', [0]) * N
+        for i, v in enumerate(self.vertex_at):
+            self.position[v] = i
+
+        self.in_edges = [[] for _ in range(N)]
+        for vertex in graph.vertices:
+            for edge in vertex.edges:
+                self.in_edges[edge.v.id].append(vertex.id)
+
+        self.marks = QueryState(N)
+
+    def order(self) -> list:
+        return list(self.vertex_at)
+
+    def add_edge(self, u: int, v: int, w=1) -> None:
+        """
+        Add u -> v to the graph and repair the order. Raises ValueError (and leaves the graph unchanged)
+        if the edge would close a cycle.
+        """
+        if u == v:
+            raise ValueError(f"Edge {u} -> {v} is a self loop")
+
+        position = self.position
+        lower, upper = position[v], position[u]
+        if lower < upper:
+            self.marks.new_query()
+            forward = self._search(v, self.graph.neighbor_ids, lambda x: position[x] <= upper, u)
+            if forward is None:
+                raise ValueError(f"Edge {u} -> {v} would create a cycle")
+            backward = self._search(u, lambda x: self.in_edges[x], lambda x: position[x] >= lower)
+            self._reorder(backward, forward)
+
+        self.graph.add_edge(u, v, w)
+        self.in_edges[v].append(u)
+
+    def _search(self, start: int, neighbors, in_region, cycle_vertex: int = None):
+        # iterative DFS restricted to the affected region, None if cycle_vertex is reached
+        marks = self.marks
+        marks.set_visited(start)
+        found = [start]
+        stack = [start]
+        while stack:
+            x = stack.pop()
+            for y in neighbors(x):
+                if y == cycle_vertex:
+                    return None
+                if not marks.is_visited(y) and in_region(y):
+                    marks.set_visited(y)
+                    found.append(y)
+                    stack.append(y)
+        return found
+
+    def _reorder(self, backward: list, forward: list) -> None:
+        # the freed positions, refilled with backward then forward, each sorted by old position
+        position, vertex_at = self.position, self.vertex_at
+        backward.sort(key=position.__getitem__)
+        forward.sort(key=position.__getitem__)
+        slots = sorted(position[x] for x in backward + forward)
+        for slot, x in zip(slots, backward + forward):
+            position[x] = slot
+            vertex_at[slot] = x
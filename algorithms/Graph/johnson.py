@@ -0,0 +1,66 @@
+from array import array
+from Edge import Edge
+from Vertex import Vertex
+from bellman_ford import BellmanFord
+from csr_graph import CSRGraph
+from multi_source import shortest_rows
+
+
+def johnson(graph, sources=None, workers: int = None, chunksize: int = 16):
+    """
+    Johnson's algorithm: all pairs shortest paths for sparse graphs that may have negative edges
+    (but no negative cycle).
+
+    1. Bellman-Ford once from an extra vertex q with a 0-weight edge to every vertex gives potentials h(v).
+    2. Every edge is reweighted to w(u,v) + h(u) - h(v), which is never negative, and shortest paths are unchanged.
+    3. Dijkstra runs from every source on the reweighted CSR snapshot, then d(s,v) = d'(s,v) - h(s) + h(v).
+
+    The per-source Dijkstra runs are spread over a process pool by multi_source.shortest_rows
+    (the reweighted graph is sent to each worker once, not with every task). Rows are yielded as soon
+    as they are ready, in source order, so the full V x V matrix never has to be in memory.
+
+    Args:
+        graph: a graph_adjacency_list.Graph
+        sources: source vertex ids, all vertices by default
+        workers: number of processes, None for os.cpu_count(), 1 to run in this process
+
+    Yields:
+        (source, row) where row is an array('d') with row[v] = shortest distance from source to v (inf if unreachable)
+
+    Raises:
+        ValueError if the graph has a negative cycle
+
+    Time complexity:
+        - O(VE) for Bellman-Ford + O(V (V+E) logV) for the Dijkstra runs
+    """
+    csr, potential = reweight(graph)
+    if sources is None:
+        sources = range(csr.num_vertices)
+    yield from shortest_rows(csr, sources, workers=workers, chunksize=chunksize, potential=potential)
+
+
+def reweight(graph) -> tuple:
+    """
+    Returns (reweighted CSRGraph, potentials h) for johnson(). Raises ValueError on a negative cycle.
+    """
+    csr = graph.freeze()
+    N = csr.num_vertices
+
+    # Bellman-Ford on separate Vertex / Edge objects, so the graph's own query state is left alone
+    vertices = [Vertex(i) for i in range(N + 1)]
+    extra = vertices[N]
+    edges = [Edge(extra, vertices[v], 0) for v in range(N)]
+    for u in range(N):
+        for i in range(csr.offsets[u], csr.offsets[u + 1]):
+            edges.append(Edge(vertices[u], vertices[csr.targets[i]], csr.weights[i]))
+    BellmanFord(vertices, edges, extra)
+
+    potential = array('d', (vertices[v].distance for v in range(N)))
+
+    weights = array('d', csr.weights)
+    for u in range(N):
+        for i in range(csr.offsets[u], csr.offsets[u + 1]):
+            # >= 0 in exact arithmetic, clamp float rounding
+            weights[i] = max(0.0, weights[i] + potential[u] - potential[csr.targets[i]])
+
+    return CSRGraph(csr.offsets, csr.targets, weights), potential
@@ -1,37 +1,13 @@
 from graph_adjacency_list import *
+from union_find import UnionFind
 
-class DisjointSet:
-    """A class to represent the disjoint set (Union-Find) with path compression and union by rank."""
-    def __init__(self, n):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-    
-    def find(self, u):
-        if self.parent[u] != u:
-            self.parent[u] = self.find(self.parent[u])  # Path compression
-        return self.parent[u]
-    
-    def union(self, u, v):
-        root_u = self.find(u)
-        root_v = self.find(v)
-        
-        if root_u != root_v:
-            # Union by rank
-            if self.rank[root_u] > self.rank[root_v]:
-                self.parent[root_v] = root_u
-            elif self.rank[root_u] < self.rank[root_v]:
-                self.parent[root_u] = root_v
-            else:
-                self.parent[root_v] = root_u
-                self.rank[root_u] += 1
 
 def kruskal(graph: Graph):
     """
     Kruskal's algorithm to find the minimum spanning tree (MST) of a graph.
     
-    :param edges: List of tuples (u, v, weight) representing the edges of the graph.
-    :param num_vertices: The number of vertices in the graph.
-    :return: List of tuples representing the edges in the MST and the total weight of the MST.
+    :param graph: the graph, its edges are (u, v, weight).
+    :return: List of (u id, v id, weight) tuples representing the edges in the MST and the total weight of the MST.
     """
     # number of vertices
     n = len(graph.vertices)
@@ -45,18 +21,21 @@ def kruskal(graph: Graph):
     # Sort edges based on their weights
     edges.sort(key=lambda edge: edge.w)
     
-    # Create an instance of DisjointSet for tracking connected components
-    disjoint_set = DisjointSet(n)
+    # union-find over vertex ids, for tracking connected components
+    disjoint_set = UnionFind(n)
     
     mst = []  # To store the edges in the minimum spanning tree
     total_weight = 0  # To store the total weight of the MST
     
     for edge in edges:
-        # Check if adding this edge creates a cycle
-        if disjoint_set.find(edge.u) != disjoint_set.find(edge.v):
-            disjoint_set.union(edge.u, edge.v)
-            mst.append((edge.u, edge.v, edge.w))
+        # union() is False if adding this edge creates a cycle
+        if disjoint_set.union(edge.u.id, edge.v.id):
+            mst.append((edge.u.id, edge.v.id, edge.w))
             total_weight += edge.w
+
+            # a spanning tree has n-1 edges
+            if len(mst) == n - 1:
+                break
     
     return mst, total_weight
 
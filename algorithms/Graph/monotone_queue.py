@@ -0,0 +1,166 @@
+class DialQueue:
+    """
+    Dial's bucket queue: a monotone priority queue for non-negative integer keys, when edge weights are at most C.
+
+    In Dijkstra every key in the queue lies in [current minimum, current minimum + C], so C+1 buckets
+    used as a circular array are enough: bucket key % (C+1) holds the ids with that key.
+    pop() scans forward from the last popped key to the next non-empty bucket.
+
+    Monotone: a pushed key may never be smaller than the last popped key.
+
+    Time complexity:
+        - push, decrease_key: O(1)
+        - pop: O(1) amortized, the scan moves forward at most C buckets per distinct distance
+    """
+    def __init__(self, max_weight: int) -> None:
+        self.num_buckets = max_weight + 1
+        self.buckets = [set() for _ in range(self.num_buckets)]
+        self.key = {}         # id -> key, for the ids in the queue
+        self.current = 0      # last popped key, every key in the queue is >= current
+
+    def __len__(self) -> int:
+        return len(self.key)
+
+    def is_empty(self) -> bool:
+        return not self.key
+
+    def __contains__(self, id: int) -> bool:
+        return id in self.key
+
+    def key_of(self, id: int) -> int:
+        return self.key[id]
+
+    def clear(self) -> None:
+        for id, key in self.key.items():
+            self.buckets[key % self.num_buckets].discard(id)
+        self.key.clear()
+        self.current = 0
+
+    def push(self, id: int, key: int) -> None:
+        if id in self.key:
+            raise ValueError(f"{id} is already in the queue")
+        if key < self.current:
+            raise ValueError("Key is smaller than the last popped key")
+        if key - self.current >= self.num_buckets:
+            raise ValueError("Key is further ahead than the largest edge weight")
+        self.key[id] = key
+        self.buckets[key % self.num_buckets].add(id)
+
+    def decrease_key(self, id: int, key: int) -> None:
+        old_key = self.key[id]
+        if key > old_key:
+            raise ValueError("New key is larger than the current key")
+        self.buckets[old_key % self.num_buckets].discard(id)
+        del self.key[id]
+        self.push(id, key)
+
+    def push_or_decrease(self, id: int, key: int) -> bool:
+        old_key = self.key.get(id)
+        if old_key is None:
+            self.push(id, key)
+            return True
+        if key >= old_key:
+            return False
+        self.decrease_key(id, key)
+        return True
+
+    def pop(self) -> tuple:
+        if not self.key:
+            raise IndexError("pop from an empty queue")
+        while not self.buckets[self.current % self.num_buckets]:
+            self.current += 1
+        id = self.buckets[self.current % self.num_buckets].pop()
+        del self.key[id]
+        return id, self.current
+
+
+class RadixHeap:
+    """
+    Radix heap: a monotone priority queue for non-negative integer keys of any size.
+
+    Bucket i holds the ids whose key differs from the last popped key first in bit i-1
+    (bucket = (key XOR last).bit_length()), so bucket 0 holds the keys equal to last.
+    When bucket 0 is empty, pop() takes the first non-empty bucket, makes its minimum the new last,
+    and spreads its ids over lower buckets. An id can only move down, at most 64 times in total.
+
+    Monotone: a pushed key may never be smaller than the last popped key.
+
+    Time complexity:
+        - push, decrease_key: O(1)
+        - pop: O(log C) amortized, C being the largest key
+    """
+    def __init__(self) -> None:
+        self.buckets = [set() for _ in range(65)]
+        self.key = {}         # id -> key, for the ids in the queue
+        self.bucket_of = {}   # id -> bucket index
+        self.last = 0
+
+    def __len__(self) -> int:
+        return len(self.key)
+
+    def is_empty(self) -> bool:
+        return not self.key
+
+    def __contains__(self, id: int) -> bool:
+        return id in self.key
+
+    def key_of(self, id: int) -> int:
+        return self.key[id]
+
+    def clear(self) -> None:
+        for id, bucket in self.bucket_of.items():
+            self.buckets[bucket].discard(id)
+        self.key.clear()
+        self.bucket_of.clear()
+        self.last = 0
+
+    def push(self, id: int, key: int) -> None:
+        if id in self.key:
+            raise ValueError(f"{id} is already in the queue")
+        if key < self.last:
+            raise ValueError("Key is smaller than the last popped key")
+        self.key[id] = key
+        self._place(id, key)
+
+    def decrease_key(self, id: int, key: int) -> None:
+        if key > self.key[id]:
+            raise ValueError("New key is larger than the current key")
+        if key < self.last:
+            raise ValueError("Key is smaller than the last popped key")
+        self.buckets[self.bucket_of[id]].discard(id)
+        self.key[id] = key
+        self._place(id, key)
+
+    def push_or_decrease(self, id: int, key: int) -> bool:
+        old_key = self.key.get(id)
+        if old_key is None:
+            self.push(id, key)
+            return True
+        if key >= old_key:
+            return False
+        self.decrease_key(id, key)
+        return True
+
+    def pop(self) -> tuple:
+        if not self.key:
+            raise IndexError("pop from an empty queue")
+
+        if not self.buckets[0]:
+            # first non-empty bucket, its minimum becomes the new last
+            i = 1
+            while not self.buckets[i]:
+                i += 1
+            bucket = self.buckets[i]
+            self.buckets[i] = set()
+            self.last = min(self.key[id] for id in bucket)
+            for id in bucket:
+                self._place(id, self.key[id])
+
+        id = self.buckets[0].pop()
+        del self.bucket_of[id]
+        return id, self.key.pop(id)
+
+    def _place(self, id: int, key: int) -> None:
+        bucket = (key ^ self.last).bit_length()
+        self.buckets[bucket].add(id)
+        self.bucket_of[id] = bucket
@@ -0,0 +1,62 @@
+from array import array
+from multiprocessing import Pool
+from csr_graph import CSRGraph
+
+
+# CSR snapshot of the current pool worker, set once by _init_worker
+_worker_graph = {}
+
+
+def shortest_rows(csr: CSRGraph, sources, targets=None, workers: int = None, chunksize: int = 16, potential: array = None):
+    """
+    Dijkstra from every source on a read-only CSRGraph, spread over a process pool.
+
+    The snapshot (and the potentials) are handed to each worker once through the pool initializer,
+    every task only carries a source id, and each worker reuses its own query state and heap.
+    Rows come back in source order as soon as they are ready.
+
+    Args:
+        sources: source vertex ids
+        targets: vertex ids kept in each row (all vertices by default), a search stops once they are all settled
+        workers: number of processes, None for os.cpu_count(), 1 to run in this process
+        potential: Johnson potentials h, to turn reweighted distances back into d(s,v) = d'(s,v) - h(s) + h(v)
+
+    Yields:
+        (source, row) where row is an array('d'), row[i] = distance from source to targets[i] (inf if unreachable)
+    """
+    if targets is not None:
+        targets = list(targets)
+
+    if workers == 1:
+        for source in sources:
+            yield source, _shortest_row(csr, potential, targets, source)
+        return
+
+    with Pool(workers, initializer=_init_worker, initargs=(csr, potential, targets)) as pool:
+        for source, row in pool.imap(_shortest_row_task, sources, chunksize):
+            yield source, row
+
+
+def _shortest_row(csr: CSRGraph, potential: array, targets: list, source: int) -> array:
+    csr.dijkstra(source, targets)
+    get_distance = csr.state.get_distance
+    if targets is None:
+        targets = range(csr.num_vertices)
+
+    row = array('d', [float('inf')]) * len(targets)
+    for i, v in enumerate(targets):
+        distance = get_distance(v)
+        if distance != float('inf'):
+            # undo the reweighting, if any
+            row[i] = distance if potential is None else distance - potential[source] + potential[v]
+    return row
+
+
+def _init_worker(csr: CSRGraph, potential: array, targets: list) -> None:
+    _worker_graph["csr"] = csr
+    _worker_graph["potential"] = potential
+    _worker_graph["targets"] = targets
+
+
+def _shortest_row_task(source: int) -> tuple:
+    return source, _shortest_row(_worker_graph["csr"], _worker_graph["potential"], _worker_graph["targets"], source)
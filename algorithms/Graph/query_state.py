@@ -0,0 +1,113 @@
+from array import array
+
+
+class QueryState:
+    """
+    Per-query vertex state (distance, predecessor, visited, in_degree) kept in flat side arrays.
+
+    Instead of rewriting every vertex before each query (O(V) reset), each slot remembers the
+    query number (epoch) it was last written in. Starting a new query only bumps the epoch,
+    and a slot whose stamp is older than the current epoch reads as its default value:
+        distance = inf, predecessor = -1, visited = False, in_degree = 0
+
+    So a query only pays for the vertices it actually touches.
+
+    Example (epoch = 7):
+        stamp    = [7, 3, 7]
+        distance = [0, 5, 2]   -> vertex 1 reads as inf, its 5 is left over from query 3
+    """
+    _MAX_EPOCH = 2 ** 31 - 1
+
+    def __init__(self, N: int) -> None:
+        self.num_vertices = N
+        # epoch 0 is never current, so all-zero stamps mean "untouched"
+        self.epoch = 1
+        self.stamp = array('i', [0]) * N     # epoch in which distance/predecessor/in_degree were written
+        self.seen = array('i', [0]) * N      # epoch in which the vertex was marked visited
+        self.distance = array('d', [float('inf')]) * N
+        self.predecessor = array('i', [-1]) * N
+        self.in_degree = array('i', [0]) * N
+
+        # optional list of Vertex objects, used to turn predecessor ids back into vertices
+        self.vertices = None
+        # set by the owning graph while every edge weight is an int, Vertex.distance then reads back ints
+        self.integer_distances = False
+
+    def new_query(self) -> None:
+        """
+        Forget the previous query. O(1), except once every 2^31 queries when the stamps wrap around.
+        """
+        self.epoch += 1
+        if self.epoch == self._MAX_EPOCH:
+            for i in range(self.num_vertices):
+                self.stamp[i] = 0
+                self.seen[i] = 0
+            self.epoch = 1
+
+    def touch(self, v: int) -> None:
+        # first write to v in this query, clear what an older query left behind
+        if self.stamp[v] != self.epoch:
+            self.stamp[v] = self.epoch
+            self.distance[v] = float('inf')
+            self.predecessor[v] = -1
+            self.in_degree[v] = 0
+
+    def get_distance(self, v: int) -> float:
+        return self.distance[v] if self.stamp[v] == self.epoch else float('inf')
+
+    def set_distance(self, v: int, distance: float) -> None:
+        self.touch(v)
+        self.distance[v] = distance
+
+    def get_predecessor(self, v: int) -> int:
+        return self.predecessor[v] if self.stamp[v] == self.epoch else -1
+
+    def set_predecessor(self, v: int, u: int) -> None:
+        self.touch(v)
+        self.predecessor[v] = u
+
+    def relax(self, v: int, distance: float, u: int) -> None:
+        # set both distance and predecessor with a single stamp check
+        self.touch(v)
+        self.distance[v] = distance
+        self.predecessor[v] = u
+
+    def get_in_degree(self, v: int) -> int:
+        return self.in_degree[v] if self.stamp[v] == self.epoch else 0
+
+    def set_in_degree(self, v: int, in_degree: int) -> None:
+        self.touch(v)
+        self.in_degree[v] = in_degree
+
+    def is_visited(self, v: int) -> bool:
+        return self.seen[v] == self.epoch
+
+    def set_visited(self, v: int, visited: bool = True) -> None:
+        self.seen[v] = self.epoch if visited else 0
+
+    def distance_view(self) -> "StateView":
+        return StateView(self.get_distance, self.num_vertices)
+
+    def predecessor_view(self) -> "StateView":
+        return StateView(self.get_predecessor, self.num_vertices)
+
+
+class StateView:
+    """
+    Read-only, indexable view of one QueryState field, e.g. view[v] -> distance of v in the current query.
+    """
+    def __init__(self, getter, length: int) -> None:
+        self._getter = getter
+        self._length = length
+
+    def __getitem__(self, v: int):
+        if not 0 <= v < self._length:
+            raise IndexError("Vertex ID out of range.")
+        return self._getter(v)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        for v in range(self._length):
+            yield self._getter(v)
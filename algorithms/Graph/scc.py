@@ -0,0 +1,118 @@
+from array import array
+from csr_graph import CSRGraph
+from dfs_events import strongly_connected_components
+
+
+class Condensation:
+    """
+    Strongly connected components of a directed graph and its condensation DAG.
+
+    component[v] -> id of the component of v. Ids are numbered in topological order of the condensation:
+                    every edge between two components goes from a smaller id to a larger one,
+                    so order = [0, 1, ..., count-1] is already a topological order.
+    size[c]      -> number of vertices in component c
+    cyclic[c]    -> 1 if c contains a cycle (more than one vertex, or a self loop)
+    dag          -> CSRGraph with one vertex per component and one edge per connected pair of components
+                    (the smallest weight among the original edges between them)
+
+    Built with the iterative Tarjan of dfs_events (no recursion) over the CSR arrays,
+    no Vertex / Edge objects involved. For a dependency graph: cyclic components are the groups
+    to report, and order gives a build order of the groups.
+
+    Time complexity:
+        - O(V+E) to build
+    """
+    def __init__(self, component: array, count: int, dag: CSRGraph, size: array, cyclic: bytearray) -> None:
+        self.component = component
+        self.count = count
+        self.dag = dag
+        self.size = size
+        self.cyclic = cyclic
+
+    @property
+    def order(self) -> range:
+        return range(self.count)
+
+    def members(self) -> list:
+        # vertex ids of each component
+        members = [[] for _ in range(self.count)]
+        for v, c in enumerate(self.component):
+            members[c].append(v)
+        return members
+
+    @classmethod
+    def from_graph(cls, graph) -> "Condensation":
+        return cls.from_csr(graph.freeze())
+
+    @classmethod
+    def from_csr(cls, csr: CSRGraph) -> "Condensation":
+        component, count = tarjan_scc(csr)
+        dag, cyclic = _condense(csr, component, count)
+
+        size = array('i', [0]) * count
+        for c in component:
+            size[c] += 1
+        for c in range(count):
+            if size[c] > 1:
+                cyclic[c] = 1
+
+        return cls(component, count, dag, size, cyclic)
+
+
+def tarjan_scc(csr: CSRGraph) -> tuple:
+    """
+    Returns (component, count), component ids in topological order of the condensation.
+
+    The components come from dfs_events.strongly_connected_components, the same Tarjan that
+    Graph.strongly_connected_components runs, so both always agree.
+    """
+    components = strongly_connected_components(csr.num_vertices, csr.neighbors)
+    count = len(components)
+    component = array('i', [-1]) * csr.num_vertices
+    # Tarjan completes sink components first, flip the ids into topological order
+    for i, members in enumerate(components):
+        for v in members:
+            component[v] = count - 1 - i
+    return component, count
+
+
+def _condense(csr: CSRGraph, component: array, count: int) -> tuple:
+    # one edge per pair of components, with the smallest weight; self loops only mark the component cyclic
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    cyclic = bytearray(count)
+
+    # vertices grouped by component, with a counting sort
+    start = array('i', [0]) * (count + 1)
+    for c in component:
+        start[c + 1] += 1
+    for c in range(count):
+        start[c + 1] += start[c]
+    by_component = array('i', [0]) * csr.num_vertices
+    cursor = array('i', start[:count])
+    for v in range(csr.num_vertices):
+        c = component[v]
+        by_component[cursor[c]] = v
+        cursor[c] += 1
+
+    dag_offsets = array('i', [0]) * (count + 1)
+    dag_targets = array('i')
+    dag_weights = array('d')
+    # slot[d] = position of the edge c -> d in dag_targets if it was already added for the current c
+    slot = array('i', [-1]) * count
+    for c in range(count):
+        first = len(dag_targets)
+        for k in range(start[c], start[c + 1]):
+            u = by_component[k]
+            for i in range(offsets[u], offsets[u + 1]):
+                d = component[targets[i]]
+                if d == c:
+                    cyclic[c] = 1
+                elif slot[d] < first:
+                    slot[d] = len(dag_targets)
+                    dag_targets.append(d)
+                    dag_weights.append(weights[i])
+                elif weights[i] < dag_weights[slot[d]]:
+                    dag_weights[slot[d]] = weights[i]
+        dag_offsets[c + 1] = len(dag_targets)
+
+    return CSRGraph(dag_offsets, dag_targets, dag_weights), cyclic
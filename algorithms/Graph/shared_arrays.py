@@ -0,0 +1,59 @@
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+
+
+# arrays attached by attach_worker, in a pool worker process
+worker_arrays = {}
+
+
+class SharedArrays:
+    """
+    NumPy arrays in multiprocessing.shared_memory, so a process pool gets them once
+    instead of a pickled copy with every task.
+
+    In this process:
+        with SharedArrays() as shared:
+            view = shared.add("name", data)    # copies data into a new block, returns a view of it
+            with Pool(workers, initializer=attach_worker, initargs=(shared.specs,)) as pool:
+                ...
+    Leaving the with block closes and unlinks every block; views still in use keep their mapping
+    until they are gone, the names are released either way.
+
+    In a worker, attach_worker maps the same blocks into worker_arrays[name].
+    """
+    def __init__(self) -> None:
+        self.memories = []
+        self.specs = {}     # name -> (block name, dtype, shape), what attach_worker needs
+
+    def add(self, name: str, data: np.ndarray) -> np.ndarray:
+        memory = SharedMemory(create=True, size=max(1, data.nbytes))
+        self.memories.append(memory)
+        view = np.ndarray(data.shape, dtype=data.dtype, buffer=memory.buf)
+        view[:] = data
+        self.specs[name] = (memory.name, view.dtype.str, view.shape)
+        return view
+
+    def close(self) -> None:
+        for memory in self.memories:
+            try:
+                memory.close()
+            except BufferError:
+                # a view still points into the block, it is unmapped when that view goes away
+                pass
+            memory.unlink()
+        self.memories = []
+
+    def __enter__(self) -> "SharedArrays":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_worker(specs: dict) -> None:
+    # Pool initializer: map every block of a SharedArrays into worker_arrays
+    for name, (memory_name, dtype, shape) in specs.items():
+        memory = SharedMemory(name=memory_name)
+        # the SharedMemory object has to outlive the view
+        worker_arrays[name + "_memory"] = memory
+        worker_arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=memory.buf)
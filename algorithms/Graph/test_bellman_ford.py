@@ -0,0 +1,52 @@
+import unittest
+from unittest import mock
+from Edge import Edge
+from Vertex import Vertex
+from bellman_ford import BellmanFord, BellmanFordQueue, NegativeCycleError
+import bellman_ford_vectorized
+from bellman_ford_vectorized import BellmanFordVectorized
+
+def build(n, edge_list):
+    vertices = [Vertex(i) for i in range(n)]
+    edges = [Edge(vertices[u], vertices[v], w) for u, v, w in edge_list]
+    return vertices, edges
+
+class TestBellmanFord(unittest.TestCase):
+    def setUp(self):
+        # negative edges but no negative cycle
+        self.edge_list = [(0, 1, 4), (0, 2, 5), (2, 1, -3), (1, 3, 2), (3, 4, -1), (2, 4, 7)]
+
+    def test_queue_matches_bellman_ford(self):
+        for algorithm in (BellmanFord, BellmanFordQueue, BellmanFordVectorized):
+            vertices, edges = build(5, self.edge_list)
+            algorithm(vertices, edges, vertices[0])
+            self.assertEqual([v.distance for v in vertices], [0, 2, 5, 4, 3])
+            self.assertIs(vertices[1].previous, vertices[2])
+
+    def test_relaxation_counter(self):
+        vertices, edges = build(5, self.edge_list)
+        self.assertEqual(BellmanFordQueue(vertices, edges, vertices[0]), 8)
+
+    def test_negative_cycle_witness(self):
+        # 1 → 2 → 3 → 1 sums to -1, 0 and 4 hang off it
+        edge_list = [(0, 1, 1), (1, 2, 2), (2, 3, -4), (3, 1, 1), (3, 4, 1)]
+        for algorithm in (BellmanFord, BellmanFordQueue, BellmanFordVectorized):
+            vertices, edges = build(5, edge_list)
+            with self.assertRaises(NegativeCycleError) as context:
+                algorithm(vertices, edges, vertices[0])
+            cycle = [v.id for v in context.exception.cycle]
+            self.assertEqual(sorted(cycle), [1, 2, 3])
+            # still a ValueError for existing callers
+            self.assertIsInstance(context.exception, ValueError)
+
+    def test_vectorized_falls_back_to_queue_witness(self):
+        # no cycle in the vectorized predecessors -> the queue based witness comes through
+        edge_list = [(0, 1, 1), (1, 2, 2), (2, 3, -4), (3, 1, 1), (3, 4, 1)]
+        vertices, edges = build(5, edge_list)
+        with mock.patch.object(bellman_ford_vectorized, "bellman_ford_arrays", side_effect=bellman_ford_vectorized._NoWitness):
+            with self.assertRaises(NegativeCycleError) as context:
+                BellmanFordVectorized(vertices, edges, vertices[0])
+        self.assertEqual(sorted(v.id for v in context.exception.cycle), [1, 2, 3])
+
+if __name__ == '__main__':
+    unittest.main()
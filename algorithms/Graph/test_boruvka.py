@@ -0,0 +1,32 @@
+import unittest
+import random
+from graph_adjacency_list import Graph
+from boruvka import boruvka
+from union_find import UnionFind
+
+class TestBoruvka(unittest.TestCase):
+    def test_matches_kruskal(self):
+        rng = random.Random(9)
+        for connected in (True, False):
+            n = 60
+            graph = Graph(n)
+            edges = [(rng.randrange(n), rng.randrange(n), rng.randint(1, 20)) for _ in range(250)]
+            if connected:
+                edges += [(u, u + 1, 50) for u in range(n - 1)]
+            for u, v, w in edges:
+                graph.add_edge(u, v, w)
+
+            sets = UnionFind(n)
+            expected = [edge for edge in sorted(edges, key=lambda edge: edge[2]) if sets.union(edge[0], edge[1])]
+
+            # in this process, then over many small chunks in two workers
+            for workers, chunk_edges in ((1, 1 << 18), (2, 16)):
+                mst, total = boruvka(graph, workers, chunk_edges)
+                self.assertEqual(total, sum(w for _, _, w in expected))
+                self.assertEqual(len(mst), len(expected))
+                tree = UnionFind(n)
+                for u, v, w in mst:
+                    self.assertTrue(tree.union(u, v))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from graph_adjacency_list import Graph
+import random
+from csr_graph import CSRGraph
+from direction_optimizing_bfs import direction_optimizing_bfs
+
+class TestCSRGraph(unittest.TestCase):
+    def setUp(self):
+        #     0 → 1 → 3 → 4 → 5
+        #     ↓       ↑
+        #     2 ──────┘
+        self.edges = [(0, 1, 1), (0, 2, 2), (1, 3, 2), (2, 3, 3), (3, 4, 4), (4, 5, 5)]
+        self.graph = Graph(6)
+        for u, v, w in self.edges:
+            self.graph.add_edge(u, v, w)
+        self.csr = self.graph.freeze()
+
+    def test_layout(self):
+        self.assertEqual(list(self.csr.offsets), [0, 2, 3, 4, 5, 6, 6])
+        self.assertEqual(list(self.csr.targets), [1, 2, 3, 3, 4, 5])
+        self.assertEqual(list(self.csr.weights), [1, 2, 2, 3, 4, 5])
+
+    def test_from_edges_matches_freeze(self):
+        # edge list order should not matter across sources, only within a source
+        csr = CSRGraph.from_edges(6, reversed(self.edges))
+        self.assertEqual(list(csr.offsets), list(self.csr.offsets))
+        self.assertEqual(sorted(csr.targets), sorted(self.csr.targets))
+
+    def test_traversals(self):
+        self.assertEqual(self.csr.dfs(0), self.graph.dfs(0))
+        self.assertEqual(self.csr.bfs(0), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(self.csr.bfs_shortest_path(0),
+                         [[0, 0], [1, 1], [2, 1], [3, 2], [4, 3], [5, 4]])
+
+    def test_transpose(self):
+        reverse = self.csr.transpose()
+        self.assertEqual(list(reverse.offsets), [0, 0, 1, 2, 4, 5, 6])
+        self.assertEqual(list(reverse.targets), [0, 0, 1, 2, 3, 4])
+        self.assertEqual(list(reverse.weights), [1, 2, 2, 3, 4, 5])
+
+    def test_direction_optimizing_bfs(self):
+        rng = random.Random(11)
+        for _ in range(20):
+            n = rng.randint(1, 40)
+            graph = Graph(n)
+            for _ in range(rng.randint(0, 4 * n)):
+                graph.add_edge(rng.randrange(n), rng.randrange(n))
+            graph.bfs_shortest_path(0)
+            expected = [int(v.distance) if v.distance != float('inf') else -1 for v in graph.vertices]
+
+            # alpha = inf: top-down only, alpha = 0 and beta = 0: bottom-up after the first level
+            for alpha, beta in ((float('inf'), 24), (0, 0), (14, 24)):
+                levels, parents = direction_optimizing_bfs(graph.freeze(), 0, alpha=alpha, beta=beta)
+                self.assertEqual(list(levels), expected)
+                for v in range(1, n):
+                    if levels[v] > 0:
+                        self.assertEqual(levels[parents[v]], levels[v] - 1)
+                        self.assertIn(v, [edge.v.id for edge in graph.vertices[parents[v]].edges])
+
+    def test_dijkstra(self):
+        self.graph.dijkstra(0)
+        self.csr.dijkstra(0)
+        for vertex in self.graph.vertices:
+            self.assertEqual(self.csr.distance[vertex.id], vertex.distance)
+        self.assertEqual(self.csr.backtracking(5), self.graph.backtracking(5))
+
+    def test_topological_sorts(self):
+        for order in (self.csr.kahn_topological_sort_bfs(), self.csr.dfs_topological_sort()):
+            position = {u: i for i, u in enumerate(order)}
+            for u, v, _ in self.edges:
+                self.assertLess(position[u], position[v])
+
+    def test_cycle_detection(self):
+        csr = CSRGraph.from_edges(3, [(0, 1), (1, 2), (2, 0)])
+        with self.assertRaises(ValueError):
+            csr.kahn_topological_sort_bfs()
+        with self.assertRaises(ValueError):
+            csr.dfs_topological_sort()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from graph_adjacency_list import Graph
+from dfs_events import dfs_events, DISCOVER, FINISH, BACK_EDGE
+
+class TestDFSEvents(unittest.TestCase):
+    def test_long_path_does_not_recurse(self):
+        n = 20000
+        graph = Graph(n)
+        for u in range(n - 1):
+            graph.add_edge(u, u + 1)
+        self.assertEqual(graph.dfs(0), list(range(n)))
+        self.assertEqual([v.id for v in graph.dfs_topological_sort()], list(range(n)))
+
+    def test_dfs_marks_visited(self):
+        # 0 → 1 → 2, 3 → 0
+        graph = Graph(4)
+        for u, v in [(0, 1), (1, 2), (3, 0)]:
+            graph.add_edge(u, v)
+        self.assertEqual(graph.dfs(0), [0, 1, 2])
+        self.assertEqual([v.visited for v in graph.vertices], [True, True, True, False])
+        # continuing from 3 skips what this query already visited
+        self.assertEqual(graph.dfs_recursive(graph.vertices[3]), [3])
+        self.assertTrue(graph.vertices[3].visited)
+
+    def test_event_order(self):
+        #     0 → 1 → 2
+        #     ↑───────┘
+        neighbors = {0: [1], 1: [2], 2: [0]}
+        events = list(dfs_events(3, neighbors.__getitem__))
+        self.assertEqual(events, [(DISCOVER, -1, 0), (DISCOVER, 0, 1), (DISCOVER, 1, 2),
+                                  (BACK_EDGE, 2, 0), (FINISH, 1, 2), (FINISH, 0, 1), (FINISH, -1, 0)])
+
+    def test_cycles(self):
+        graph = Graph(5)
+        for u, v in [(0, 1), (1, 2), (2, 3), (3, 1), (3, 4)]:
+            graph.add_edge(u, v)
+        self.assertEqual(graph.find_cycle(), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            graph.dfs_topological_sort()
+
+        dag = Graph(4)
+        for u, v in [(3, 1), (1, 0), (3, 2), (2, 0)]:
+            dag.add_edge(u, v)
+        self.assertIsNone(dag.find_cycle())
+        position = {v.id: i for i, v in enumerate(dag.dfs_topological_sort())}
+        for u, v in [(3, 1), (1, 0), (3, 2), (2, 0)]:
+            self.assertLess(position[u], position[v])
+
+    def test_strongly_connected_components(self):
+        # {0, 1, 2} → {3, 4} → {5}
+        graph = Graph(6)
+        for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 3), (4, 5)]:
+            graph.add_edge(u, v)
+        components = [sorted(c) for c in graph.strongly_connected_components()]
+        self.assertEqual(components, [[5], [3, 4], [0, 1, 2]])
+
+    def test_articulation_points(self):
+        # two triangles sharing vertex 2, plus a tail 4 - 5 - 6
+        graph = Graph(7)
+        for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 2), (4, 5), (5, 6)]:
+            graph.add_edge(u, v)
+            graph.add_edge(v, u)
+        self.assertEqual(graph.articulation_points(), [2, 4, 5])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import os
+import tempfile
+from edge_ingest import ingest_edges, read_edge_chunks
+from external_kruskal import write_edge_file
+
+class TestEdgeIngest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as file:
+            file.write(text)
+        return path
+
+    def edges_of(self, csr, labels):
+        return [(labels[u], labels[csr.targets[i]], csr.weights[i])
+                for u in range(csr.num_vertices) for i in range(csr.offsets[u], csr.offsets[u + 1])]
+
+    def test_csv_labels_and_dedupe(self):
+        path = self.write("edges.csv", "src,dst,w\nparis,lyon,5\nlyon,nice,2\nparis,lyon,3\nnice,paris\nparis,lyon,4\n")
+        expected = {
+            "min": [("paris", "lyon", 3.0), ("lyon", "nice", 2.0), ("nice", "paris", 1.0)],
+            "sum": [("paris", "lyon", 12.0), ("lyon", "nice", 2.0), ("nice", "paris", 1.0)],
+            "last": [("paris", "lyon", 4.0), ("lyon", "nice", 2.0), ("nice", "paris", 1.0)],
+        }
+        for rule, edges in expected.items():
+            # chunks of 2 lines, so duplicates are split across chunks
+            csr, labels = ingest_edges(path, dedupe=rule, chunk_size=2, has_header=True)
+            self.assertEqual(labels, ["paris", "lyon", "nice"])
+            self.assertEqual(self.edges_of(csr, labels), edges)
+
+        csr, labels = ingest_edges(path, dedupe=None, has_header=True)
+        self.assertEqual(csr.num_edges, 5)
+        self.assertEqual([w for _, _, w in self.edges_of(csr, labels)][:3], [5.0, 3.0, 4.0])
+
+    def test_tsv_int_labels_and_binary(self):
+        path = self.write("edges.tsv", "10\t20\t1.5\n20\t30\t2\n30\t10\t1\n")
+        csr, labels = ingest_edges(path, label_type=int)
+        self.assertEqual(labels, [10, 20, 30])
+        csr.dijkstra(0)
+        self.assertEqual(csr.distance[2], 3.5)
+
+        binary = os.path.join(self.directory.name, "edges.bin")
+        write_edge_file(binary, [(7, 3, 1.0), (3, 7, 2.0), (7, 3, 0.5)])
+        self.assertEqual(sum(len(chunk[0]) for chunk in read_edge_chunks(binary, chunk_size=2)), 3)
+        csr, labels = ingest_edges(binary)
+        self.assertEqual(self.edges_of(csr, labels), [(7, 3, 0.5), (3, 7, 2.0)])
+
+    def test_bad_arguments(self):
+        path = self.write("edges.txt", "a,b\n")
+        with self.assertRaises(ValueError):
+            ingest_edges(path)
+        with self.assertRaises(ValueError):
+            ingest_edges(path, format="csv", dedupe="max")
+
+if __name__ == '__main__':
+    unittest.main()
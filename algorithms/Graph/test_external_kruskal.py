@@ -0,0 +1,43 @@
+import unittest
+import os
+import random
+import tempfile
+from external_kruskal import external_kruskal, write_edge_file
+from union_find import UnionFind
+
+class TestExternalKruskal(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(6)
+        self.n = 50
+        self.edges = [(rng.randrange(self.n), rng.randrange(self.n), rng.randint(1, 100)) for _ in range(400)]
+
+        # in-memory Kruskal for reference
+        sets = UnionFind(self.n)
+        self.expected = sum(w for u, v, w in sorted(self.edges, key=lambda edge: edge[2]) if sets.union(u, v))
+
+    def test_from_iterator(self):
+        # many tiny runs, so the merge has work to do
+        mst, total = external_kruskal(iter(self.edges), self.n, chunk_size=37, read_block=5)
+        self.assertEqual(total, self.expected)
+        sets = UnionFind(self.n)
+        for u, v, w in mst:
+            self.assertTrue(sets.union(u, v))
+
+    def test_from_file(self):
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            write_edge_file(path, self.edges, chunk_size=64)
+            mst, total = external_kruskal(path, self.n, chunk_size=100)
+        finally:
+            os.remove(path)
+        self.assertEqual(total, self.expected)
+
+    def test_stops_at_spanning_tree(self):
+        edges = [(0, 1, 1), (1, 2, 2), (0, 2, 3)]
+        mst, total = external_kruskal(edges, 3, chunk_size=1)
+        self.assertEqual(mst, [(0, 1, 1.0), (1, 2, 2.0)])
+        self.assertEqual(total, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import random
+from floyd_warshall import Graph
+
+def reference_floyd_warshall(N, edges):
+    # plain triple loop over a list-of-lists, as a reference
+    dist = [[float('inf')] * N for _ in range(N)]
+    for i in range(N):
+        dist[i][i] = 0
+    for u, v, w in edges:
+        dist[u][v] = w
+    for k in range(N):
+        for i in range(N):
+            for j in range(N):
+                if dist[i][k] + dist[k][j] < dist[i][j]:
+                    dist[i][j] = dist[i][k] + dist[k][j]
+    return dist
+
+def random_edges(rng, N, count, low=0):
+    edges = {}
+    for _ in range(count):
+        u, v = rng.randrange(N), rng.randrange(N)
+        if u != v:
+            edges[(u, v)] = rng.randint(low, 20)
+    return [(u, v, w) for (u, v), w in edges.items()]
+
+class TestFloydWarshall(unittest.TestCase):
+    def build(self, N, edges):
+        graph = Graph(N)
+        for u, v, w in edges:
+            graph.add_edge(u, v, w)
+        return graph
+
+    def assert_paths_valid(self, graph, edges):
+        weight = {(u, v): w for u, v, w in edges}
+        for i in range(graph.num_vertices):
+            for j in range(graph.num_vertices):
+                if graph.dist_matrix[i][j] == float('inf'):
+                    with self.assertRaises(ValueError):
+                        graph.get_path(i, j)
+                    continue
+                path = graph.get_path(i, j)
+                self.assertEqual((path[0], path[-1]), (i, j))
+                length = sum(weight[(u, v)] for u, v in zip(path, path[1:]))
+                self.assertEqual(length, graph.dist_matrix[i][j])
+
+    def test_matches_reference(self):
+        rng = random.Random(5)
+        for _ in range(20):
+            N = rng.randint(1, 15)
+            edges = random_edges(rng, N, rng.randint(0, 3 * N))
+            graph = self.build(N, edges)
+            graph.floyd_warshall()
+            self.assertEqual(graph.dist_matrix.tolist(), reference_floyd_warshall(N, edges))
+            self.assertFalse(graph.has_negative_cycle())
+            self.assert_paths_valid(graph, edges)
+
+    def test_negative_edges(self):
+        # negative edges but no negative cycle
+        edges = [(0, 1, 4), (0, 2, 5), (2, 1, -3), (1, 3, 2)]
+        graph = self.build(4, edges)
+        graph.floyd_warshall()
+        self.assertEqual(graph.dist_matrix[0][3], 4)
+        self.assertEqual(graph.get_path(0, 3), [0, 2, 1, 3])
+        self.assertFalse(graph.has_negative_cycle())
+
+    def test_negative_cycle(self):
+        graph = self.build(3, [(0, 1, 1), (1, 2, -3), (2, 0, 1)])
+        graph.floyd_warshall()
+        self.assertTrue(graph.has_negative_cycle())
+
+    def test_blocked_matches_floyd_warshall(self):
+        rng = random.Random(11)
+        for tile_size, workers in [(4, 1), (5, 2), (64, 2)]:
+            N = 23
+            edges = random_edges(rng, N, 80)
+            expected = self.build(N, edges)
+            expected.floyd_warshall()
+            if expected.has_negative_cycle():
+                continue
+            graph = self.build(N, edges)
+            graph.floyd_warshall_blocked(tile_size=tile_size, workers=workers)
+            self.assertEqual(graph.dist_matrix.tolist(), expected.dist_matrix.tolist())
+            self.assert_paths_valid(graph, edges)
+
+if __name__ == '__main__':
+    unittest.main()
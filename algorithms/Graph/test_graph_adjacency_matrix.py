@@ -0,0 +1,69 @@
+import unittest
+import random
+import graph_adjacency_list
+import graph_adjacency_matrix
+from transitive_closure import TransitiveClosure
+
+class TestAdjacencyMatrixGraph(unittest.TestCase):
+    def build(self, rng, n, weighted):
+        matrix = graph_adjacency_matrix.Graph(n, weighted=weighted)
+        adjacency = graph_adjacency_list.Graph(n)
+        seen = set()
+        for _ in range(3 * n):
+            u, v, w = rng.randrange(n), rng.randrange(n), rng.randint(0, 9) if weighted else 1
+            if (u, v) in seen:
+                continue
+            seen.add((u, v))
+            matrix.add_edge(u, v, w)
+        # the adjacency list scans neighbors in add_edge order, the matrix in index order
+        for u, v in sorted(seen):
+            adjacency.add_edge(u, v, int(matrix.get_edge_weight(u, v)))
+        return matrix, adjacency
+
+    def test_matches_adjacency_list(self):
+        rng = random.Random(12)
+        for weighted in (True, False):
+            for _ in range(10):
+                n = rng.randint(1, 25)
+                matrix, adjacency = self.build(rng, n, weighted)
+                self.assertEqual(matrix.dfs(0), adjacency.dfs(0))
+                self.assertEqual(matrix.bfs(0), adjacency.bfs(0))
+                self.assertEqual(matrix.bfs_shortest_path(0), adjacency.bfs_shortest_path(0))
+
+                matrix.dijkstra(0)
+                adjacency.dijkstra(0)
+                self.assertEqual([v.distance for v in matrix.vertices], [v.distance for v in adjacency.vertices])
+
+                order = matrix.kahn_topological_sort()
+                if adjacency.find_cycle() is None:
+                    position = {v: i for i, v in enumerate(order)}
+                    for vertex in adjacency.vertices:
+                        for edge in vertex.edges:
+                            self.assertLess(position[vertex.id], position[edge.v.id])
+                else:
+                    self.assertIsNone(order)
+
+    def test_labels_and_zero_weight(self):
+        graph = graph_adjacency_matrix.Graph(3, ids=['A', 'B', 'C'])
+        graph.add_edge('A', 'B', 0)
+        graph.add_edge('B', 'C', 2)
+        graph.add_edge('A', 'C', 5)
+        self.assertEqual(graph.bfs('A'), ['A', 'B', 'C'])
+        graph.dijkstra('A')
+        self.assertEqual(graph.backtracking('C'), ['A', 'B', 'C'])
+        self.assertEqual(graph.prim('A'), 2)
+        with self.assertRaises(ValueError):
+            graph.add_edge('A', 'Z')
+
+    def test_transitive_closure_both_modes(self):
+        # the unweighted graph has no adj_matrix, only the packed adj_bits
+        rng = random.Random(7)
+        for weighted in (True, False):
+            for _ in range(5):
+                n = rng.randint(1, 20)
+                matrix, adjacency = self.build(rng, n, weighted)
+                self.assertEqual(TransitiveClosure.from_graph(matrix).to_matrix(),
+                                 TransitiveClosure.from_graph(adjacency).to_matrix())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from graph_adjacency_list import Graph
+from graph_file import GraphFile
+
+class TestGraphFile(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph(5)
+        for u, v, w in [(0, 1, 1.5), (0, 2, 4), (1, 2, 2), (2, 3, 1), (4, 0, 7)]:
+            self.graph.add_edge(u, v, w)
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        GraphFile.save(self.path, self.graph)
+        expected = self.graph.freeze()
+        with GraphFile.open(self.path) as mapped:
+            self.assertIsNone(mapped.coordinates)
+            self.assertEqual(list(mapped.offsets), list(expected.offsets))
+            self.assertEqual(list(mapped.targets), list(expected.targets))
+            self.assertEqual(list(mapped.weights), list(expected.weights))
+
+            # queries run directly on the mapped arrays
+            self.graph.dijkstra(0)
+            mapped.csr.dijkstra(0)
+            for vertex in self.graph.vertices:
+                self.assertEqual(mapped.csr.distance[vertex.id], vertex.distance)
+
+            arrays = mapped.numpy()
+            self.assertEqual(arrays["weights"].dtype, np.float64)
+            self.assertFalse(arrays["targets"].flags.writeable)
+            self.assertEqual(arrays["targets"].tolist(), list(expected.targets))
+
+    def test_coordinates_and_bad_files(self):
+        self.graph.set_coordinates(1, 3.0, 4.0)
+        GraphFile.save(self.path, self.graph)
+        with GraphFile.open(self.path) as mapped:
+            coordinates = mapped.numpy()["coordinates"]
+            self.assertEqual(coordinates[1].tolist(), [3.0, 4.0])
+            self.assertTrue(np.isnan(coordinates[0]).all())
+
+        with open(self.path, "r+b") as file:
+            file.truncate(40)
+        with self.assertRaises(ValueError):
+            GraphFile.open(self.path)
+
+        with open(self.path, "wb") as file:
+            file.write(b"not a graph file at all, really not")
+        with self.assertRaises(ValueError):
+            GraphFile.open(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
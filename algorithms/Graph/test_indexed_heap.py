@@ -0,0 +1,82 @@
+import unittest
+import random
+from indexed_heap import IndexedMinHeap
+from monotone_queue import DialQueue, RadixHeap
+from graph_adjacency_list import Graph
+
+class TestIndexedMinHeap(unittest.TestCase):
+    def test_pop_order(self):
+        for arity in (2, 4, 8):
+            rng = random.Random(arity)
+            heap = IndexedMinHeap(100, arity)
+            keys = {i: rng.random() for i in range(100)}
+            for i, key in keys.items():
+                heap.push(i, key)
+            popped = [heap.pop()[1] for _ in range(100)]
+            self.assertEqual(popped, sorted(keys.values()))
+            self.assertTrue(heap.is_empty())
+
+    def test_decrease_key(self):
+        heap = IndexedMinHeap(5)
+        for i in range(5):
+            heap.push(i, 10 + i)
+        heap.decrease_key(4, 1)
+        self.assertFalse(heap.push_or_decrease(3, 20))
+        self.assertTrue(heap.push_or_decrease(3, 2))
+        self.assertEqual(len(heap), 5)
+        self.assertEqual([heap.pop()[0] for _ in range(5)], [4, 3, 0, 1, 2])
+        with self.assertRaises(ValueError):
+            heap.decrease_key(0, 1)
+
+    def test_heapify(self):
+        heap = IndexedMinHeap(8, 3)
+        heap.heapify([5, 1, 7, 2], [3.0, 9.0, 1.0, 4.0])
+        self.assertIn(1, heap)
+        self.assertNotIn(0, heap)
+        self.assertEqual([heap.pop() for _ in range(4)], [(7, 1.0), (5, 3.0), (2, 4.0), (1, 9.0)])
+
+class TestMonotoneQueues(unittest.TestCase):
+    def run_dijkstra_like(self, queue, max_weight):
+        # keys only ever grow from the last popped key, like in Dijkstra
+        rng = random.Random(max_weight)
+        queue.push(0, 0)
+        popped = []
+        next_id = 1
+        while not queue.is_empty():
+            id, key = queue.pop()
+            popped.append(key)
+            for _ in range(rng.randint(0, 3)):
+                if next_id < 200:
+                    queue.push(next_id, key + rng.randint(0, max_weight))
+                    next_id += 1
+            if next_id > 1 and rng.random() < 0.5:
+                candidate = rng.randrange(next_id)
+                if candidate in queue:
+                    queue.push_or_decrease(candidate, max(key, queue.key_of(candidate) - 1))
+        self.assertEqual(popped, sorted(popped))
+        self.assertEqual(len(popped), next_id)
+
+    def test_dial(self):
+        self.run_dijkstra_like(DialQueue(7), 7)
+        with self.assertRaises(ValueError):
+            DialQueue(3).push(0, 4)
+
+    def test_radix(self):
+        self.run_dijkstra_like(RadixHeap(), 10 ** 6)
+
+    def test_dijkstra_picks_queue_from_weights(self):
+        graph = Graph(3)
+        graph.add_edge(0, 1, 2)
+        graph.add_edge(1, 2, 3)
+        graph.dijkstra(0)
+        self.assertIsInstance(graph.heap, DialQueue)
+        graph.add_edge(0, 2, 10 ** 6)
+        graph.dijkstra(0)
+        self.assertIsInstance(graph.heap, RadixHeap)
+        graph.add_edge(2, 0, 0.5)
+        graph.dijkstra(0)
+        self.assertIsInstance(graph.heap, IndexedMinHeap)
+        self.assertEqual(graph.vertices[2].distance, 5)
+
+if __name__ == '__main__':
+    unittest.main()
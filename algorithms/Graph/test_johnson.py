@@ -0,0 +1,68 @@
+import unittest
+import random
+import types
+from Edge import Edge
+from Vertex import Vertex
+from bellman_ford import BellmanFord
+from graph_adjacency_list import Graph
+from johnson import johnson
+
+def reference_row(N, edge_list, source):
+    # one Bellman-Ford run per source on fresh Vertex / Edge objects
+    vertices = [Vertex(i) for i in range(N)]
+    edges = [Edge(vertices[u], vertices[v], w) for u, v, w in edge_list]
+    BellmanFord(vertices, edges, vertices[source])
+    return [v.distance for v in vertices]
+
+def random_potential_graph(rng, N, count):
+    # w(u,v) = c + p(v) - p(u) with c >= 0: plenty of negative edges, but every cycle sums to >= 0
+    p = [rng.randint(0, 10) for _ in range(N)]
+    edges = {}
+    for _ in range(count):
+        u, v = rng.randrange(N), rng.randrange(N)
+        if u != v:
+            edges[(u, v)] = rng.randint(0, 5) + p[v] - p[u]
+    return [(u, v, w) for (u, v), w in edges.items()]
+
+class TestJohnson(unittest.TestCase):
+    def build(self, N, edge_list):
+        graph = Graph(N)
+        for u, v, w in edge_list:
+            graph.add_edge(u, v, w)
+        return graph
+
+    def test_matches_bellman_ford(self):
+        rng = random.Random(4)
+        for _ in range(5):
+            N = rng.randint(2, 20)
+            edge_list = random_potential_graph(rng, N, 3 * N)
+            self.assertTrue(any(w < 0 for _, _, w in edge_list))
+            graph = self.build(N, edge_list)
+            expected = [reference_row(N, edge_list, s) for s in range(N)]
+            for workers in (1, 2):
+                rows = list(johnson(graph, workers=workers))
+                self.assertEqual([source for source, _ in rows], list(range(N)))
+                for source, row in rows:
+                    self.assertEqual(list(row), expected[source], (workers, source))
+
+    def test_streams_rows(self):
+        edge_list = [(0, 1, 4), (0, 2, 5), (2, 1, -3), (1, 3, 2), (3, 4, -1), (2, 4, 7)]
+        graph = self.build(5, edge_list)
+        stream = johnson(graph, sources=[3, 0], workers=1)
+        self.assertIsInstance(stream, types.GeneratorType)
+        # rows come one at a time, in the order of sources
+        source, row = next(stream)
+        self.assertEqual((source, list(row)), (3, reference_row(5, edge_list, 3)))
+        source, row = next(stream)
+        self.assertEqual((source, list(row)), (0, [0, 2, 5, 4, 3]))
+        with self.assertRaises(StopIteration):
+            next(stream)
+
+    def test_negative_cycle(self):
+        graph = self.build(4, [(0, 1, 1), (1, 2, 2), (2, 1, -4), (2, 3, 1)])
+        # johnson is a generator, the error shows up once it is iterated
+        with self.assertRaises(ValueError):
+            list(johnson(graph, workers=1))
+
+if __name__ == '__main__':
+    unittest.main()
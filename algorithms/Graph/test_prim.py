@@ -0,0 +1,55 @@
+import unittest
+import importlib
+import random
+from unittest import mock
+
+# the module name has an apostrophe, so it can't be a plain import statement
+prims = importlib.import_module("Prim's")
+
+class TestPrim(unittest.TestCase):
+    def random_graph(self, rng, N, count):
+        graph = prims.Graph(N)
+        for _ in range(count):
+            u, v, w = rng.randrange(N), rng.randrange(N), rng.randint(1, 20)
+            graph.add_edge(u, v, w)
+            graph.add_edge(v, u, w)
+        return graph
+
+    def test_modes_agree(self):
+        rng = random.Random(8)
+        for _ in range(20):
+            N = rng.randint(1, 30)
+            # from a handful of edges up to well past the dense switch point
+            graph = self.random_graph(rng, N, rng.randint(0, N * N))
+            heap = graph.prim(0, "heap")
+            # integer weights give an integer total
+            self.assertIsInstance(heap, int)
+            self.assertEqual(graph.prim(0, "dense"), heap)
+            self.assertEqual(graph.prim(0, "auto"), heap)
+            self.assertEqual(graph.prim(0), heap)
+
+    def test_dense_switch_point(self):
+        # 4 vertices, DENSE_DENSITY * V^2 = 4 edges
+        N = 4
+        threshold = int(prims.Graph.DENSE_DENSITY * N * N)
+        graph = prims.Graph(N)
+        for v in range(1, threshold):
+            graph.add_edge(0, v, v)
+
+        with mock.patch.object(graph, "dense_prim", wraps=graph.dense_prim) as dense:
+            self.assertEqual(graph.prim(0), 6)
+            dense.assert_not_called()
+
+            graph.add_edge(1, 2, 10)
+            self.assertEqual(graph.num_edges, threshold)
+            self.assertEqual(graph.prim(0), 6)
+            dense.assert_called_once_with(0)
+
+    def test_unknown_mode(self):
+        graph = prims.Graph(2)
+        graph.add_edge(0, 1, 1)
+        with self.assertRaises(ValueError):
+            graph.prim(0, "fibonacci")
+
+if __name__ == '__main__':
+    unittest.main()
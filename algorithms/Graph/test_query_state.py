@@ -0,0 +1,57 @@
+import unittest
+from graph_adjacency_list import Graph
+
+class TestQueryState(unittest.TestCase):
+    def setUp(self):
+        # two separate pieces: 0 → 1 → 2 and 3 → 4
+        self.graph = Graph(5)
+        self.graph.add_edge(0, 1, 2)
+        self.graph.add_edge(1, 2, 3)
+        self.graph.add_edge(3, 4, 1)
+
+    def test_vertex_view(self):
+        self.graph.dijkstra(0)
+        vertices = self.graph.vertices
+        self.assertEqual(vertices[2].distance, 5)
+        self.assertIs(vertices[2].predecessor, vertices[1])
+        self.assertIs(vertices[2].previous, vertices[1])
+        self.assertTrue(vertices[1].visited)
+        self.assertEqual(vertices[4].distance, float('inf'))
+        self.assertIsNone(vertices[4].predecessor)
+
+        # writing through the view lands in the side arrays
+        vertices[4].distance = 7
+        self.assertEqual(self.graph.state.get_distance(4), 7)
+
+    def test_queries_do_not_leak(self):
+        self.graph.dijkstra(0)
+        self.graph.dijkstra(3)
+        vertices = self.graph.vertices
+        self.assertEqual(vertices[2].distance, float('inf'))
+        self.assertFalse(vertices[0].visited)
+        self.assertEqual(vertices[4].distance, 1)
+        self.assertEqual(self.graph.backtracking(4), [3, 4])
+
+    def test_untouched_vertices_are_not_written(self):
+        self.graph.dijkstra(3)
+        stamp = self.graph.state.stamp
+        self.assertEqual([stamp[v] for v in (0, 1, 2)], [0, 0, 0])
+
+    def test_bfs(self):
+        self.assertEqual(self.graph.bfs(0), [0, 1, 2])
+        self.assertEqual(self.graph.bfs_shortest_path(3), [[3, 0], [4, 1]])
+
+    def test_integer_weights_read_back_as_ints(self):
+        self.graph.dijkstra(0)
+        distances = [vertex.distance for vertex in self.graph.vertices]
+        self.assertEqual([type(d) for d in distances[:3]], [int, int, int])
+        self.assertEqual(distances[3], float('inf'))
+
+        graph = Graph(2)
+        graph.add_edge(0, 1, 0.5)
+        graph.dijkstra(0)
+        self.assertEqual([vertex.distance for vertex in graph.vertices], [0.0, 0.5])
+        self.assertIsInstance(graph.vertices[0].distance, float)
+
+if __name__ == '__main__':
+    unittest.main()
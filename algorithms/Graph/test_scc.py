@@ -0,0 +1,52 @@
+import unittest
+import random
+from graph_adjacency_list import Graph
+
+class TestCondensation(unittest.TestCase):
+    def test_components_and_dag(self):
+        # {0, 1, 2} → {3, 4} → {5},  {6} self loop,  0 → 5 twice
+        graph = Graph(7)
+        for u, v, w in [(0, 1, 1), (1, 2, 1), (2, 0, 1), (2, 3, 4), (3, 4, 1), (4, 3, 1),
+                        (4, 5, 1), (0, 5, 7), (1, 5, 3), (6, 6, 1)]:
+            graph.add_edge(u, v, w)
+        condensation = graph.condensation()
+
+        self.assertEqual(condensation.count, 4)
+        members = [sorted(m) for m in condensation.members()]
+        self.assertIn([0, 1, 2], members)
+        first, middle, last = (condensation.component[v] for v in (0, 3, 5))
+        self.assertLess(first, middle)
+        self.assertLess(middle, last)
+        self.assertEqual(condensation.size[first], 3)
+        self.assertEqual(list(condensation.cyclic), [1 if c in (first, middle, condensation.component[6]) else 0
+                                                     for c in range(4)])
+
+        dag = condensation.dag
+        edges = {(c, dag.targets[i]): dag.weights[i] for c in range(dag.num_vertices)
+                 for i in range(dag.offsets[c], dag.offsets[c + 1])}
+        self.assertEqual(edges, {(first, middle): 4, (middle, last): 1, (first, last): 3})
+
+    def test_shares_tarjan_with_strongly_connected_components(self):
+        # condensation and strongly_connected_components run the same Tarjan (dfs_events),
+        # checked here against mutual reachability
+        rng = random.Random(2)
+        for _ in range(30):
+            n = rng.randint(1, 30)
+            graph = Graph(n)
+            for _ in range(rng.randint(0, 2 * n)):
+                graph.add_edge(rng.randrange(n), rng.randrange(n))
+            reachable = [set(graph.bfs(u)) for u in range(n)]
+            expected = sorted(set(tuple(v for v in range(n) if v in reachable[u] and u in reachable[v])
+                                  for u in range(n)))
+
+            components = graph.strongly_connected_components()
+            self.assertEqual(sorted(tuple(sorted(c)) for c in components), expected)
+            condensation = graph.condensation()
+            # components come out sink first, the condensation numbers them the other way round
+            self.assertEqual([sorted(m) for m in condensation.members()], [sorted(c) for c in reversed(components)])
+            for u in range(n):
+                for v in graph.neighbor_ids(u):
+                    self.assertLessEqual(condensation.component[u], condensation.component[v])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+import unittest
+from unittest import mock
+import os
+import random
+import tempfile
+from graph_adjacency_list import Graph
+from contraction_hierarchy import ContractionHierarchy
+import delta_stepping as delta_stepping_module
+from delta_stepping import delta_stepping
+
+class TestShortestPath(unittest.TestCase):
+    def setUp(self):
+        # a 10 x 10 grid, every edge goes both ways and has weight 1
+        self.size = 10
+        self.graph = Graph(self.size * self.size)
+        for row in range(self.size):
+            for col in range(self.size):
+                u = row * self.size + col
+                self.graph.set_coordinates(u, col, row)
+                if col + 1 < self.size:
+                    self.graph.add_edge(u, u + 1, 1)
+                    self.graph.add_edge(u + 1, u, 1)
+                if row + 1 < self.size:
+                    self.graph.add_edge(u, u + self.size, 1)
+                    self.graph.add_edge(u + self.size, u, 1)
+
+    def assert_valid_path(self, source, target, distance):
+        path = self.graph.backtracking(target)
+        self.assertEqual(path[0], source)
+        self.assertEqual(path[-1], target)
+        self.assertEqual(len(path) - 1, distance)
+
+    def test_methods_agree_with_dijkstra(self):
+        for source, target in [(0, 99), (45, 46), (12, 87), (7, 7)]:
+            self.graph.dijkstra(source)
+            expected = self.graph.vertices[target].distance
+            for method in ("dijkstra", "bidirectional", "astar"):
+                distance = self.graph.shortest_path(source, target, method)
+                self.assertEqual(distance, expected, method)
+                self.assert_valid_path(source, target, distance)
+
+    def test_local_query_settles_few_vertices(self):
+        self.graph.shortest_path(44, 45, "dijkstra")
+        self.assertLess(self.graph.settled_count, 10)
+        self.graph.shortest_path(0, 9, "astar")
+        self.assertEqual(self.graph.settled_count, 10)
+
+    def test_unreachable(self):
+        graph = Graph(3)
+        graph.add_edge(0, 1, 1)
+        for method in ("dijkstra", "bidirectional"):
+            self.assertEqual(graph.shortest_path(0, 2, method), float('inf'))
+
+    def test_random_graphs(self):
+        rng = random.Random(3)
+        for _ in range(50):
+            n = rng.randint(2, 20)
+            graph = Graph(n)
+            for _ in range(rng.randint(0, 3 * n)):
+                graph.add_edge(rng.randrange(n), rng.randrange(n), rng.randint(0, 9))
+            source, target = rng.randrange(n), rng.randrange(n)
+            graph.dijkstra(source)
+            expected = graph.vertices[target].distance
+            self.assertEqual(graph.shortest_path(source, target, "bidirectional"), expected)
+            self.assertEqual(graph.shortest_path(source, target, "astar", lambda u, t: 0), expected)
+
+    def test_delta_stepping(self):
+        rng = random.Random(5)
+        n = 60
+        graph = Graph(n)
+        for _ in range(300):
+            graph.add_edge(rng.randrange(n), rng.randrange(n), rng.randint(0, 9))
+        graph.dijkstra(0)
+        expected = [vertex.distance for vertex in graph.vertices]
+
+        # in this process, then with the buckets split over two workers
+        for workers, threshold in ((1, 4096), (2, 1)):
+            distance, _ = delta_stepping(graph.freeze(), 0, 3, workers, threshold)
+            self.assertEqual(list(distance), expected)
+
+        graph.delta_stepping(0, delta=2, workers=1)
+        self.assertEqual([vertex.distance for vertex in graph.vertices], expected)
+        # the default workers=None doesn't start a pool on a graph this small
+        with mock.patch.object(delta_stepping_module, "Pool", side_effect=AssertionError("pool started")):
+            graph.delta_stepping(0)
+        self.assertEqual([vertex.distance for vertex in graph.vertices], expected)
+        for target in range(n):
+            if expected[target] != float('inf'):
+                path = graph.backtracking(target)
+                length = sum(min(edge.w for edge in graph.vertices[u].edges if edge.v.id == v) for u, v in zip(path, path[1:]))
+                self.assertEqual((path[0], length), (0, expected[target]))
+
+    def test_dijkstra_many(self):
+        sources, targets = [0, 45, 99], [99, 0, 12]
+        matrix = self.graph.dijkstra_many(sources, targets, workers=2)
+        self.assertEqual(matrix.shape, (3, 3))
+        for i, source in enumerate(sources):
+            self.graph.dijkstra(source)
+            self.assertEqual(list(matrix[i]), [self.graph.vertices[t].distance for t in targets])
+
+        rows = dict(self.graph.dijkstra_many(sources, workers=1, as_matrix=False))
+        self.assertEqual(rows[45][46], 1)
+        self.assertEqual(len(rows[0]), self.size * self.size)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            self.graph.shortest_path(0, 1, "bogus")
+
+    def test_astar_missing_coordinates(self):
+        graph = Graph(3)
+        graph.add_edge(0, 1, 1)
+        graph.add_edge(1, 2, 1)
+        with self.assertRaises(ValueError):
+            graph.shortest_path(0, 2, "astar")
+        graph.set_coordinates(0, 0, 0)
+        graph.set_coordinates(2, 2, 0)
+        with self.assertRaises(ValueError):
+            graph.shortest_path(0, 2, "astar")
+        graph.set_coordinates(1, 1, 0)
+        self.assertEqual(graph.shortest_path(0, 2, "astar"), 2)
+
+class TestContractionHierarchy(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.n = 40
+        self.graph = Graph(self.n)
+        for _ in range(150):
+            self.graph.add_edge(rng.randrange(self.n), rng.randrange(self.n), rng.randint(0, 20))
+        self.hierarchy = ContractionHierarchy.build(self.graph)
+
+    def assert_matches_dijkstra(self, hierarchy):
+        for source in range(0, self.n, 3):
+            self.graph.dijkstra(source)
+            for target in range(self.n):
+                expected = self.graph.vertices[target].distance
+                self.assertEqual(hierarchy.query(source, target), expected)
+                if expected == float('inf'):
+                    continue
+
+                # shortcuts are unpacked back into original edges
+                path = hierarchy.backtracking(target)
+                self.assertEqual(path[0], source)
+                self.assertEqual(path[-1], target)
+                length = 0
+                for u, v in zip(path, path[1:]):
+                    length += min(edge.w for edge in self.graph.vertices[u].edges if edge.v.id == v)
+                self.assertEqual(length, expected)
+
+    def test_query(self):
+        self.assert_matches_dijkstra(self.hierarchy)
+
+    def test_save_and_load(self):
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            self.hierarchy.save(path)
+            loaded = ContractionHierarchy.load(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(list(loaded.rank), list(self.hierarchy.rank))
+        self.assert_matches_dijkstra(loaded)
+
+if __name__ == '__main__':
+    unittest.main()
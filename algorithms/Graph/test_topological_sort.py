@@ -1,4 +1,5 @@
 import unittest
+import random
 from graph_adjacency_list import *
 
 class TestKahnTopologicalSort(unittest.TestCase):
@@ -51,5 +52,40 @@ class TestKahnTopologicalSort(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.graph.kahn_topological_sort_dfs()
 
+class TestIncrementalTopologicalOrder(unittest.TestCase):
+    def assert_valid(self, graph, order):
+        position = {v: i for i, v in enumerate(order.order())}
+        self.assertEqual(sorted(position), list(range(len(graph.vertices))))
+        for vertex in graph.vertices:
+            for edge in vertex.edges:
+                self.assertLess(position[vertex.id], position[edge.v.id])
+
+    def test_random_inserts(self):
+        rng = random.Random(4)
+        n = 30
+        graph = Graph(n)
+        order = graph.incremental_topological_order()
+        rejected = 0
+        for _ in range(200):
+            u, v = rng.randrange(n), rng.randrange(n)
+            edges_before = sum(len(vertex.edges) for vertex in graph.vertices)
+            try:
+                order.add_edge(u, v)
+            except ValueError:
+                rejected += 1
+                # the graph is left unchanged
+                self.assertEqual(sum(len(vertex.edges) for vertex in graph.vertices), edges_before)
+            self.assert_valid(graph, order)
+        self.assertGreater(rejected, 0)
+
+    def test_cycle_rejected(self):
+        graph = Graph(3)
+        graph.add_edge(0, 1)
+        order = graph.incremental_topological_order()
+        order.add_edge(2, 0)
+        self.assertEqual(order.order(), [2, 0, 1])
+        with self.assertRaises(ValueError):
+            order.add_edge(1, 2)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
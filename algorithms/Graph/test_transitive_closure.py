@@ -0,0 +1,143 @@
+import os
+import random
+import tempfile
+import unittest
+import graph_adjacency_list
+import graph_adjacency_matrix
+from transitive_closure import TransitiveClosure
+from warshalls import warshalls
+
+class BooleanMatrixGraph:
+    # the graph warshalls() expects: vertices and a list-of-lists boolean adjacency_matrix
+    def __init__(self, N):
+        self.vertices = list(range(N))
+        self.adjacency_matrix = [[False] * N for _ in range(N)]
+
+def reference_closure(N, edges):
+    # reachable[u][v]: a path of at least one edge from u to v, by a DFS from each vertex
+    adjacency = [[] for _ in range(N)]
+    for u, v in edges:
+        adjacency[u].append(v)
+    reachable = []
+    for u in range(N):
+        row = [False] * N
+        stack = list(adjacency[u])
+        while stack:
+            v = stack.pop()
+            if not row[v]:
+                row[v] = True
+                stack.extend(adjacency[v])
+        reachable.append(row)
+    return reachable
+
+def random_edges(rng, N, count):
+    return sorted({(rng.randrange(N), rng.randrange(N)) for _ in range(count)})
+
+class TestTransitiveClosure(unittest.TestCase):
+    def build_list_graph(self, N, edges):
+        graph = graph_adjacency_list.Graph(N)
+        for u, v in edges:
+            graph.add_edge(u, v)
+        return graph
+
+    def build_graphs(self, N, edges):
+        # every graph type from_graph accepts, all with the same edges
+        boolean = BooleanMatrixGraph(N)
+        weighted = graph_adjacency_matrix.Graph(N)
+        unweighted = graph_adjacency_matrix.Graph(N, weighted=False)
+        for u, v in edges:
+            boolean.adjacency_matrix[u][v] = True
+            weighted.add_edge(u, v, 0)
+            unweighted.add_edge(u, v)
+        adjacency = self.build_list_graph(N, edges)
+        return {"boolean": boolean, "weighted matrix": weighted, "unweighted matrix": unweighted,
+                "list": adjacency, "csr": adjacency.freeze()}
+
+    def test_graph_types_and_storages(self):
+        rng = random.Random(3)
+        for _ in range(15):
+            # past 64 vertices a numpy row spans more than one word
+            N = rng.randint(1, 90)
+            edges = random_edges(rng, N, rng.randint(0, 2 * N))
+            expected = reference_closure(N, edges)
+            for name, graph in self.build_graphs(N, edges).items():
+                for storage in ("int", "numpy"):
+                    closure = TransitiveClosure.from_graph(graph, storage=storage)
+                    self.assertEqual(closure.to_matrix(), expected, (name, storage))
+
+    def test_reaches_and_reachable_set(self):
+        # 0 -> 1 -> 2 -> 1, 3 -> 0, 4 alone, 70 vertices so the numpy rows are two words
+        N = 70
+        graph = self.build_list_graph(N, [(0, 1), (1, 2), (2, 1), (3, 0), (68, 69)])
+        for storage in ("int", "numpy"):
+            closure = TransitiveClosure.from_graph(graph, storage=storage)
+            self.assertEqual(closure.reachable_set(0), [1, 2])
+            self.assertEqual(closure.reachable_set(1), [1, 2])
+            self.assertEqual(closure.reachable_set(3), [0, 1, 2])
+            self.assertEqual(closure.reachable_set(4), [])
+            self.assertEqual(closure.reachable_set(68), [69])
+            self.assertTrue(closure.reaches(3, 2))
+            self.assertTrue(closure.reaches(68, 69))
+            self.assertFalse(closure.reaches(0, 0))
+            self.assertFalse(closure.reaches(2, 0))
+            self.assertFalse(closure.reaches(69, 68))
+
+    def test_unknown_storage(self):
+        with self.assertRaises(ValueError):
+            TransitiveClosure.from_graph(self.build_list_graph(2, [(0, 1)]), storage="bits")
+
+    def test_memmap_round_trip(self):
+        rng = random.Random(5)
+        N = 100
+        edges = random_edges(rng, N, 150)
+        expected = reference_closure(N, edges)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "closure.npy")
+            built = TransitiveClosure.from_graph(self.build_list_graph(N, edges), storage="numpy", path=path)
+            self.assertEqual(built.to_matrix(), expected)
+            del built
+
+            closure = TransitiveClosure.open_memmap(path)
+            self.assertEqual(closure.num_vertices, N)
+            self.assertEqual(closure.storage, "numpy")
+            self.assertEqual(closure.to_matrix(), expected)
+            del closure
+
+    def test_chunked_rows(self):
+        # a chunk smaller than the matrix takes the same result
+        rng = random.Random(9)
+        N = 40
+        edges = random_edges(rng, N, 60)
+        graph = self.build_list_graph(N, edges)
+        closure = TransitiveClosure.from_graph(graph, storage="numpy")
+        chunked = TransitiveClosure(N, closure.rows.copy(), "numpy")
+        chunked.close_under_paths(chunk_rows=7)
+        self.assertEqual(chunked.to_matrix(), reference_closure(N, edges))
+
+class TestWarshalls(unittest.TestCase):
+    def test_in_place(self):
+        rng = random.Random(11)
+        for _ in range(10):
+            N = rng.randint(1, 30)
+            edges = random_edges(rng, N, rng.randint(0, 2 * N))
+            graph = BooleanMatrixGraph(N)
+            for u, v in edges:
+                graph.adjacency_matrix[u][v] = True
+
+            closure = warshalls(graph)
+            expected = reference_closure(N, edges)
+            self.assertEqual(graph.adjacency_matrix, expected)
+            self.assertEqual(closure.to_matrix(), expected)
+
+    def test_diagonal_only_on_cycles(self):
+        # 0 -> 1 -> 2 -> 0 is a cycle, 3 -> 4 is not, 5 has a self loop
+        graph = BooleanMatrixGraph(6)
+        for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (5, 5)]:
+            graph.adjacency_matrix[u][v] = True
+        warshalls(graph)
+        self.assertEqual([graph.adjacency_matrix[i][i] for i in range(6)], [True, True, True, False, False, True])
+        self.assertTrue(graph.adjacency_matrix[0][4])
+        self.assertFalse(graph.adjacency_matrix[4][0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+import random
+import numpy as np
+from union_find import UnionFind
+
+class TestUnionFind(unittest.TestCase):
+    def test_union_and_count(self):
+        sets = UnionFind(6)
+        self.assertTrue(sets.union(0, 1))
+        self.assertTrue(sets.union(2, 3))
+        self.assertTrue(sets.union(1, 3))
+        self.assertFalse(sets.union(0, 2))
+        self.assertEqual(sets.count, 3)
+        self.assertTrue(sets.connected(0, 3))
+        self.assertFalse(sets.connected(0, 4))
+        self.assertEqual(sets.set_size(2), 4)
+
+    def test_long_chain(self):
+        # union by size never builds a chain, so build one by hand: find must not recurse
+        n = 100000
+        sets = UnionFind(n)
+        for x in range(1, n):
+            sets.parent[x] = x - 1
+        self.assertEqual(sets.find(n - 1), 0)
+        self.assertEqual(list(sets.find_many([n - 1, 5, 0])), [0, 0, 0])
+
+    def test_batch_matches_single(self):
+        rng = random.Random(8)
+        n = 200
+        pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(150)]
+        single, batch = UnionFind(n), UnionFind(n)
+        merged = sum(single.union(a, b) for a, b in pairs)
+        self.assertEqual(batch.union_many(np.array(pairs)), merged)
+        self.assertEqual(batch.count, single.count)
+
+        ids = np.arange(n)
+        roots = batch.find_many(ids)
+        for x in range(n):
+            self.assertEqual(roots[x], batch.find(x))
+            self.assertEqual(single.connected(x, 0), roots[x] == roots[0])
+        self.assertEqual(len(np.unique(batch.labels())), batch.count)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import numpy as np
+
+
+class TransitiveClosure:
+    """
+    Transitive closure (who can reach whom) with every row of the reachability matrix packed into bits.
+
+    Row i is a bitset of the vertices reachable from i. Warshall's step for a middle vertex k then
+    becomes one OR per row instead of V boolean cells:
+        for every i that reaches k:  row[i] |= row[k]
+    which handles 64 cells per machine word.
+
+    Two storages:
+        - "int":   each row is a Python int (arbitrary length bitset), simple and fast for small/medium V
+        - "numpy": a V x ceil(V/64) uint64 array; may be a numpy.memmap backed by a file (see from_graph(path=...) and
+                   open_memmap) for closures that don't fit in RAM, it is then processed in row chunks
+
+    A vertex reaches itself only if it is on a cycle (or has a self loop), like warshalls().
+    """
+    def __init__(self, num_vertices: int, rows, storage: str) -> None:
+        self.num_vertices = num_vertices
+        self.rows = rows
+        self.storage = storage
+
+    @classmethod
+    def from_graph(cls, graph, storage: str = "int", path: str = None) -> "TransitiveClosure":
+        """
+        Build the closure of graph, which may be:
+            - a graph with a boolean adjacency_matrix (what warshalls() expects)
+            - a graph_adjacency_matrix.Graph, weighted or unweighted
+            - a graph_adjacency_list.Graph or CSRGraph
+        With storage="numpy" and a path, the bits are kept in a memory-mapped file at path.
+
+        Time complexity:
+            - O(V^3 / 64) word operations (plus O(V^2) or O(V+E) to read the graph)
+        """
+        num_vertices, edges = _edges_of(graph)
+
+        if storage == "int":
+            rows = [0] * num_vertices
+            for u, v in edges:
+                rows[u] |= 1 << v
+        elif storage == "numpy":
+            words = _words(num_vertices)
+            if path is None:
+                rows = np.zeros((num_vertices, words), dtype=np.uint64)
+            else:
+                rows = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint64, shape=(num_vertices, words))
+            for u, v in edges:
+                rows[u, v >> 6] |= np.uint64(1 << (v & 63))
+        else:
+            raise ValueError(f"Unknown storage: {storage}")
+
+        closure = cls(num_vertices, rows, storage)
+        closure.close_under_paths()
+        return closure
+
+    @classmethod
+    def open_memmap(cls, path: str, mode: str = "r") -> "TransitiveClosure":
+        """
+        Reopen a closure previously built with storage="numpy" and a path, without reading it into memory.
+        """
+        rows = np.load(path, mmap_mode=mode)
+        return cls(rows.shape[0], rows, "numpy")
+
+    def close_under_paths(self, chunk_rows: int = 4096) -> None:
+        """
+        Warshall's algorithm over the packed rows. chunk_rows bounds how many rows of a memory-mapped
+        matrix are touched per step.
+        """
+        if self.storage == "int":
+            rows = self.rows
+            for k in range(self.num_vertices):
+                bit = 1 << k
+                row_k = rows[k]
+                for i in range(self.num_vertices):
+                    if rows[i] & bit:
+                        rows[i] |= row_k
+            return
+
+        rows = self.rows
+        for k in range(self.num_vertices):
+            word, bit = k >> 6, np.uint64(1 << (k & 63))
+            # copy row k, it is updated itself when k is on a cycle
+            row_k = np.array(rows[k])
+            for start in range(0, self.num_vertices, chunk_rows):
+                chunk = rows[start:start + chunk_rows]
+                reaches_k = (chunk[:, word] & bit) != 0
+                if reaches_k.any():
+                    chunk[reaches_k] |= row_k
+
+        if isinstance(rows, np.memmap):
+            rows.flush()
+
+    def reaches(self, u: int, v: int) -> bool:
+        # is there a path (of at least one edge) from u to v
+        if self.storage == "int":
+            return bool(self.rows[u] >> v & 1)
+        return bool(self.rows[u, v >> 6] >> np.uint64(v & 63) & np.uint64(1))
+
+    def reachable_set(self, u: int) -> list:
+        # all vertices reachable from u, in increasing id order
+        if self.storage == "int":
+            row = self.rows[u]
+            result = []
+            while row:
+                lowest = row & -row
+                result.append(lowest.bit_length() - 1)
+                row ^= lowest
+            return result
+
+        bits = np.unpackbits(np.asarray(self.rows[u]).view(np.uint8), bitorder="little")
+        return np.flatnonzero(bits[:self.num_vertices]).tolist()
+
+    def to_matrix(self) -> list:
+        # plain V x V list of booleans
+        matrix = []
+        for u in range(self.num_vertices):
+            row = [False] * self.num_vertices
+            for v in self.reachable_set(u):
+                row[v] = True
+            matrix.append(row)
+        return matrix
+
+
+def _words(num_vertices: int) -> int:
+    return max(1, (num_vertices + 63) // 64)
+
+
+def _edges_of(graph) -> tuple:
+    # (number of vertices, iterable of (u, v) edges) for the graph types in this folder
+    if hasattr(graph, "adjacency_matrix"):
+        matrix = graph.adjacency_matrix
+        n = len(matrix)
+        return n, ((u, v) for u in range(n) for v in range(n) if matrix[u][v])
+
+    if hasattr(graph, "weight_matrix"):
+        # graph_adjacency_matrix.Graph, weighted (adj_matrix) or packed (adj_bits)
+        matrix = np.asarray(graph.weight_matrix(), dtype=np.float64)
+        n = matrix.shape[0]
+        us, vs = np.nonzero(matrix != np.inf)
+        return n, zip(us.tolist(), vs.tolist())
+
+    if hasattr(graph, "offsets"):
+        n = graph.num_vertices
+        return n, ((u, graph.targets[i]) for u in range(n) for i in range(graph.offsets[u], graph.offsets[u + 1]))
+
+    return len(graph.vertices), ((vertex.id, edge.v.id) for vertex in graph.vertices for edge in vertex.edges)
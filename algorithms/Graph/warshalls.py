@@ -1,12 +1,20 @@
+from transitive_closure import TransitiveClosure
+
+
 def warshalls(graph):
     """
+    Fills graph.adjacency_matrix with its transitive closure, in place.
+
+    Rows are packed into bitsets (see TransitiveClosure), so each step ORs a whole row
+    instead of going thru it one cell at a time.
+
     Time complexity: 
-        - O(V^3) where V is the number of vertices in the graph
+        - O(V^3 / 64) word operations, where V is the number of vertices in the graph
     """
-    n = len(graph.vertices)
+    closure = TransitiveClosure.from_graph(graph)
 
-    for k in range(n):
-        for i in range(n):
-            for j in range(n):
-                if graph.adjacency_matrix[i][k] and graph.adjacency_matrix[k][j] or graph.adjacency_matrix[i][j]:
-                    graph.adjacency_matrix[i][j] = True
+    for i, row in enumerate(closure.to_matrix()):
+        for j, reachable in enumerate(row):
+            if reachable:
+                graph.adjacency_matrix[i][j] = True
+    return closure